@@ -0,0 +1,240 @@
+"""
+Monte Carlo tree search opponent.
+
+Mcts_player runs information-set MCTS for the seat to move. The hands of the
+other players and the draw pile are hidden, so every iteration first
+determinizes: the unseen cards are shuffled and dealt back with the same hand
+sizes. The iteration then walks the shared tree, plays a random rollout on the
+determinized copy and rolls the copy back with Game.rollback, so one clone
+serves a whole search.
+
+A move is a playable card, or DRAW when the player has none (then the player
+draws and the turn passes, as in the headless engine).
+
+With a Transposition_table, every leaf is looked up by its Zobrist hash first.
+An entry holds the number of rollouts from that position as its depth and
+their summed rewards; a position that was already rolled out reuses the
+average instead of being evaluated again.
+
+example use
+    bot = Mcts_player(time_budget=0.2)
+    card_name = bot.choose(game)                       # for the seat to move
+    play_game([bot, random_policy, random_policy])     # as an engine policy
+"""
+import math
+import random
+import time
+from collections import Counter
+
+from .Card import NUM_CARDS
+
+
+DRAW = "draw"
+
+# Rollouts longer than this many turns are scored by hand size
+ROLLOUT_TURNS = 200
+
+
+class _Node:
+    __slots__ = ("seat", "parent", "children", "visits", "wins", "available")
+
+    def __init__(self, seat, parent=None):
+        self.seat = seat          # seat that made the move leading here
+        self.parent = parent
+        self.children = {}        # move -> _Node
+        self.visits = 0
+        self.wins = 0.0
+        self.available = 0        # iterations in which this move was legal
+
+
+class Mcts_player:
+    """
+    Picks moves by MCTS within an iteration and/or time budget per move.
+
+    Parameters
+    ----------
+    iterations : int, optional
+        Maximum number of iterations per move.
+    time_budget : float, optional
+        Maximum seconds per move; the default when neither budget is given.
+    exploration : float
+        UCB exploration constant.
+    rng : random.Random, optional
+        Source of randomness for determinization and rollouts.
+    transpositions : Transposition_table, optional
+        Cache of leaf evaluations keyed by Zobrist hash, as (rollouts, summed
+        rewards); may be shared between moves and bots.
+    """
+
+    def __init__(self, iterations=None, time_budget=None, exploration=0.7, rng=None,
+                 transpositions=None):
+        if iterations is None and time_budget is None:
+            time_budget = 0.2
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.rng = rng if rng is not None else random.Random()
+        self.transpositions = transpositions
+        self.keys = None
+        self.last_iterations = 0
+
+    def __call__(self, game, player, playable, rng):
+        """Engine policy interface: choose among the playable cards."""
+        if len(playable) == 1:
+            return playable[0]
+        return self.choose(game)
+
+    def choose(self, game):
+        """Return the best card to play for the seat to move, or DRAW."""
+        seat = game.current_idx
+        moves = self._moves(game, game.players[seat])
+        if len(moves) == 1:
+            return moves[0]
+
+        # the clone and the set-up count against the time budget
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        root = _Node(seat=None)
+        sim = game.clone(rng=self.rng)
+        if self.transpositions is not None:
+            if self.keys is not None and not self._keys_cover(sim):
+                self.keys = None  # sized for a smaller deck or fewer players
+            self.keys = sim.enable_hashing(self.keys).keys
+        base = sim.checkpoint()
+        unseen, sizes = self._unseen_cards(sim, seat)
+
+        done = 0
+        while self.iterations is None or done < self.iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._determinize(sim, seat, unseen, sizes)
+            self._iterate(sim, root)
+            sim.rollback(base)
+            done += 1
+        self.last_iterations = done
+
+        if not root.children:
+            # no iteration finished within the budget
+            return moves[int(self.rng.random() * len(moves))]
+        best = max(root.children.items(), key=lambda item: item[1].visits)
+        return best[0]
+
+    def _keys_cover(self, sim):
+        copies = max(Counter(sim.deck).values(), default=1)
+        return self.keys.covers(NUM_CARDS, len(sim.players), copies, len(sim.deck))
+
+    def _iterate(self, sim, root):
+        node = root
+        winner = None
+        # selection and expansion
+        while winner is None:
+            seat = sim.current_idx
+            moves = self._moves(sim, sim.players[seat])
+            untried = [move for move in moves if move not in node.children]
+            for move in moves:
+                child = node.children.get(move)
+                if child is not None:
+                    child.available += 1
+            if untried:
+                move = untried[int(self.rng.random() * len(untried))]
+                child = node.children[move] = _Node(seat, node)
+                child.available = 1
+                winner = self._apply(sim, move)
+                node = child
+                break
+            move = self._select(node, moves)
+            winner = self._apply(sim, move)
+            node = node.children[move]
+
+        key = None
+        if self.transpositions is not None and winner is None:
+            key = sim.hasher.value
+            entry = self.transpositions.get(key)
+            if entry is not None:
+                count, totals = entry
+                self._backpropagate(root, node, tuple(total / count for total in totals))
+                return
+
+        # rollout
+        turns = 0
+        while winner is None and turns < ROLLOUT_TURNS:
+            player = sim.players[sim.current_idx]
+            playable = sim.playable_cards(player)
+            move = playable[int(self.rng.random() * len(playable))] if playable else DRAW
+            winner = self._apply(sim, move)
+            turns += 1
+
+        rewards = self._rewards(sim, winner)
+        if key is not None:
+            self.transpositions.add(key, 1, rewards)
+        self._backpropagate(root, node, rewards)
+
+    @staticmethod
+    def _backpropagate(root, node, rewards):
+        while node is not root:
+            node.visits += 1
+            node.wins += rewards[node.seat]
+            node = node.parent
+
+    def _select(self, node, moves):
+        best_move, best_score = None, -1.0
+        for move in moves:
+            child = node.children[move]
+            score = (child.wins / child.visits
+                     + self.exploration * math.sqrt(math.log(child.available) / child.visits))
+            if score > best_score:
+                best_move, best_score = move, score
+        return best_move
+
+    @staticmethod
+    def _moves(game, player):
+        playable = game.playable_cards(player)
+        return list(dict.fromkeys(playable)) if playable else [DRAW]
+
+    @staticmethod
+    def _apply(sim, move):
+        """Play move for the seat to move; return the winning seat or None."""
+        seat = sim.current_idx
+        player = sim.players[seat]
+        if move == DRAW:
+            sim.draw_card(player)
+        else:
+            sim.play_card(move, player)
+            if not player.hand:
+                return seat
+        sim.advance_turn()
+        return None
+
+    @staticmethod
+    def _rewards(sim, winner):
+        if winner is not None:
+            return tuple(1.0 if seat == winner else 0.0 for seat in range(len(sim.players)))
+        sizes = [len(player.hand) for player in sim.players]
+        best = min(sizes)
+        leaders = sizes.count(best)
+        return tuple(1.0 / leaders if size == best else 0.0 for size in sizes)
+
+    @staticmethod
+    def _unseen_cards(sim, seat):
+        """Cards the seat cannot see (other hands and draw pile) and where they sit."""
+        unseen = []
+        sizes = []
+        for other, player in enumerate(sim.players):
+            sizes.append(len(player.hand) if other != seat else 0)
+            if other != seat:
+                unseen.extend(player.hand)
+        sizes.append(len(sim.shuffled_deck))
+        unseen.extend(sim.shuffled_deck)
+        return unseen, sizes
+
+    def _determinize(self, sim, seat, unseen, sizes):
+        """Deal the unseen cards at random to the other hands and the draw pile."""
+        self.rng.shuffle(unseen)
+        start = 0
+        for other, player in enumerate(sim.players):
+            if other != seat:
+                player.set_hand(unseen[start:start + sizes[other]])
+                start += sizes[other]
+        sim.shuffled_deck.clear()
+        sim.shuffled_deck.extend(unseen[start:])
+        if sim.hasher is not None:
+            sim.enable_hashing(sim.hasher.keys)
@@ -0,0 +1,174 @@
+"""
+Multi-core batch simulator.
+
+Splits N seeded games into chunks and plays them in a process pool with the
+headless engine. Workers do not send Game objects back: each game becomes one
+fixed-width row of ints (SUMMARY_FIELDS) packed into an array, and the parent
+merges the rows into Batch_stats.
+
+example use
+    stats = run_batch([random_policy] * 3, n=1000000, workers=8)
+    print(stats.win_rates(), stats.mean_turns())
+
+Policies must be module-level functions so they can be pickled to the workers.
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .Card import SUITS
+from .Engine import SPECIAL_KINDS, play_game, random_policy
+
+
+# Layout of one per-game summary row
+SUMMARY_FIELDS = (["seed", "winner", "turns", "draws"]
+                  + [f"plays_{suit}" for suit in SUITS]
+                  + [f"plays_{kind}" for kind in SPECIAL_KINDS])
+ROW_WIDTH = len(SUMMARY_FIELDS)
+
+_SUITS_AT = SUMMARY_FIELDS.index(f"plays_{SUITS[0]}")
+_SPECIALS_AT = SUMMARY_FIELDS.index(f"plays_{SPECIAL_KINDS[0]}")
+
+
+def summarize(result):
+    """Return the summary row of a Game_result as a list of ints."""
+    return ([result.seed, result.winner, result.turns, result.draws]
+            + list(result.suit_plays) + list(result.special_plays))
+
+
+def run_chunk(policies, seed, n, game_kwargs):
+    """Worker: play n games from seed and return their rows packed in an array('q')."""
+    rows = array("q")
+    for game_seed in range(seed, seed + n):
+        rows.extend(summarize(play_game(policies, seed=game_seed, **game_kwargs)))
+    return rows
+
+
+class Batch_stats:
+    """Aggregated results of many games; stats from several batches can be merged."""
+
+    def __init__(self, num_players):
+        self.num_players = num_players
+        self.games = 0
+        self.wins = [0] * num_players
+        self.unfinished = 0
+        self.total_turns = 0
+        self.min_turns = None
+        self.max_turns = 0
+        self.total_draws = 0
+        self.suit_plays = [0] * len(SUITS)
+        self.special_plays = [0] * len(SPECIAL_KINDS)
+
+    def add_rows(self, rows):
+        """Add packed summary rows as returned by run_chunk."""
+        for start in range(0, len(rows), ROW_WIDTH):
+            winner, turns, draws = rows[start + 1], rows[start + 2], rows[start + 3]
+            self.games += 1
+            if winner >= 0:
+                self.wins[winner] += 1
+            else:
+                self.unfinished += 1
+            self.total_turns += turns
+            self.total_draws += draws
+            if self.min_turns is None or turns < self.min_turns:
+                self.min_turns = turns
+            if turns > self.max_turns:
+                self.max_turns = turns
+            for i in range(len(SUITS)):
+                self.suit_plays[i] += rows[start + _SUITS_AT + i]
+            for i in range(len(SPECIAL_KINDS)):
+                self.special_plays[i] += rows[start + _SPECIALS_AT + i]
+
+    def merge(self, other):
+        """Add the counts of another Batch_stats into this one."""
+        if other.num_players != self.num_players:
+            raise ValueError("cannot merge stats of games with different player counts")
+        self.games += other.games
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.unfinished += other.unfinished
+        self.total_turns += other.total_turns
+        self.total_draws += other.total_draws
+        if other.min_turns is not None:
+            self.min_turns = other.min_turns if self.min_turns is None else min(self.min_turns, other.min_turns)
+        self.max_turns = max(self.max_turns, other.max_turns)
+        self.suit_plays = [a + b for a, b in zip(self.suit_plays, other.suit_plays)]
+        self.special_plays = [a + b for a, b in zip(self.special_plays, other.special_plays)]
+        return self
+
+    def win_rates(self):
+        """Fraction of all games won by each seat."""
+        return [wins / self.games if self.games else 0.0 for wins in self.wins]
+
+    def mean_turns(self):
+        return self.total_turns / self.games if self.games else 0.0
+
+    def special_usage(self):
+        """Special-card plays per game, keyed by special kind."""
+        return {kind: count / self.games if self.games else 0.0
+                for kind, count in zip(SPECIAL_KINDS, self.special_plays)}
+
+    def as_dict(self):
+        return {"games": self.games, "wins": self.wins, "win_rates": self.win_rates(),
+                "unfinished": self.unfinished, "mean_turns": self.mean_turns(),
+                "min_turns": self.min_turns, "max_turns": self.max_turns,
+                "total_draws": self.total_draws,
+                "suit_plays": dict(zip(SUITS, self.suit_plays)),
+                "special_plays": dict(zip(SPECIAL_KINDS, self.special_plays))}
+
+
+def run_batch(policies, n, seed=0, workers=None, chunk_size=5000, on_rows=None, **game_kwargs):
+    """
+    Play n games seeded seed .. seed + n - 1 across a process pool.
+
+    workers defaults to os.cpu_count(); workers=1 runs in this process.
+    game_kwargs go to play_game (cards_per_player, max_turns, deck).
+    on_rows, if given, is called with every packed chunk of summary rows,
+    e.g. to write them to disk. Returns the merged Batch_stats.
+    """
+    stats = Batch_stats(len(policies))
+    chunks = [(start, min(chunk_size, seed + n - start))
+              for start in range(seed, seed + n, chunk_size)]
+
+    def collect(rows):
+        stats.add_rows(rows)
+        if on_rows is not None:
+            on_rows(rows)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for start, size in chunks:
+            collect(run_chunk(policies, start, size, game_kwargs))
+        return stats
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_chunk, policies, start, size, game_kwargs)
+                   for start, size in chunks]
+        for future in futures:
+            collect(future.result())
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import time
+
+    from .Results import Results_writer
+
+    parser = argparse.ArgumentParser(description="Simulate many games in parallel.")
+    parser.add_argument("-n", "--games", type=int, default=100000)
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-p", "--players", type=int, default=3)
+    parser.add_argument("-o", "--out", help="append per-game records to this results file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    out = Results_writer(args.out) if args.out else None
+    stats = run_batch([random_policy] * args.players, args.games, seed=args.seed, workers=args.workers,
+                      on_rows=out.add_rows if out else None)
+    if out is not None:
+        out.close()
+    elapsed = time.perf_counter() - start
+    print(json.dumps(stats.as_dict(), indent=1))
+    print(f"{stats.games} games in {elapsed:.2f}s ({stats.games / elapsed:.0f} games/s)")
@@ -1,9 +1,3 @@
-import sys, os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from GUI import(GUI, ImageLoader, Display_full_deck, Display_first_card,
-                Build_buttons, Display_player_decks, Display_player_cards)
-
-
 # Special names
 CRYOSTAT = "cr"
 ENTANGLEMENT = "en"
@@ -32,18 +26,53 @@ RANK_VALUE = {
 }
 
 class Card:
+    """
+    A card as a small integer id into CARD_NAMES.
+
+    Card(kind, ...) builds a card from its parts; Card.from_name and
+    Card.from_id convert from the string names used by Game and Player.
+    """
+    __slots__ = ("kind", "rank", "suit", "special", "private_known_for", "id")
+
     def __init__(self, kind, rank=None, suit=None, special=None, private_known_for=None):
         self.kind = kind  # 'NORMAL' or 'SPECIAL'
         self.rank = rank  # for normal
         self.suit = suit
         self.special = special  # for special
         self.private_known_for = private_known_for  # player index that can see this card fully
+        self.id = CARD_ID[self.name]
 
-    def __repr__(self):
+    @property
+    def name(self):
         if self.kind == 'NORMAL':
-            return f"{self.rank}_{self.suit}"
-        else:
+            return f"{self.suit}_{self.rank}"
+        if self.suit is None:
             return f"{self.special}"
+        return f"{self.suit}_{self.special}"
+
+    @classmethod
+    def from_name(cls, name, private_known_for=None):
+        return cls.from_id(CARD_ID[name], private_known_for)
+
+    @classmethod
+    def from_id(cls, card_id, private_known_for=None):
+        suit, face = CARD_PARTS[card_id]
+        if face in RANKS:
+            return cls('NORMAL', rank=face, suit=suit, private_known_for=private_known_for)
+        return cls('SPECIAL', suit=suit, special=face, private_known_for=private_known_for)
+
+    def fits_on(self, table_card):
+        """Return True if this card can be played on table_card (a Card)."""
+        return PLAYABLE[table_card.id][self.id] == 1
+
+    def __eq__(self, other):
+        return isinstance(other, Card) and other.id == self.id
+
+    def __hash__(self):
+        return self.id
+
+    def __repr__(self):
+        return self.name
 
 
 
@@ -60,22 +89,14 @@ class Create_binary_code:
         
     def check_card_fits(self):
         """Check which player cards are compatible and classify them."""
-        for card in self.player_hand:
-            
-            if card.startswith(self.table_card[0]):
-                self.binarycode.append(1)
-                #print(f"{card} is compatible with {self.table_card}")
-
-            elif card[2] == self.table_card[2]:
-                self.binarycode.append(1)
-
-            elif card == "super":
-                self.binarycode.append(1)
-
-            else:
-                self.binarycode.append(0)
-                
-        #print("\nBinary code:", self.binarycode)
+        table_id = CARD_ID.get(self.table_card)
+        if table_id is None:
+            self.binarycode = [0] * len(self.player_hand)
+            return
+        row = PLAYABLE[table_id]
+        # unknown card names are never playable
+        self.binarycode = [row[CARD_ID[card]] if card in CARD_ID else 0
+                           for card in self.player_hand]
 
 """
 example use
@@ -87,8 +108,16 @@ example use
 
 
 class Card_compatibility:
-    def __init__(self, card_name):
+    """
+    Sorts a played card into common or power card. Common cards are handed to
+    on_common(card_name), e.g. a GUI callback that shows the card on the table,
+    so the rules never import the GUI. For a power card, effect is its handler
+    in Effects.EFFECTS; it is only looked up here, Game.play_card applies it.
+    """
+    def __init__(self, card_name, on_common=None):
         self.card_name = card_name
+        self.on_common = on_common
+        self.effect = None
         self.Common_or_power()
     
     def Common_or_power(self):
@@ -97,14 +126,16 @@ class Card_compatibility:
         
         
         if len(self.card_name) == 3 and self.card_name[1] == "_":
-            Display_first_card(self.root, self.image_loader, card_name=self.card_name)
+            if self.on_common is not None:
+                self.on_common(self.card_name)
             
         else:
             self.Play_power_card()
         
     
     def Play_power_card(self):
-        print("need to figure out what to do depending on card")
+        from .Effects import EFFECTS  # Effects imports this module
+        self.effect = EFFECTS[CARD_ID[self.card_name]] if self.card_name in CARD_ID else None
 
 
 
@@ -118,6 +149,43 @@ CARD_LIST += [(SUPERCONDUCTION, f"{SUPERCONDUCTION}.png")]
 
 # Dict for quick lookup: variable_name -> filename
 CARD_FILE_MAP = dict(CARD_LIST)
+
+# Cards that may start the table
+NUMERIC_CARDS = frozenset(f"{suit}_{rank}" for suit in SUITS for rank in RANKS)
+
+# Integer encoding: a card id is its position in CARD_LIST
+CARD_NAMES = tuple(card_name for card_name, _ in CARD_LIST)
+CARD_ID = {card_name: card_id for card_id, card_name in enumerate(CARD_NAMES)}
+NUM_CARDS = len(CARD_NAMES)
+
+# (suit, face) per card id; face is a rank or special, suit is None for superconduction
+CARD_PARTS = tuple((None, name) if name == SUPERCONDUCTION else tuple(name.split("_"))
+                   for name in CARD_NAMES)
+
+
+def card_id(card_name):
+    """Return the integer id of a card name such as "T_4"."""
+    return CARD_ID[card_name]
+
+
+def card_name(card_id):
+    """Return the card name of an integer id."""
+    return CARD_NAMES[card_id]
+
+
+def _fits(card_parts, table_parts):
+    """A card fits on the table card if it shares the suit or the rank/special,
+    or if either of them is the superconduction wild card."""
+    card_suit, card_face = card_parts
+    table_suit, table_face = table_parts
+    if card_face == SUPERCONDUCTION or table_face == SUPERCONDUCTION:
+        return True
+    return card_suit == table_suit or card_face == table_face
+
+
+# PLAYABLE[table_id][card_id] is 1 if the card may be played on the table card
+PLAYABLE = tuple(bytes(int(_fits(card_parts, table_parts)) for card_parts in CARD_PARTS)
+                 for table_parts in CARD_PARTS)
 if __name__ == "__main__":
     import pprint
     pp = pprint.PrettyPrinter(width=120, compact=False)
@@ -0,0 +1,65 @@
+"""
+Special-card effects as a dispatch table.
+
+EFFECTS[card_id] is the handler of that card, or None for cards without an
+effect. Game.play_card looks the handler up after moving the card to the
+table and calls handler(game, seat); every handler does a fixed amount of work,
+so a play costs the same whatever the number of specials.
+
+    cryostat        the next player is frozen and skips a turn
+    superfluid      the player flows on and moves again
+    spin            the direction of play reverses
+    entanglement    the next player draws two cards
+    teleportation   the player swaps hands with the next player
+    superconduction no effect; it is wild and fits on any card (see PLAYABLE)
+
+A handler returns the seat it targeted (or None); it is written to the game
+log with the effect. Effects are not applied when the play empties the
+player's hand, because that play wins the game.
+"""
+from .Card import (CARD_PARTS, CRYOSTAT, ENTANGLEMENT, SPIN, SUPERFLUID,
+                   TELEPORTATION)
+
+
+ENTANGLEMENT_DRAWS = 2
+
+
+def cryostat(game, seat):
+    game.set_turn_flags(skip_next=True)
+    return game.next_seat(seat)
+
+
+def superfluid(game, seat):
+    game.set_turn_flags(extra_turn=True)
+    return seat
+
+
+def spin(game, seat):
+    game.set_turn_flags(direction=-game.direction)
+    return None
+
+
+def entanglement(game, seat):
+    target = game.next_seat(seat)
+    player = game.players[target]
+    for _ in range(ENTANGLEMENT_DRAWS):
+        game.draw_card(player)
+    return target
+
+
+def teleportation(game, seat):
+    target = game.next_seat(seat)
+    game.swap_hands(seat, target)
+    return target
+
+
+EFFECT_BY_KIND = {
+    CRYOSTAT: cryostat,
+    SUPERFLUID: superfluid,
+    SPIN: spin,
+    ENTANGLEMENT: entanglement,
+    TELEPORTATION: teleportation,
+}
+
+# handler per card id, None for numbered cards and superconduction
+EFFECTS = tuple(EFFECT_BY_KIND.get(face) for _, face in CARD_PARTS)
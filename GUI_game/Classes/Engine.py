@@ -0,0 +1,271 @@
+"""
+Headless game engine.
+
+Plays complete games on Game and Player without any display. Each seat is
+driven by a policy: a function (game, player, playable, rng) -> card_name that
+picks one of the playable cards in player's hand. A player without a playable
+card draws one and the turn passes. Special cards take effect through
+Game.play_card and Game.advance_turn (see Effects). Everything random goes through one rng,
+so a seed reproduces a game exactly.
+
+Games between the built-in policies without a log skip Game and Player:
+_play_ids plays them on lists of card ids. Special cards still go through the
+Effects.EFFECTS handlers, which only use the part of Game that _Id_game
+mirrors, and the rng calls are the same, so it returns exactly the result the
+Game loop would.
+
+example use
+    result = play_game([random_policy] * 3, seed=42)
+    results = list(run_games([random_policy] * 3, n=10000))
+"""
+import random
+from collections import deque, namedtuple
+
+from .Card import CARD_ID, CARD_PARTS, NUM_CARDS, PLAYABLE, RANKS, SPECIALS, SUITS, SUPERCONDUCTION
+from .Effects import EFFECTS
+from .Game import Game
+
+
+# Games that reach this many turns end without a winner
+MAX_TURNS = 1000
+
+# Special kinds counted in a result, in this order
+SPECIAL_KINDS = SPECIALS + [SUPERCONDUCTION]
+
+# Per card id: index into SUITS / SPECIAL_KINDS, or -1
+SUIT_INDEX = tuple(SUITS.index(suit) if suit in SUITS else -1 for suit, _ in CARD_PARTS)
+SPECIAL_INDEX = tuple(SPECIAL_KINDS.index(face) if face in SPECIAL_KINDS else -1
+                      for _, face in CARD_PARTS)
+
+# Per card id, for _play_ids: True for numbered cards
+NUMERIC = tuple(face in RANKS for _, face in CARD_PARTS)
+
+# PLAYABLE row of an empty table
+_NOTHING = bytes(NUM_CARDS)
+
+"""
+Final record of one game. winner is the seat index (0-based) or -1 if the game
+hit max_turns; suit_plays counts plays per SUITS, special_plays per SPECIAL_KINDS.
+"""
+Game_result = namedtuple("Game_result", ["seed", "winner", "turns", "draws",
+                                         "suit_plays", "special_plays", "hand_sizes"])
+
+
+def random_policy(game, player, playable, rng):
+    """Play a random playable card."""
+    return playable[int(rng.random() * len(playable))]
+
+
+def first_playable_policy(game, player, playable, rng):
+    """Play the first playable card in hand order."""
+    return playable[0]
+
+
+# policies _play_ids can run without a Game: True picks a random card, False the first
+ID_POLICIES = {random_policy: True, first_playable_policy: False}
+
+
+def play_game(policies, seed=None, rng=None, cards_per_player=7, max_turns=MAX_TURNS, deck=None,
+              log=None):
+    """
+    Play one game between policies, one per seat, and return its Game_result.
+
+    rng defaults to random.Random(seed). deck is a list of card names to play
+    with instead of CARD_LIST, e.g. to try other deck compositions. log is a
+    Replay.Game_log that records the game.
+    """
+    if rng is None:
+        rng = random.Random(seed)
+    if log is None and all(policy in ID_POLICIES for policy in policies):
+        return _play_ids([ID_POLICIES[policy] for policy in policies], seed, rng,
+                         cards_per_player, max_turns, deck)
+    game = Game(rng=rng, verbose=False)
+    game.log = log
+    if log is not None and seed is not None:
+        log.seed(seed)
+    game.init_and_shuffle_deck(deck)
+    players = game.deal_cards(len(policies), cards_per_player)
+
+    suit_plays = [0] * len(SUITS)
+    special_plays = [0] * len(SPECIAL_KINDS)
+    draws = 0
+    turns = 0
+    winner = -1
+    table_cards = game.table_cards
+    while turns < max_turns:
+        turns += 1
+        seat = game.current_idx
+        player = players[seat]
+        top_id = table_cards.top_id()
+        # computed here rather than through player.playable(): the hand has
+        # changed since the seat last moved, so the cache would only cost time
+        row = PLAYABLE[top_id] if top_id is not None else _NOTHING
+        playable = [card for card in player.hand if row[CARD_ID[card]]]
+        if playable:
+            card = policies[seat](game, player, playable, rng)
+            game.play_card(card, player)
+            card_id = CARD_ID[card]
+            if SUIT_INDEX[card_id] >= 0:
+                suit_plays[SUIT_INDEX[card_id]] += 1
+            if SPECIAL_INDEX[card_id] >= 0:
+                special_plays[SPECIAL_INDEX[card_id]] += 1
+            if not player.hand:
+                winner = seat
+                break
+        elif game.draw_card(player) is not None:
+            draws += 1
+        game.advance_turn()
+
+    if log is not None:
+        log.end(winner)
+    return Game_result(seed, winner, turns, draws, tuple(suit_plays), tuple(special_plays),
+                       tuple(len(player.hand) for player in players))
+
+
+class _Id_game:
+    """
+    Game state of _play_ids: hands are lists of card ids, the table a list
+    with the top card last. It has the turn and draw methods of Game that the
+    Effects handlers call, so handler(state, seat) works on it unchanged.
+    """
+    __slots__ = ("players", "shuffled_deck", "table_cards", "current_idx", "direction",
+                 "skip_next", "extra_turn", "rng")
+
+    def __init__(self, players, shuffled_deck, table_cards, rng):
+        self.players = players
+        self.shuffled_deck = shuffled_deck
+        self.table_cards = table_cards
+        self.current_idx = 0
+        self.direction = 1
+        self.skip_next = False
+        self.extra_turn = False
+        self.rng = rng
+
+    def next_seat(self, seat=None):
+        if seat is None:
+            seat = self.current_idx
+        return (seat + self.direction) % len(self.players)
+
+    def set_turn_flags(self, direction=None, skip_next=None, extra_turn=None):
+        if direction is not None:
+            self.direction = direction
+        if skip_next is not None:
+            self.skip_next = skip_next
+        if extra_turn is not None:
+            self.extra_turn = extra_turn
+
+    def swap_hands(self, seat_a, seat_b):
+        players = self.players
+        players[seat_a], players[seat_b] = players[seat_b], players[seat_a]
+
+    def draw_card(self, hand):
+        if not self.shuffled_deck:
+            self.reshuffle_discards()
+            if not self.shuffled_deck:
+                return None
+        card = self.shuffled_deck.popleft()
+        hand.append(card)
+        return card
+
+    def reshuffle_discards(self):
+        table = self.table_cards
+        if len(table) < 2:
+            return
+        recycled = table[:-1]
+        del table[:-1]
+        self.rng.shuffle(recycled)
+        self.shuffled_deck.extend(recycled)
+
+    def advance_turn(self):
+        if self.extra_turn:
+            self.extra_turn = False
+        elif self.skip_next:
+            self.skip_next = False
+            self.current_idx = (self.current_idx + 2 * self.direction) % len(self.players)
+        else:
+            self.current_idx = (self.current_idx + self.direction) % len(self.players)
+
+
+def _play_ids(random_seats, seed, rng, cards_per_player, max_turns, deck):
+    """
+    play_game on card ids, see _Id_game. random_seats[seat] is True for
+    random_policy and False for first_playable_policy.
+    """
+    cards = list(range(NUM_CARDS)) if deck is None else [CARD_ID[card] for card in deck]
+    rng.shuffle(cards)
+    seats = len(random_seats)
+    # dealt one card at a time round the table: seat i gets every seats-th card from i
+    dealt = min(len(cards), seats * cards_per_player)
+    hands = [cards[seat:dealt:seats] for seat in range(seats)]
+    rest = cards[dealt:]
+    table = []
+    if rest:
+        # turn up the first numbered card; the specials above it go to the bottom
+        for skipped, card in enumerate(rest):
+            if NUMERIC[card]:
+                table.append(card)
+                rest = rest[skipped + 1:] + rest[:skipped]
+                break
+        else:
+            raise ValueError("No numeric card found in the deck to start the table.")
+    state = _Id_game(hands, deque(rest), table, rng)
+
+    plays = [0] * NUM_CARDS  # per card id, summed into suit and special counts at the end
+    draws = 0
+    turns = 0
+    winner = -1
+    row = PLAYABLE[table[-1]] if table else _NOTHING
+    random_draw = rng.random
+    while turns < max_turns:
+        turns += 1
+        seat = state.current_idx
+        hand = hands[seat]
+        playable = [card for card in hand if row[card]]
+        if playable:
+            if random_seats[seat]:
+                card = playable[int(random_draw() * len(playable))]
+            else:
+                card = playable[0]
+            hand.remove(card)
+            table.append(card)
+            row = PLAYABLE[card]
+            plays[card] += 1
+            if not hand:
+                winner = seat
+                break
+            effect = EFFECTS[card]
+            if effect is not None:
+                effect(state, seat)
+        elif state.draw_card(hand) is not None:
+            draws += 1
+        state.advance_turn()
+
+    suit_plays = [0] * len(SUITS)
+    special_plays = [0] * len(SPECIAL_KINDS)
+    for card, count in enumerate(plays):
+        if count:
+            if SUIT_INDEX[card] >= 0:
+                suit_plays[SUIT_INDEX[card]] += count
+            if SPECIAL_INDEX[card] >= 0:
+                special_plays[SPECIAL_INDEX[card]] += count
+    return Game_result(seed, winner, turns, draws, tuple(suit_plays), tuple(special_plays),
+                       tuple(len(hand) for hand in hands))
+
+
+def run_games(policies, n, seed=0, **kwargs):
+    """Yield the results of n games seeded seed, seed + 1, ... seed + n - 1."""
+    for game_seed in range(seed, seed + n):
+        yield play_game(policies, seed=game_seed, **kwargs)
+
+
+if __name__ == "__main__":
+    import time
+
+    n = 20000
+    start = time.perf_counter()
+    results = list(run_games([random_policy] * 3, n))
+    elapsed = time.perf_counter() - start
+    wins = [sum(1 for r in results if r.winner == seat) for seat in range(3)]
+    print(f"{n} games in {elapsed:.2f}s ({n / elapsed:.0f} games/s)")
+    print(f"wins per seat: {wins}, unfinished: {n - sum(wins)}")
+    print(f"mean turns: {sum(r.turns for r in results) / n:.1f}")
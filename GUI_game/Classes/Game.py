@@ -1,55 +1,297 @@
-﻿from .Card import CARD_LIST
-from GUI_game.Classes.Card import SUITS, RANKS
+﻿from .Card import CARD_LIST, NUMERIC_CARDS, CARD_ID
+from .Effects import EFFECTS
+from .Pile import Discard_pile
 from .Player import Player
+from .Zobrist import Zobrist_keys, Zobrist_hasher, REVERSED, SKIP_NEXT, EXTRA_TURN
+from collections import Counter, deque
 import random
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, rng=None, verbose=True):
         self.players = []
         self.deck = []            # full deck before shuffling
-        self.shuffled_deck = []   # draw pile (face-down)
-        self.table_cards = []     # face-up pile (renamed to avoid method/attribute conflict)
+        self.shuffled_deck = deque()  # draw pile (face-down), top card on the left
+        self.table_cards = Discard_pile(len(CARD_LIST))  # face-up pile, resized with the deck
+        self.current_idx = 0      # index in self.players of the player to move
+        self.direction = 1        # +1 or -1 after a spin, see Effects
+        self.skip_next = False    # the next player is skipped (cryostat)
+        self.extra_turn = False   # the player to move moves again (superfluid)
+        self.rng = rng if rng is not None else random  # anything with shuffle(), e.g. random.Random(seed)
+        self.verbose = verbose    # print each play; off for headless simulation
+        self.history = None       # undo records while a checkpoint is active, see checkpoint()
+        self.hasher = None        # Zobrist_hasher once enable_hashing() is called
+        self.log = None           # Replay.Game_log recording this game, if any
 
-    def init_and_shuffle_deck(self):
-        self.deck = [card_name for card_name, _ in CARD_LIST]
-        self.shuffled_deck = self.deck.copy()
-        random.shuffle(self.shuffled_deck)
+    def clone(self, rng=None):
+        """Return an independent copy of the game state for search.
+        The copy shares rng unless another one is given and starts without history."""
+        game = Game.__new__(Game)
+        game.players = [player.copy() for player in self.players]
+        game.deck = self.deck
+        game.shuffled_deck = deque(self.shuffled_deck)
+        game.table_cards = self.table_cards.copy()
+        game.current_idx = self.current_idx
+        game.direction = self.direction
+        game.skip_next = self.skip_next
+        game.extra_turn = self.extra_turn
+        game.rng = rng if rng is not None else self.rng
+        game.verbose = False
+        game.history = None
+        game.hasher = None
+        game.log = None
+        if self.hasher is not None:
+            game.enable_hashing(self.hasher.keys)
+        return game
+
+    def enable_hashing(self, keys=None):
+        """Start keeping a Zobrist hash of the state in self.hasher.value.
+        keys defaults to a Zobrist_keys sized for this deck and player count."""
+        if keys is None:
+            copies = max(Counter(self.deck).values(), default=1)
+            keys = Zobrist_keys(len(CARD_ID), max_players=max(len(self.players), 1),
+                                max_copies=copies, max_pile=len(self.deck))
+        hasher = Zobrist_hasher(keys, len(self.players))
+        for seat, player in enumerate(self.players):
+            for card_name in player.hand:
+                hasher.card_added(seat, CARD_ID[card_name])
+        hasher.top_changed(None, self.top_id())
+        hasher.pile_changed(0, len(self.shuffled_deck))
+        hasher.turn_changed(0, self.current_idx)
+        for flag, on in zip((REVERSED, SKIP_NEXT, EXTRA_TURN), self._turn_flags()):
+            if on:
+                hasher.flag_toggled(flag)
+        self.hasher = hasher
+        return hasher
+
+    def _turn_flags(self):
+        return self.direction < 0, self.skip_next, self.extra_turn
+
+    def _hash_flags(self, old_flags):
+        for flag, old, new in zip((REVERSED, SKIP_NEXT, EXTRA_TURN), old_flags, self._turn_flags()):
+            if old != new:
+                self.hasher.flag_toggled(flag)
+
+    def _save_turn_state(self):
+        self.history.append(("turn", self.current_idx, self.direction, self.skip_next, self.extra_turn))
+
+    def checkpoint(self):
+        """Start recording undo information and return a mark for rollback()."""
+        if self.history is None:
+            self.history = []
+        return len(self.history)
+
+    def rollback(self, mark):
+        """Undo every play, draw, reshuffle, effect and turn change made since mark."""
+        history = self.history
+        hasher = self.hasher
+        while len(history) > mark:
+            record = history.pop()
+            kind = record[0]
+            if kind == "play":
+                _, player, card_name, index = record
+                self.table_cards.pop()
+                player.hand.insert(index, card_name)
+                player.version += 1
+                if player.subscribers:
+                    player._notify()
+                if hasher is not None:
+                    hasher.top_changed(CARD_ID[card_name], self.top_id())
+                    hasher.card_added(player.id - 1, CARD_ID[card_name])
+            elif kind == "draw":
+                _, player, card_name = record
+                player.hand.pop()
+                player.version += 1
+                if player.subscribers:
+                    player._notify()
+                self.shuffled_deck.appendleft(card_name)
+                if hasher is not None:
+                    hasher.card_removed(player.id - 1, CARD_ID[card_name])
+                    hasher.pile_changed(len(self.shuffled_deck) - 1, len(self.shuffled_deck))
+            elif kind == "turn":
+                old_flags = self._turn_flags()
+                if hasher is not None:
+                    hasher.turn_changed(self.current_idx, record[1])
+                _, self.current_idx, self.direction, self.skip_next, self.extra_turn = record
+                if hasher is not None:
+                    self._hash_flags(old_flags)
+            elif kind == "swap":
+                self._swap(record[1], record[2])
+            elif kind == "recycle":
+                _, recycled = record
+                for _ in range(len(recycled)):
+                    self.shuffled_deck.pop()
+                self.table_cards.put_below_top(recycled)
+                if hasher is not None:
+                    hasher.pile_changed(len(self.shuffled_deck) + len(recycled), len(self.shuffled_deck))
+
+    def init_and_shuffle_deck(self, deck=None):
+        """Build the deck (CARD_LIST unless a list of card names is given) and shuffle it."""
+        if deck is None:
+            deck = [card_name for card_name, _ in CARD_LIST]
+        self.deck = list(deck)
+        shuffled = self.deck.copy()
+        self.rng.shuffle(shuffled)
+        self.shuffled_deck = deque(shuffled)
+        self.table_cards = Discard_pile(len(self.deck))
+
+    def reshuffle_draw_pile(self):
+        """Shuffle the draw pile in place, in O(n)."""
+        shuffled = list(self.shuffled_deck)
+        self.rng.shuffle(shuffled)
+        self.shuffled_deck.clear()
+        self.shuffled_deck.extend(shuffled)
+
+    def top_card(self):
+        """Return the name of the top card of the table, or None if it is empty."""
+        return self.table_cards.top()
+
+    def top_id(self):
+        """Return the card id of the top card of the table, or None if it is empty."""
+        return self.table_cards.top_id()
 
     def table(self):
         """
-        Return the latest top card as a string (not a list).
-        Uses self.table_cards where the last item is the top card.
+        Return the top card for display, or "Table is empty".
+        Use top_card() or top_id() to look at the card itself.
         """
-        if not self.table_cards:
-            return "Table is empty"
-        return str(self.table_cards[-1])
+        top = self.table_cards.top()
+        return "Table is empty" if top is None else top
 
     def __str__(self):
         return self.table()
 
     def ensure_numeric_table_start(self):
-        while self.shuffled_deck:
-            card = self.shuffled_deck.pop(0)
-            if any(card.startswith(f"{suit}_{rank}") for suit in SUITS for rank in RANKS):
-                self.table_cards.append(card)
+        """Turn up the first numeric card of the draw pile; the special cards
+        above it move to the bottom of the pile in the same order."""
+        for skipped, card in enumerate(self.shuffled_deck):
+            if card in NUMERIC_CARDS:
+                self.shuffled_deck.rotate(-skipped)
+                self.table_cards.push(self.shuffled_deck.popleft())
                 return
-            else:
-                self.shuffled_deck.append(card)
         raise ValueError("No numeric card found in the deck to start the table.")
 
     def deal_cards(self, num_players=3, cards_per_player=7, start_table_card=True):
+        if self.log is not None:
+            self.log.deal(self.shuffled_deck, num_players, cards_per_player)
+        # every card that can reach the table is in the draw pile or already on it
+        self.table_cards = Discard_pile(len(self.shuffled_deck) + len(self.table_cards), self.table_cards)
         players = [Player(i + 1) for i in range(num_players)]
         for _ in range(cards_per_player):
             for player in players:
                 if self.shuffled_deck:
-                    player.hand.append(self.shuffled_deck.pop(0))
+                    player.add(self.shuffled_deck.popleft())
 
         if start_table_card and self.shuffled_deck:
             self.ensure_numeric_table_start()
         self.players = players
+        self.current_idx = 0
+        self.direction = 1
+        self.skip_next = False
+        self.extra_turn = False
         return players
 
+    def current_player(self):
+        return self.players[self.current_idx]
+
+    def playable_mask(self, player):
+        """Return player's cached playable mask (see Player.playable_mask) for the table card."""
+        return player.playable_mask(self.table_cards.top_id())
+
+    def playable_cards(self, player):
+        """Return the cards in player's hand that may be played on the table card.
+        The list is cached by the player; do not modify it."""
+        return player.playable(self.table_cards.top_id())
+
+    def next_seat(self, seat=None):
+        """Seat after seat (default: the player to move) in the direction of play."""
+        if seat is None:
+            seat = self.current_idx
+        return (seat + self.direction) % len(self.players)
+
+    def set_turn_flags(self, direction=None, skip_next=None, extra_turn=None):
+        """Change the direction of play or the pending skip / extra turn."""
+        if self.history is not None:
+            self._save_turn_state()
+        old_flags = self._turn_flags()
+        if direction is not None:
+            self.direction = direction
+        if skip_next is not None:
+            self.skip_next = skip_next
+        if extra_turn is not None:
+            self.extra_turn = extra_turn
+        if self.hasher is not None:
+            self._hash_flags(old_flags)
+
+    def swap_hands(self, seat_a, seat_b):
+        """Exchange the hands of two seats."""
+        if self.history is not None:
+            self.history.append(("swap", seat_a, seat_b))
+        self._swap(seat_a, seat_b)
+
+    def _swap(self, seat_a, seat_b):
+        self.players[seat_a].swap_hands(self.players[seat_b])
+        if self.hasher is not None:
+            self.hasher.hands_swapped(seat_a, seat_b)
+
+    def advance_turn(self):
+        """Pass the turn on and return the player to move. A pending extra turn
+        keeps the same player; a pending skip passes over the next one."""
+        if self.history is not None:
+            self._save_turn_state()
+        old_idx = self.current_idx
+        if self.extra_turn:
+            self.extra_turn = False
+            if self.hasher is not None:
+                self.hasher.flag_toggled(EXTRA_TURN)
+        elif self.skip_next:
+            self.skip_next = False
+            self.current_idx = (old_idx + 2 * self.direction) % len(self.players)
+            if self.hasher is not None:
+                self.hasher.flag_toggled(SKIP_NEXT)
+        else:
+            self.current_idx = (old_idx + self.direction) % len(self.players)
+        if self.hasher is not None:
+            self.hasher.turn_changed(old_idx, self.current_idx)
+        if self.log is not None:
+            self.log.turn(self.current_idx)
+        return self.players[self.current_idx]
+
+    def draw_card(self, player):
+        """Move the top card of the draw pile to player's hand.
+        Return the card, or None if there is nothing left to draw."""
+        if not self.shuffled_deck:
+            self.reshuffle_discards()
+            if not self.shuffled_deck:
+                return None
+        card_name = self.shuffled_deck.popleft()
+        player.hand.append(card_name)
+        player.version += 1
+        if player.subscribers:
+            player._notify()
+        if self.history is not None:
+            self.history.append(("draw", player, card_name))
+        if self.hasher is not None:
+            self.hasher.card_added(player.id - 1, CARD_ID[card_name])
+            self.hasher.pile_changed(len(self.shuffled_deck) + 1, len(self.shuffled_deck))
+        if self.log is not None:
+            self.log.draw(player.id - 1, card_name)
+        return card_name
+
+    def reshuffle_discards(self):
+        """Shuffle every table card except the top one back into the draw pile."""
+        if len(self.table_cards) < 2:
+            return
+        recycled = self.table_cards.take_below_top()
+        if self.history is not None:
+            self.history.append(("recycle", list(recycled)))
+        self.rng.shuffle(recycled)
+        self.shuffled_deck.extend(recycled)
+        if self.log is not None:
+            self.log.recycle(recycled)
+        if self.hasher is not None:
+            self.hasher.pile_changed(len(self.shuffled_deck) - len(recycled), len(self.shuffled_deck))
+
     def show_table(self):
         print("Table (face-up):")
         top_card = self.table()
@@ -65,19 +307,41 @@ class Game:
             print(card)
 
     def play_card(self, card_name, player):
-        """Remove card_name from player's hand and add to table.
+        """Remove card_name from player's hand and add to table, then apply the
+        card's effect (see Effects) unless the hand is now empty.
         Return True if successful, False if card not found."""
-        hand = self.hands.get(player)
+        hand = getattr(player, "hand", None)
         if hand is None:
             return False
 
         if card_name in hand:
-            hand.remove(card_name)
-            self.table_cards.append(card_name)
-            print(f"Played {card_name} from {player} onto table.")
+            index = hand.index(card_name)
+            del hand[index]
+            player.version += 1
+            if player.subscribers:
+                player._notify()
+            self.table_cards.push(card_name)
+            if self.history is not None:
+                self.history.append(("play", player, card_name, index))
+            card_id = CARD_ID[card_name]
+            if self.hasher is not None:
+                self.hasher.card_removed(player.id - 1, card_id)
+                self.hasher.top_changed(CARD_ID[self.table_cards[-2]] if len(self.table_cards) > 1 else None,
+                                        card_id)
+            if self.log is not None:
+                self.log.play(player.id - 1, card_name)
+            if self.verbose:
+                print(f"Played {card_name} from {player} onto table.")
+            effect = EFFECTS[card_id]
+            if effect is not None and hand:
+                seat = player.id - 1
+                target = effect(self, seat)
+                if self.log is not None:
+                    self.log.effect(seat, card_name, seat if target is None else target)
             return True
 
-        print(f"Card {card_name} not in {player} hand.")
+        if self.verbose:
+            print(f"Card {card_name} not in {player} hand.")
         return False
 
 
@@ -0,0 +1,102 @@
+"""
+The face-up discard pile of a Game.
+
+Cards are never created or destroyed during a game, so the pile can never
+hold more cards than were dealt. It lives in two lists of that fixed
+capacity, card names and card ids, and only a size counter moves. Playing a
+card or undoing a play allocates nothing. top() and top_id() are O(1).
+
+example use
+    pile = Discard_pile(41)
+    pile.push("C_3")
+    pile.top(), pile.top_id()      -> "C_3", 2
+    recycled = pile.take_below_top()
+"""
+from .Card import CARD_ID
+
+
+class Discard_pile:
+    """Face-up cards, bottom first; the last card pushed is the top card."""
+    __slots__ = ("names", "ids", "size")
+
+    def __init__(self, capacity, cards=()):
+        self.names = [None] * capacity
+        self.ids = [0] * capacity
+        self.size = 0
+        for card_name in cards:
+            self.push(card_name)
+
+    @property
+    def capacity(self):
+        return len(self.names)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        """Card name at index, counted from the bottom; -1 is the top card."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("discard pile index out of range")
+        return self.names[index]
+
+    def __iter__(self):
+        return iter(self.names[:self.size])
+
+    def __repr__(self):
+        return f"Discard_pile({self.names[:self.size]})"
+
+    def top(self):
+        """Name of the top card, or None if the pile is empty."""
+        return self.names[self.size - 1] if self.size else None
+
+    def top_id(self):
+        """Card id of the top card, or None if the pile is empty."""
+        return self.ids[self.size - 1] if self.size else None
+
+    def push(self, card_name):
+        """Put card_name on top. Raises IndexError when the pile is full."""
+        size = self.size
+        if size == len(self.names):
+            raise IndexError("discard pile is full")
+        self.names[size] = card_name
+        self.ids[size] = CARD_ID[card_name]
+        self.size = size + 1
+
+    def pop(self):
+        """Take the top card off and return its name."""
+        if not self.size:
+            raise IndexError("pop from an empty discard pile")
+        self.size -= 1
+        return self.names[self.size]
+
+    def take_below_top(self):
+        """Remove every card under the top card and return them, bottom first."""
+        size = self.size
+        if size < 2:
+            return []
+        below = self.names[:size - 1]
+        self.names[0] = self.names[size - 1]
+        self.ids[0] = self.ids[size - 1]
+        self.size = 1
+        return below
+
+    def put_below_top(self, card_names):
+        """Put cards back under the pile, bottom first; undoes take_below_top."""
+        n = len(card_names)
+        size = self.size
+        if size + n > len(self.names):
+            raise IndexError("discard pile is full")
+        self.names[n:n + size] = self.names[:size]
+        self.ids[n:n + size] = self.ids[:size]
+        self.names[:n] = card_names
+        self.ids[:n] = [CARD_ID[card_name] for card_name in card_names]
+        self.size = size + n
+
+    def copy(self):
+        pile = Discard_pile.__new__(Discard_pile)
+        pile.names = list(self.names)
+        pile.ids = list(self.ids)
+        pile.size = self.size
+        return pile
@@ -0,0 +1,70 @@
+"""
+Batched playable masks with NumPy.
+
+Create_binary_code checks one hand at a time. The functions here check many
+game states in one call: hands are a 2-D array of card ids padded with PAD,
+table cards a 1-D array of ids, and the result is a boolean mask per hand slot.
+
+example use
+    hands = encode_hands([["T_2", "C_3", "super"], ["X_4"]])
+    tables = encode_cards(["T_4", "R_1"])
+    playable_masks(hands, tables)
+    -> [[ True, False,  True], [False, False, False]]
+"""
+import numpy as np
+
+from .Card import CARD_ID, NUM_CARDS, PLAYABLE
+
+
+# Padding id for unused hand slots; it never fits and nothing fits on it
+PAD = NUM_CARDS
+
+# PLAYABLE as a (NUM_CARDS + 1) x (NUM_CARDS + 1) bool array with a PAD row/column
+PLAYABLE_ARRAY = np.zeros((NUM_CARDS + 1, NUM_CARDS + 1), dtype=bool)
+PLAYABLE_ARRAY[:NUM_CARDS, :NUM_CARDS] = np.array([list(row) for row in PLAYABLE], dtype=bool)
+PLAYABLE_ARRAY.flags.writeable = False
+
+CARD_DTYPE = np.int16
+
+
+def encode_cards(card_names):
+    """Return a 1-D array of card ids for a sequence of card names."""
+    return np.fromiter((CARD_ID[name] for name in card_names), dtype=CARD_DTYPE,
+                       count=len(card_names))
+
+
+def encode_hands(hands, width=None):
+    """
+    Return a (len(hands), width) array of card ids, padded with PAD.
+
+    width defaults to the longest hand; longer hands raise ValueError.
+    """
+    if width is None:
+        width = max((len(hand) for hand in hands), default=0)
+    out = np.full((len(hands), width), PAD, dtype=CARD_DTYPE)
+    for row, hand in enumerate(hands):
+        if len(hand) > width:
+            raise ValueError(f"hand {row} has {len(hand)} cards, more than width {width}")
+        out[row, :len(hand)] = [CARD_ID[name] for name in hand]
+    return out
+
+
+def playable_masks(hands, table_cards):
+    """
+    Return the playable mask of every hand against its table card.
+
+    hands is an integer array (..., hand_size) of card ids padded with PAD.
+    table_cards is an integer array of ids with the shape of hands minus the
+    last axis, or a single id shared by all hands. The result is a bool array
+    shaped like hands; padded slots are always False.
+    """
+    hands = np.asarray(hands)
+    table_cards = np.asarray(table_cards)
+    if hands.size and (hands.min() < 0 or hands.max() > PAD):
+        raise ValueError(f"card ids must be between 0 and {PAD}")
+    return PLAYABLE_ARRAY[table_cards[..., None], hands]
+
+
+def playable_counts(hands, table_cards):
+    """Return the number of playable cards in each hand."""
+    return playable_masks(hands, table_cards).sum(axis=-1)
@@ -1,10 +1,177 @@
-﻿class Player:
+﻿from .Card import CARD_ID, CARD_NAMES, CARD_PARTS, PLAYABLE, SUPERCONDUCTION
+
+
+# (suit, rank or special kind) per card name, and every key of the counts
+_PARTS = dict(zip(CARD_NAMES, CARD_PARTS))
+_SUITS = tuple(dict.fromkeys(suit for suit, _ in CARD_PARTS))
+_FACES = tuple(dict.fromkeys(face for _, face in CARD_PARTS))
+
+
+class Player:
+    """
+    A seat and its hand, with per-suit and per-rank counts.
+
+    Change the hand through add, insert, remove_at, pop, set_hand and
+    swap_hands, not by editing self.hand: every change bumps version and
+    calls each subscriber with the player. Everything derived from the hand
+    is cached by version: the tuple view, the counts, and the playable mask
+    and cards (also by table card). A change only costs the list operation
+    and the version bump, so simulated games pay nothing for caches they do
+    not read.
+    suit_counts is keyed by suit (None for superconduction), rank_counts by
+    rank, or by the special kind for special cards; both hold every key,
+    with 0 for those not in hand.
+    """
+    __slots__ = ("id", "hand", "version", "subscribers", "_suit_counts", "_rank_counts",
+                 "_counts_version", "_view", "_view_version", "_mask", "_mask_version",
+                 "_mask_top", "_playable", "_playable_version", "_playable_top")
+
     def __init__(self, id: int):
         self.id = id
         self.hand = []
+        self.version = 0          # bumped on every change of the hand
+        self.subscribers = []     # callables(player) run after every change
+        self._suit_counts = None
+        self._rank_counts = None
+        self._counts_version = -1
+        self._view = ()
+        self._view_version = -1   # nothing cached yet, also for a copy()
+        self._mask = []
+        self._mask_version = -1
+        self._mask_top = None
+        self._playable = []
+        self._playable_version = -1
+        self._playable_top = None
+
+    def get_hand(self) -> tuple:
+        """Return the hand as a tuple; it is only rebuilt after the hand changed."""
+        if self._view_version != self.version:
+            self._view = tuple(self.hand)
+            self._view_version = self.version
+        return self._view
+
+    def _count(self):
+        if self._counts_version != self.version:
+            suit_counts = dict.fromkeys(_SUITS, 0)
+            rank_counts = dict.fromkeys(_FACES, 0)
+            for card_name in self.hand:
+                suit, face = _PARTS[card_name]
+                suit_counts[suit] += 1
+                rank_counts[face] += 1
+            self._suit_counts = suit_counts
+            self._rank_counts = rank_counts
+            self._counts_version = self.version
+
+    @property
+    def suit_counts(self) -> dict:
+        """Cards in hand per suit; do not modify."""
+        self._count()
+        return self._suit_counts
+
+    @property
+    def rank_counts(self) -> dict:
+        """Cards in hand per rank or special kind; do not modify."""
+        self._count()
+        return self._rank_counts
+
+    def copy(self) -> "Player":
+        """Return an independent copy of the hand, without subscribers."""
+        other = Player(self.id)
+        other.hand = list(self.hand)
+        return other
+
+    def subscribe(self, callback):
+        """Call callback(player) after every change of the hand."""
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self.subscribers.remove(callback)
+
+    def _notify(self):
+        for callback in self.subscribers:
+            callback(self)
+
+    # add, insert and remove_at run for every move of a simulated game
+    def add(self, card_name: str):
+        """Put a card at the end of the hand."""
+        self.hand.append(card_name)
+        self.version += 1
+        if self.subscribers:
+            self._notify()
+
+    def insert(self, index: int, card_name: str):
+        self.hand.insert(index, card_name)
+        self.version += 1
+        if self.subscribers:
+            self._notify()
+
+    def remove_at(self, index: int) -> str:
+        """Take the card at index out of the hand and return it."""
+        card_name = self.hand.pop(index)
+        self.version += 1
+        if self.subscribers:
+            self._notify()
+        return card_name
+
+    def pop(self) -> str:
+        """Take the last card out of the hand and return it."""
+        return self.remove_at(-1)
+
+    def set_hand(self, card_names):
+        """Replace the whole hand."""
+        self.hand[:] = card_names
+        self.version += 1
+        if self.subscribers:
+            self._notify()
+
+    def swap_hands(self, other: "Player"):
+        """Exchange hands with another player."""
+        self.hand, other.hand = other.hand, self.hand
+        self.version += 1
+        other.version += 1
+        if self.subscribers:
+            self._notify()
+        if other.subscribers:
+            other._notify()
+
+    def can_play(self, top_id) -> bool:
+        """Return True if a card in hand fits on the card with id top_id, from the counts."""
+        if top_id is None or not self.hand:
+            return False
+        self._count()
+        suit, face = CARD_PARTS[top_id]
+        rank_counts = self._rank_counts
+        return (face == SUPERCONDUCTION or self._suit_counts[suit] > 0 or rank_counts[face] > 0
+                or rank_counts[SUPERCONDUCTION] > 0)
+
+    def playable_mask(self, top_id) -> list:
+        """
+        Return 1 or 0 per card in hand: may it be played on the card with id top_id.
+        top_id None (an empty table) allows nothing. The list is cached and
+        shared until the hand or top_id changes, so do not modify it.
+        """
+        if self._mask_version != self.version or self._mask_top != top_id:
+            if top_id is None:
+                self._mask = [0] * len(self.hand)
+            else:
+                row = PLAYABLE[top_id]
+                self._mask = [row[CARD_ID[card]] for card in self.hand]
+            self._mask_version = self.version
+            self._mask_top = top_id
+        return self._mask
 
-    def get_hand(self) -> list:
-        return list(self.hand)
+    def playable(self, top_id) -> list:
+        """Return the cards in hand that may be played on the card with id top_id,
+        cached like playable_mask."""
+        if self._playable_version != self.version or self._playable_top != top_id:
+            if top_id is None:
+                self._playable = []
+            else:
+                row = PLAYABLE[top_id]
+                self._playable = [card for card in self.hand if row[CARD_ID[card]]]
+            self._playable_version = self.version
+            self._playable_top = top_id
+        return self._playable
 
 
 def get_player(players: list, player_id: int) -> Player:
@@ -17,6 +184,6 @@ def get_player(players: list, player_id: int) -> Player:
     return players[player_id - 1]
 
 
-def get_player_hand(players: list, player_id: int) -> list:
+def get_player_hand(players: list, player_id: int) -> tuple:
     player = get_player(players, player_id)
     return player.get_hand()
@@ -0,0 +1,264 @@
+"""
+Binary append-only event log of games, and a replayer that rebuilds them.
+
+A log file starts with MAGIC and holds any number of games one after another.
+Every event is one type byte followed by a fixed payload, except DEAL and
+RECYCLE which carry a list of card ids (one byte each):
+
+    SEED     u64 seed
+    DEAL     u8 players, u8 cards per player, u16 n, n card ids (draw pile, top first)
+    PLAY     u8 seat, u8 card id
+    DRAW     u8 seat, u8 card id
+    TURN     u8 seat now to move
+    RECYCLE  u16 n, n card ids (discards appended to the draw pile, in order)
+    EFFECT   u8 seat, u8 card id, u8 target seat
+    END      i8 winning seat, -1 for none
+
+A game is SEED? DEAL (PLAY | DRAW | TURN | RECYCLE | EFFECT)* END. Game writes
+the events itself when game.log is set; the replayer feeds them back through
+Game, checking every step, so it needs no GUI and no rng. A play of a special
+card is followed by the events its effect caused (draws, a reshuffle) and an
+EFFECT event; the replayer lets play_card apply the effect again and checks
+those events against the log.
+
+Logs written with moves=False keep only SEED and END. Such games are rebuilt
+by playing them again with play_game(policies, seed=seed).
+
+example use
+    with open("games.qlog", "ab") as f, Game_log(f) as log:
+        play_game(policies, seed=7, log=log)
+    for events in read_games("games.qlog"):
+        game = replay_game(events)
+"""
+import io
+import struct
+from collections import deque
+
+from .Card import CARD_NAMES, CARD_ID
+from .Game import Game
+
+
+MAGIC = b"QLOG\x01"
+
+SEED, DEAL, PLAY, DRAW, TURN, RECYCLE, EFFECT, END = range(1, 9)
+EVENT_NAMES = {SEED: "seed", DEAL: "deal", PLAY: "play", DRAW: "draw", TURN: "turn",
+               RECYCLE: "recycle", EFFECT: "effect", END: "end"}
+
+_SEED = struct.Struct("<BQ")
+_DEAL = struct.Struct("<BBBH")
+_CARD = struct.Struct("<BBB")
+_TURN = struct.Struct("<BB")
+_LIST = struct.Struct("<BH")
+_EFFECT = struct.Struct("<BBBB")
+_END = struct.Struct("<Bb")
+
+# size of every event without its card list
+_SIZES = {SEED: _SEED.size, DEAL: _DEAL.size, PLAY: _CARD.size, DRAW: _CARD.size,
+          TURN: _TURN.size, RECYCLE: _LIST.size, EFFECT: _EFFECT.size, END: _END.size}
+
+
+class Replay_error(ValueError):
+    """The log does not match what the game allows at that point."""
+
+
+class Game_log:
+    """
+    Writes the events of games to a binary stream opened for appending.
+
+    Events are buffered and written by flush(), at the end of every game and
+    on close(); used as a context manager it closes itself. Set game.log to
+    an instance to record a game.
+    """
+
+    def __init__(self, stream, moves=True, flush_bytes=1 << 16):
+        self.stream = stream
+        self.moves = moves
+        self.flush_bytes = flush_bytes
+        self.buffer = bytearray()
+        if stream.tell() == 0:
+            self.buffer += MAGIC
+
+    def seed(self, seed):
+        self.buffer += _SEED.pack(SEED, seed & 0xFFFFFFFFFFFFFFFF)
+
+    def deal(self, draw_pile, num_players, cards_per_player):
+        if self.moves:
+            self.buffer += _DEAL.pack(DEAL, num_players, cards_per_player, len(draw_pile))
+            self.buffer += bytes(CARD_ID[card] for card in draw_pile)
+
+    def play(self, seat, card_name):
+        if self.moves:
+            self.buffer += _CARD.pack(PLAY, seat, CARD_ID[card_name])
+
+    def draw(self, seat, card_name):
+        if self.moves:
+            self.buffer += _CARD.pack(DRAW, seat, CARD_ID[card_name])
+
+    def turn(self, seat):
+        if self.moves:
+            self.buffer += _TURN.pack(TURN, seat)
+
+    def recycle(self, card_names):
+        if self.moves:
+            self.buffer += _LIST.pack(RECYCLE, len(card_names))
+            self.buffer += bytes(CARD_ID[card] for card in card_names)
+
+    def effect(self, seat, card_name, argument=0):
+        if self.moves:
+            self.buffer += _EFFECT.pack(EFFECT, seat, CARD_ID[card_name], argument)
+
+    def end(self, winner):
+        self.buffer += _END.pack(END, winner)
+        if len(self.buffer) >= self.flush_bytes:
+            self.flush()
+
+    def flush(self):
+        self.stream.write(self.buffer)
+        self.stream.flush()
+        self.buffer.clear()
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_events(data):
+    """Yield (type, fields) for every event in a log's bytes. Raises
+    Replay_error on an unknown event or one cut off by the end of the data."""
+    if not data.startswith(MAGIC):
+        raise Replay_error("not a game log")
+    pos = len(MAGIC)
+    end = len(data)
+    while pos < end:
+        kind = data[pos]
+        size = _SIZES.get(kind)
+        if size is None:
+            raise Replay_error(f"unknown event type {kind} at byte {pos}")
+        if pos + size > end:
+            raise Replay_error(f"log ends inside the {EVENT_NAMES[kind]} event at byte {pos}")
+        if kind in (PLAY, DRAW):
+            _, seat, card = _CARD.unpack_from(data, pos)
+            pos += _CARD.size
+            yield kind, (seat, card)
+        elif kind == TURN:
+            yield kind, (data[pos + 1],)
+            pos += _TURN.size
+        elif kind == DEAL:
+            _, players, per_player, n = _DEAL.unpack_from(data, pos)
+            if pos + _DEAL.size + n > end:
+                raise Replay_error(f"log ends inside the deal event at byte {pos}")
+            pos += _DEAL.size
+            yield kind, (players, per_player, bytes(data[pos:pos + n]))
+            pos += n
+        elif kind == RECYCLE:
+            _, n = _LIST.unpack_from(data, pos)
+            if pos + _LIST.size + n > end:
+                raise Replay_error(f"log ends inside the recycle event at byte {pos}")
+            pos += _LIST.size
+            yield kind, (bytes(data[pos:pos + n]),)
+            pos += n
+        elif kind == EFFECT:
+            yield kind, _EFFECT.unpack_from(data, pos)[1:]
+            pos += _EFFECT.size
+        elif kind == SEED:
+            yield kind, (_SEED.unpack_from(data, pos)[1],)
+            pos += _SEED.size
+        elif kind == END:
+            yield kind, (_END.unpack_from(data, pos)[1],)
+            pos += _END.size
+
+
+def read_games(path):
+    """Yield the event list of every complete game in a log file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    events = []
+    for event in iter_events(data):
+        events.append(event)
+        if event[0] == END:
+            yield events
+            events = []
+
+
+class _Logged_order:
+    """rng of a replayed game: shuffle() puts the discards in the order of the
+    next RECYCLE event, for reshuffles that happen inside an effect."""
+
+    def __init__(self, events):
+        self.events = events
+        self.pos = 0
+
+    def shuffle(self, cards):
+        for pos in range(self.pos, len(self.events)):
+            kind, fields = self.events[pos]
+            if kind == RECYCLE:
+                order = [CARD_NAMES[card] for card in fields[0]]
+                if sorted(order) != sorted(cards):
+                    raise Replay_error(f"event {pos}: recycled cards do not match the table")
+                cards[:] = order
+                self.pos = pos + 1
+                return
+        raise Replay_error("reshuffle without a RECYCLE event in the log")
+
+
+def replay_game(events, until=None):
+    """
+    Rebuild the Game described by a game's events.
+
+    until stops after that many events, giving the state at any point of the
+    game; a play and the events of its effect are applied together. Raises
+    Replay_error if an event is not possible in the rebuilt state.
+    """
+    order = _Logged_order(events)
+    game = Game(rng=order, verbose=False)
+    game.replay_seed = None
+    game.replay_winner = None
+    capture = Game_log(io.BytesIO())
+    number = 0
+    while number < len(events) and (until is None or number < until):
+        kind, fields = events[number]
+        if kind == PLAY:
+            seat, card = fields
+            order.pos = number
+            game.log = capture
+            played = game.play_card(CARD_NAMES[card], game.players[seat])
+            game.log = None
+            if not played:
+                raise Replay_error(f"event {number}: seat {seat} cannot play {CARD_NAMES[card]}")
+            caused = list(iter_events(bytes(capture.buffer)))[1:]
+            del capture.buffer[len(MAGIC):]
+            if events[number + 1:number + 1 + len(caused)] != caused:
+                raise Replay_error(f"event {number}: effect of {CARD_NAMES[card]} does not match the log")
+            number += len(caused)
+        elif kind == DRAW:
+            seat, card = fields
+            drawn = game.draw_card(game.players[seat])
+            if drawn != CARD_NAMES[card]:
+                raise Replay_error(f"event {number}: seat {seat} drew {drawn}, log says {CARD_NAMES[card]}")
+        elif kind == TURN:
+            game.advance_turn()
+            if game.current_idx != fields[0]:
+                raise Replay_error(f"event {number}: seat {game.current_idx} to move, log says {fields[0]}")
+        elif kind == RECYCLE:
+            recycled = [CARD_NAMES[card] for card in fields[0]]
+            if sorted(game.table_cards.take_below_top()) != sorted(recycled):
+                raise Replay_error(f"event {number}: recycled cards do not match the table")
+            game.shuffled_deck.extend(recycled)
+        elif kind == DEAL:
+            players, per_player, pile = fields
+            game.deck = [CARD_NAMES[card] for card in pile]
+            game.shuffled_deck = deque(game.deck)
+            game.deal_cards(players, per_player)
+        elif kind == SEED:
+            game.replay_seed = fields[0]
+        elif kind == END:
+            game.replay_winner = fields[0]
+        elif kind == EFFECT:
+            raise Replay_error(f"event {number}: effect without a play")
+        number += 1
+    return game
@@ -0,0 +1,143 @@
+"""
+Columnar store for simulation results.
+
+Per-game records are fixed-width NumPy structured rows (RECORD_DTYPE) with the
+fields of Batch.SUMMARY_FIELDS: one play counter per suit in SUITS and per
+special in SPECIALS plus superconduction. Results_writer appends them to a raw
+binary file in chunks and keeps a small JSON sidecar with the dtype and row
+count; Results_reader memory-maps the file, so aggregates over billions of rows
+run chunk by chunk in NumPy without loading the rows as Python objects.
+
+example use
+    with Results_writer("run.bin") as out:
+        run_batch(policies, n=10**7, on_rows=out.add_rows)
+    reader = Results_reader("run.bin")
+    reader.win_counts(3), reader.mean("turns")
+"""
+import json
+import os
+
+import numpy as np
+
+from .Batch import SUMMARY_FIELDS, summarize
+
+
+PLAY_FIELDS = [name for name in SUMMARY_FIELDS if name.startswith("plays_")]
+
+# Counters are 32-bit: a game with max_turns above 65535 must not wrap
+FIELD_TYPES = {"seed": "<u8", "winner": "i1"}
+RECORD_DTYPE = np.dtype([(name, FIELD_TYPES.get(name, "<u4")) for name in SUMMARY_FIELDS])
+
+
+def _sidecar(path):
+    return path + ".json"
+
+
+class Results_writer:
+    """Appends records to path in chunks of chunk_rows; use as a context manager."""
+
+    def __init__(self, path, chunk_rows=1 << 16):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.buffer = np.zeros(chunk_rows, dtype=RECORD_DTYPE)
+        self.buffered = 0
+        self.rows = 0
+        if os.path.exists(_sidecar(path)):
+            with open(_sidecar(path)) as f:
+                meta = json.load(f)
+            if np.dtype([tuple(field) for field in meta["dtype"]]) != RECORD_DTYPE:
+                raise ValueError(f"{path} was written with other record fields")
+            self.rows = meta["rows"]
+            size = os.path.getsize(path) if os.path.exists(path) else None
+            if size is None or size < self.rows * RECORD_DTYPE.itemsize:
+                raise ValueError(f"{_sidecar(path)} counts {self.rows} rows but {path} "
+                                 f"{'is missing' if size is None else 'is shorter'}")
+        elif os.path.exists(path) and os.path.getsize(path):
+            raise ValueError(f"{path} exists but has no {_sidecar(path)}")
+        self.file = open(path, "ab")
+        # drop rows written after the last sidecar update; never pads the file
+        self.file.truncate(self.rows * RECORD_DTYPE.itemsize)
+
+    def add(self, result):
+        """Add one Game_result from the engine."""
+        record = self.buffer[self.buffered]
+        for name, value in zip(SUMMARY_FIELDS, summarize(result._replace(seed=result.seed or 0))):
+            record[name] = value
+        self.buffered += 1
+        if self.buffered == self.chunk_rows:
+            self.flush()
+
+    def add_rows(self, rows):
+        """Add packed summary rows as produced by Batch.run_chunk."""
+        table = np.frombuffer(rows, dtype=np.int64).reshape(-1, len(SUMMARY_FIELDS))
+        start = 0
+        while start < len(table):
+            take = min(self.chunk_rows - self.buffered, len(table) - start)
+            part = self.buffer[self.buffered:self.buffered + take]
+            for column, name in enumerate(SUMMARY_FIELDS):
+                part[name] = table[start:start + take, column]
+            self.buffered += take
+            start += take
+            if self.buffered == self.chunk_rows:
+                self.flush()
+
+    def flush(self):
+        """Write the buffered records and update the sidecar."""
+        if self.buffered:
+            self.file.write(self.buffer[:self.buffered].tobytes())
+            self.file.flush()
+            self.rows += self.buffered
+            self.buffered = 0
+        with open(_sidecar(self.path), "w") as f:
+            json.dump({"dtype": RECORD_DTYPE.descr, "rows": self.rows}, f)
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Results_reader:
+    """Read-only memory map of a results file; records is a structured array."""
+
+    def __init__(self, path):
+        with open(_sidecar(path)) as f:
+            meta = json.load(f)
+        self.dtype = np.dtype([tuple(field) for field in meta["dtype"]])
+        self.rows = meta["rows"]
+        if self.rows:
+            self.records = np.memmap(path, dtype=self.dtype, mode="r", shape=(self.rows,))
+        else:
+            self.records = np.zeros(0, dtype=self.dtype)
+
+    def __len__(self):
+        return self.rows
+
+    def chunks(self, chunk_rows=1 << 22):
+        """Yield consecutive slices of at most chunk_rows records."""
+        for start in range(0, self.rows, chunk_rows):
+            yield self.records[start:start + chunk_rows]
+
+    def column_sum(self, name, chunk_rows=1 << 22):
+        return int(sum(int(chunk[name].sum(dtype=np.int64)) for chunk in self.chunks(chunk_rows)))
+
+    def mean(self, name, chunk_rows=1 << 22):
+        return self.column_sum(name, chunk_rows) / self.rows if self.rows else 0.0
+
+    def win_counts(self, num_players, chunk_rows=1 << 22):
+        """Wins per seat; the last entry counts games without a winner."""
+        counts = np.zeros(num_players + 1, dtype=np.int64)
+        for chunk in self.chunks(chunk_rows):
+            # winner -1 lands in the last bin
+            counts += np.bincount(chunk["winner"].astype(np.int64) % (num_players + 1),
+                                  minlength=num_players + 1)
+        return counts.tolist()
+
+    def play_totals(self, chunk_rows=1 << 22):
+        """Total plays per suit and special kind."""
+        return {name: self.column_sum(name, chunk_rows) for name in PLAY_FIELDS}
@@ -0,0 +1,493 @@
+"""
+Asyncio game server hosting many tables at once.
+
+Clients talk newline-delimited JSON over TCP, one object per line. After the
+game starts the server only pushes deltas: what changed because of the last
+move, not the whole state. Each table is a plain Game whose log hook is a
+Table_feed, so the deltas come from the same events that Replay records.
+
+client -> server
+    {"op": "join", "name": "ann"}       sit down at the first table with a free seat
+    {"op": "play", "card": "C_3"}
+    {"op": "draw"}
+    {"op": "stats"}                      server load, answered with a "stats" message
+
+server -> client
+    {"ev": "joined", "table": 4, "seat": 1, "seats": 3}
+    {"ev": "start", "seat": 1, "hand": [...], "top": "C_3", "pile": 19,
+     "hands": [7, 7, 7], "turn": 0, "names": [...]}     once, when the table is full
+    {"ev": "played", "seat": 0, "card": "C_5"}
+    {"ev": "drew", "seat": 0, "card": "T_2"}             the card only goes to seat 0
+    {"ev": "hand", "seat": 0, "count": 6}                hand size changed
+    {"ev": "cards", "hand": [...]}                       own hand replaced (teleportation)
+    {"ev": "effect", "seat": 0, "card": "C_sp", "target": 0}
+    {"ev": "pile", "count": 23}                          discards shuffled back
+    {"ev": "turn", "seat": 2, "playable": [...]}         playable only for the seat to move
+    {"ev": "end", "winner": 2}                           -1 when a player left
+    {"ev": "error", "msg": "..."}
+    {"ev": "stats", "tables": 12, "clients": 36, "games_finished": 40, "moves": 1904,
+     "rss_kb": 31200}
+
+All deltas of one move are written to each client in a single write. A
+move of one client writes to the others without waiting for them, so a
+client whose unsent output grows past max_buffer bytes is disconnected, and
+one that does not take its own replies within drain_timeout seconds too.
+
+example use
+    server = Game_server(port=8765)
+    asyncio.run(server.serve_forever())
+"""
+import asyncio
+import itertools
+import json
+import os
+import random
+
+from .Card import CARD_ID, CARD_PARTS, TELEPORTATION
+from .Game import Game
+
+
+def encode(message):
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def memory_kb():
+    """Resident set size of this process in kB, or the peak size without /proc."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        try:
+            import resource
+        except ImportError:
+            return None
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class Table_feed:
+    """
+    Game log hook of one table: turns the game's events into per-seat deltas.
+
+    Messages are queued in outbox (one list per seat) until Table.flush sends
+    them.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.outbox = [[] for _ in range(table.seats)]
+
+    def _all(self, message):
+        for box in self.outbox:
+            box.append(message)
+
+    def _hand(self, seat):
+        self._all({"ev": "hand", "seat": seat, "count": len(self.table.game.players[seat].hand)})
+
+    def deal(self, draw_pile, num_players, cards_per_player):
+        pass  # the deal is sent as one "start" snapshot
+
+    def play(self, seat, card_name):
+        self._all({"ev": "played", "seat": seat, "card": card_name})
+        self._hand(seat)
+
+    def draw(self, seat, card_name):
+        for other, box in enumerate(self.outbox):
+            message = {"ev": "drew", "seat": seat}
+            if other == seat:
+                message["card"] = card_name
+            box.append(message)
+        self._hand(seat)
+
+    def turn(self, seat):
+        self._all({"ev": "turn", "seat": seat})
+
+    def recycle(self, card_names):
+        self._all({"ev": "pile", "count": len(self.table.game.shuffled_deck)})
+
+    def effect(self, seat, card_name, argument=0):
+        self._all({"ev": "effect", "seat": seat, "card": card_name, "target": argument})
+        if CARD_PARTS[CARD_ID[card_name]][1] == TELEPORTATION and argument != seat:
+            for swapped in (seat, argument):
+                self.outbox[swapped].append({"ev": "cards",
+                                             "hand": list(self.table.game.players[swapped].hand)})
+                self._hand(swapped)
+
+    def end(self, winner):
+        self._all({"ev": "end", "winner": winner})
+
+
+class Table:
+    """One game and the connections seated at it."""
+
+    def __init__(self, table_id, seats=3, cards_per_player=7, rng=None):
+        self.id = table_id
+        self.seats = seats
+        self.cards_per_player = cards_per_player
+        self.clients = [None] * seats  # seat -> Connection
+        self.names = [None] * seats
+        self.game = Game(rng=rng, verbose=False)
+        self.feed = Table_feed(self)
+        self.started = False
+        self.finished = False
+        self.moves = 0
+
+    def free_seat(self):
+        if self.started:
+            return None
+        for seat, client in enumerate(self.clients):
+            if client is None:
+                return seat
+        return None
+
+    def sit(self, client, name):
+        seat = self.free_seat()
+        self.clients[seat] = client
+        self.names[seat] = name
+        client.send({"ev": "joined", "table": self.id, "seat": seat, "seats": self.seats})
+        if self.free_seat() is None:
+            self.start()
+        return seat
+
+    def start(self):
+        game = self.game
+        game.init_and_shuffle_deck()
+        game.deal_cards(self.seats, self.cards_per_player)
+        game.log = self.feed
+        self.started = True
+        hands = [len(player.hand) for player in game.players]
+        for seat, client in enumerate(self.clients):
+            client.send({"ev": "start", "seat": seat, "hand": game.players[seat].hand,
+                         "top": game.top_card(), "pile": len(game.shuffled_deck),
+                         "hands": hands, "turn": game.current_idx, "names": self.names})
+        self._announce_turn()
+
+    def playable(self, seat):
+        return self.game.playable_cards(self.game.players[seat])
+
+    def _announce_turn(self):
+        seat = self.game.current_idx
+        self.clients[seat].send({"ev": "turn", "seat": seat, "playable": self.playable(seat)})
+
+    def play(self, seat, card_name):
+        """Play card_name for seat. Return an error message, or None."""
+        error = self._check_turn(seat)
+        if error is None and card_name not in self.playable(seat):
+            error = f"{card_name} cannot be played on {self.game.top_card()}"
+        if error is not None:
+            return error
+        player = self.game.players[seat]
+        self.game.play_card(card_name, player)
+        if not player.hand:
+            self._finish(seat)
+        else:
+            self._next_turn()
+        return None
+
+    def draw(self, seat):
+        """Draw a card for seat and pass the turn. Return an error message, or None."""
+        error = self._check_turn(seat)
+        if error is not None:
+            return error
+        self.game.draw_card(self.game.players[seat])
+        self._next_turn()
+        return None
+
+    def _check_turn(self, seat):
+        if not self.started or self.finished:
+            return "the game is not running"
+        if seat != self.game.current_idx:
+            return "not your turn"
+        return None
+
+    def _next_turn(self):
+        self.moves += 1
+        self.game.advance_turn()
+        # the seat to move gets its copy of the turn delta with the playable cards
+        seat = self.game.current_idx
+        box = self.feed.outbox[seat]
+        box[-1] = dict(box[-1], playable=self.playable(seat))
+        self.flush()
+
+    def _finish(self, winner):
+        self.moves += 1
+        self.finished = True
+        self.feed.end(winner)
+        self.flush()
+
+    def leave(self, seat):
+        self.clients[seat] = None
+        self.names[seat] = None
+        if self.started and not self.finished:
+            self._finish(-1)
+
+    def flush(self):
+        """Send every queued delta, one write per client."""
+        for seat, box in enumerate(self.feed.outbox):
+            if box:
+                client = self.clients[seat]
+                if client is not None:
+                    client.send_many(box)
+                box.clear()
+
+
+class Connection:
+    """Write side of one client socket. The connection is aborted once more
+    than max_buffer bytes wait to be sent."""
+
+    def __init__(self, writer, max_buffer=1 << 20):
+        self.writer = writer
+        self.max_buffer = max_buffer
+        self.table = None
+        self.seat = None
+
+    def _write(self, data):
+        writer = self.writer
+        if writer.is_closing():
+            return
+        writer.write(data)
+        if writer.transport.get_write_buffer_size() > self.max_buffer:
+            # the client stopped reading; its reader sees the end and the seat is left
+            writer.transport.abort()
+
+    def send(self, message):
+        self._write(encode(message))
+
+    def send_many(self, messages):
+        self._write(b"".join(encode(message) for message in messages))
+
+
+class Game_server:
+    """
+    Hosts tables of seats players; a table starts as soon as it is full and
+    is dropped when its game ends.
+
+    port=0 picks a free port; it is in self.port once start() returned.
+    max_buffer and drain_timeout bound what a slow client can cost, see
+    Connection.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, seats=3, cards_per_player=7, seed=None,
+                 max_buffer=1 << 20, drain_timeout=10.0):
+        self.host = host
+        self.port = port
+        self.seats = seats
+        self.cards_per_player = cards_per_player
+        self.max_buffer = max_buffer
+        self.drain_timeout = drain_timeout
+        self.rng = random.Random(seed)
+        self.tables = {}
+        self.open_table = None
+        self.table_ids = itertools.count(1)
+        self.server = None
+        self.games_finished = 0
+        self.moves_finished = 0  # moves of tables already dropped
+        self.clients = 0
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._serve_client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def _seat(self, client, name):
+        table = self.open_table
+        if table is None or table.free_seat() is None:
+            table_id = next(self.table_ids)
+            table = Table(table_id, self.seats, self.cards_per_player,
+                          rng=random.Random(self.rng.getrandbits(64)))
+            self.tables[table_id] = table
+            self.open_table = table
+        client.table = table
+        client.seat = table.sit(client, name)
+        if table.started:
+            self.open_table = None
+
+    def _drop_if_finished(self, table):
+        if table.finished and self.tables.pop(table.id, None) is not None:
+            self.games_finished += 1
+            self.moves_finished += table.moves
+
+    def stats(self):
+        return {"ev": "stats", "tables": len(self.tables), "clients": self.clients,
+                "games_finished": self.games_finished,
+                "moves": self.moves_finished + sum(table.moves for table in self.tables.values()),
+                "rss_kb": memory_kb()}
+
+    def _handle(self, client, message):
+        if not isinstance(message, dict):
+            return "a message must be a JSON object"
+        op = message.get("op")
+        table = client.table
+        if op == "stats":
+            client.send(self.stats())
+            return None
+        if op == "join":
+            if table is not None and not table.finished:
+                return "already seated"
+            self._seat(client, str(message.get("name", "")))
+            return None
+        if table is None:
+            return "join a table first"
+        if op == "play":
+            error = table.play(client.seat, message.get("card"))
+        elif op == "draw":
+            error = table.draw(client.seat)
+        else:
+            return f"unknown op {op!r}"
+        self._drop_if_finished(table)
+        return error
+
+    async def _serve_client(self, reader, writer):
+        client = Connection(writer, self.max_buffer)
+        self.clients += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # line over the stream limit; readline already dropped it
+                    client.send({"ev": "error", "msg": "line too long"})
+                    continue
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    client.send({"ev": "error", "msg": "bad json"})
+                    continue
+                try:
+                    error = self._handle(client, message)
+                except Exception as exc:
+                    # a request that breaks must not end the game for the other seats
+                    error = f"request failed: {type(exc).__name__}"
+                if error is not None:
+                    client.send({"ev": "error", "msg": error})
+                await asyncio.wait_for(writer.drain(), self.drain_timeout)
+        except (ConnectionError, asyncio.TimeoutError):
+            pass
+        finally:
+            table = client.table
+            if table is not None:
+                table.leave(client.seat)
+                self._drop_if_finished(table)
+            self.clients -= 1
+            writer.close()
+
+
+class Client:
+    """
+    Asyncio client keeping the view one seat has of its table, built from
+    the server's deltas.
+    """
+
+    def __init__(self, name=""):
+        self.name = name
+        self.reader = None
+        self.writer = None
+        self.table = None
+        self.seat = None
+        self.hand = []
+        self.top = None
+        self.pile = 0
+        self.hands = []
+        self.turn = None
+        self.playable = []
+        self.winner = None
+        self.errors = []
+
+    async def connect(self, host="127.0.0.1", port=8765):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        return self
+
+    def send(self, message):
+        self.writer.write(encode(message))
+
+    async def join(self):
+        self.send({"op": "join", "name": self.name})
+        await self.writer.drain()
+
+    async def play(self, card_name):
+        self.send({"op": "play", "card": card_name})
+        await self.writer.drain()
+
+    async def draw(self):
+        self.send({"op": "draw"})
+        await self.writer.drain()
+
+    async def receive(self):
+        """Read and apply one message; return it, or None when the server closed."""
+        line = await self.reader.readline()
+        if not line:
+            return None
+        message = json.loads(line)
+        self.apply(message)
+        return message
+
+    def apply(self, message):
+        ev = message["ev"]
+        if ev == "played":
+            self.top = message["card"]
+            if message["seat"] == self.seat:
+                self.hand.remove(message["card"])
+        elif ev == "drew":
+            if "card" in message:
+                self.hand.append(message["card"])
+            self.pile = max(0, self.pile - 1)
+        elif ev == "hand":
+            self.hands[message["seat"]] = message["count"]
+        elif ev == "cards":
+            self.hand = message["hand"]
+        elif ev == "pile":
+            self.pile = message["count"]
+        elif ev == "turn":
+            self.turn = message["seat"]
+            self.playable = message.get("playable", [])
+        elif ev == "start":
+            self.seat = message["seat"]
+            self.hand = message["hand"]
+            self.top = message["top"]
+            self.pile = message["pile"]
+            self.hands = message["hands"]
+            self.turn = message["turn"]
+        elif ev == "joined":
+            self.table = message["table"]
+            self.seat = message["seat"]
+            self.winner = None
+        elif ev == "end":
+            self.winner = message["winner"]
+        elif ev == "error":
+            self.errors.append(message["msg"])
+
+    def my_turn(self):
+        return self.turn == self.seat and self.winner is None
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Host card game tables.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seats", type=int, default=3)
+    args = parser.parse_args()
+    server = Game_server(args.host, args.port, seats=args.seats)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,168 @@
+"""
+Zobrist hashing of Game states and a bounded transposition table.
+
+A state hash covers the table card, every hand as a multiset, the draw pile
+size, the seat to move and the turn-order flags set by special cards. It is
+kept up to date incrementally: Game calls the hasher on every play, draw,
+reshuffle, effect, turn change and rollback, and each call only XORs a few
+64-bit keys in or out.
+
+Hands are hashed per seat without regard to order: the k-th copy of a card in
+a hand has its own key, so duplicated decks work. Each seat's hand hash is
+multiplied by an odd per-seat constant before it is XORed into the total, so
+moving a whole hand to another seat is also O(1).
+
+example use
+    game.enable_hashing()
+    table = Transposition_table(1 << 16, policy="depth")
+    entry = table.get(game.hasher.value)
+"""
+import random
+
+
+MASK = (1 << 64) - 1
+
+# Turn-order flags, indices into Zobrist_keys.flags
+REVERSED, SKIP_NEXT, EXTRA_TURN = range(3)
+
+
+class Zobrist_keys:
+    """Random 64-bit keys shared by every hasher; the same seed gives the same hashes."""
+
+    def __init__(self, num_cards, max_players=8, max_copies=8, max_pile=512, seed=0x5EED):
+        rng = random.Random(seed)
+        bits = lambda: rng.getrandbits(64)
+        self.table = [bits() for _ in range(num_cards)]
+        self.cards = [[bits() for _ in range(max_copies)] for _ in range(num_cards)]
+        self.seat_mult = [bits() | 1 for _ in range(max_players)]
+        self.turn = [bits() for _ in range(max_players)]
+        self.pile = [bits() for _ in range(max_pile + 1)]
+        self.flags = [bits() for _ in range(3)]
+
+    def covers(self, num_cards, num_players, max_copies, max_pile):
+        """Return True if these keys can hash a game of that size."""
+        return (num_cards <= len(self.table) and num_players <= len(self.seat_mult)
+                and max_copies <= len(self.cards[0]) and max_pile < len(self.pile))
+
+
+class Zobrist_hasher:
+    """
+    Incremental hash of one game. value is the current 64-bit hash.
+
+    Game drives it through card_added, card_removed, top_changed,
+    pile_changed, turn_changed, flag_toggled and hands_swapped.
+    """
+
+    def __init__(self, keys, num_players):
+        self.keys = keys
+        self.hand_hash = [0] * num_players
+        self.counts = [{} for _ in range(num_players)]  # seat -> {card_id: copies}
+        self.value = 0
+
+    def _set_hand(self, seat, new_hash):
+        mult = self.keys.seat_mult[seat]
+        self.value ^= ((self.hand_hash[seat] * mult) & MASK) ^ ((new_hash * mult) & MASK)
+        self.hand_hash[seat] = new_hash
+
+    def card_added(self, seat, card_id):
+        counts = self.counts[seat]
+        copy = counts.get(card_id, 0)
+        counts[card_id] = copy + 1
+        self._set_hand(seat, self.hand_hash[seat] ^ self.keys.cards[card_id][copy])
+
+    def card_removed(self, seat, card_id):
+        counts = self.counts[seat]
+        copy = counts[card_id] - 1
+        if copy:
+            counts[card_id] = copy
+        else:
+            del counts[card_id]
+        self._set_hand(seat, self.hand_hash[seat] ^ self.keys.cards[card_id][copy])
+
+    def top_changed(self, old_id, new_id):
+        if old_id is not None:
+            self.value ^= self.keys.table[old_id]
+        if new_id is not None:
+            self.value ^= self.keys.table[new_id]
+
+    def pile_changed(self, old_size, new_size):
+        self.value ^= self.keys.pile[old_size] ^ self.keys.pile[new_size]
+
+    def turn_changed(self, old_seat, new_seat):
+        self.value ^= self.keys.turn[old_seat] ^ self.keys.turn[new_seat]
+
+    def flag_toggled(self, flag):
+        self.value ^= self.keys.flags[flag]
+
+    def hands_swapped(self, seat_a, seat_b):
+        hash_a, hash_b = self.hand_hash[seat_a], self.hand_hash[seat_b]
+        self._set_hand(seat_a, hash_b)
+        self._set_hand(seat_b, hash_a)
+        self.counts[seat_a], self.counts[seat_b] = self.counts[seat_b], self.counts[seat_a]
+
+
+class Transposition_table:
+    """
+    Fixed-size table of (hash, depth, value) entries, indexed by hash % capacity.
+
+    policy decides what happens when a slot is taken by another position:
+    "always" replaces it, "depth" keeps whichever entry has the greater depth
+    (ties go to the newer entry). Depth is whatever the caller uses to rank how
+    much work went into a value, e.g. search depth or number of rollouts.
+    """
+
+    POLICIES = ("always", "depth")
+
+    def __init__(self, capacity=1 << 16, policy="depth"):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}")
+        self.capacity = capacity
+        self.policy = policy
+        self.slots = [None] * capacity
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replacements = 0
+        self.rejections = 0
+
+    def get(self, key):
+        """Return (depth, value) stored for key, or None."""
+        entry = self.slots[key % self.capacity]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1], entry[2]
+        self.misses += 1
+        return None
+
+    def put(self, key, depth, value):
+        """Store value for key unless the replacement policy keeps the old entry."""
+        index = key % self.capacity
+        entry = self.slots[index]
+        if entry is not None and entry[0] != key:
+            if self.policy == "depth" and depth < entry[1]:
+                self.rejections += 1
+                return False
+            self.replacements += 1
+        self.slots[index] = (key, depth, value)
+        self.stores += 1
+        return True
+
+    def add(self, key, depth, value):
+        """Add depth and value, a tuple summed element by element, to the entry
+        for key; store them as a new entry if key has none."""
+        entry = self.slots[key % self.capacity]
+        if entry is not None and entry[0] == key:
+            depth += entry[1]
+            value = tuple(old + new for old, new in zip(entry[2], value))
+        return self.put(key, depth, value)
+
+    def clear(self):
+        self.slots = [None] * self.capacity
+
+    def stats(self):
+        used = sum(1 for entry in self.slots if entry is not None)
+        return {"capacity": self.capacity, "used": used, "hits": self.hits,
+                "misses": self.misses, "stores": self.stores,
+                "replacements": self.replacements, "rejections": self.rejections}
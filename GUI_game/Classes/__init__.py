@@ -0,0 +1,8 @@
+"""
+Rendering-free core of the game: cards and rules (Card), deck and table
+(Game), hands (Player) and the headless engine and simulators built on them.
+
+Nothing in this package imports tkinter or PIL, so simulations, workers and
+tests can load it without a display. The GUI lives in GUI.py and is only
+imported by main.py when a window is opened.
+"""
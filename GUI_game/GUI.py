@@ -9,11 +9,20 @@ This module provides a set of GUI classes for a card game interface using Tkinte
 It includes classes for image loading and caching, creating the main game window, drawing table 
 elements, displaying card decks and player cards, and building interactive buttons.
 
+Everything is drawn on one table canvas: cards, decks, names and buttons are canvas items, not
+widgets, and clicks are hit-tested on the canvas.
+
 Classes
 --------
 ImageLoader
     Handles image loading, resizing, and caching of card images.
 
+Table_canvas
+    The single canvas of the window; holds card sprites, dispatches clicks and scales with the window.
+
+Animator
+    Moves sprites along tweens from one frame timer with a per-frame time budget.
+
 GUI
     Creates and manages the main game window, player labels, and table visuals.
 
@@ -35,24 +44,58 @@ Display_player_cards
 
 
 import tkinter as tk
-import os, random
+import os, random, json, time
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageTk
 from tkinter import simpledialog
 
+import metrics
+
+# card art lives next to this file, wherever the game is started from
+VISUALS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "visuals")
+
 
 class ImageLoader:
     """
     Loads and caches card images for use in Tkinter.
 
+    The cache is bounded: once it holds ``max_entries`` images the least
+    recently used one is evicted. When created with a Tk ``root`` and
+    ``workers`` > 0 the loader can also decode images asynchronously: the
+    PNG is opened, resized and flattened in a thread pool and only the
+    ``PhotoImage`` is built on the Tk main thread.
+
+    Images are not resized from the full-size PNG for every size asked for.
+    Each image has a pyramid of prescaled levels: the card atlas sizes, or
+    for other images the source halved until it is small, built once. A
+    request takes the smallest level at least as large and resizes it with a
+    bilinear filter, which costs little because it never shrinks by more
+    than half. Only sizes above every level still go to the source.
+
     Attributes
     ----------
     bg_color : tuple
         Background color (R, G, B) used to fill transparent regions.
-    cache : dict
-        Dictionary used to store cached images to prevent redundant loading.
+    cache : OrderedDict
+        Cached images keyed by (path, size), ordered from least to most
+        recently used.
+    max_entries : int
+        Maximum number of images kept in the cache.
+    hits, misses, evictions : int
+        Cache counters since the loader was created.
+    bytes_held : int
+        Approximate pixel memory (RGB) of the images currently cached.
+    pyramids : dict
+        Path -> levels built from the source image, smallest first.
     """
     
-    def __init__(self, bg_color=(0, 128, 0)):
+    poll_ms = 15        # how often the main thread collects finished decodes
+    pyramid_max = 640   # longest side of the largest level built from a source
+    pyramid_min = 48    # levels are built down to this longest side
+
+    def __init__(self, bg_color=(0, 128, 0), max_entries=128, root=None, workers=0):
         """
         Initialize the ImageLoader with a default background color.
 
@@ -60,10 +103,32 @@ class ImageLoader:
         ----------
         bg_color : tuple, optional
             RGB tuple for the background color, by default (0, 128, 0).
+        max_entries : int, optional
+            Maximum number of cached images, by default 128.
+        root : tk.Tk, optional
+            Main window; required for asynchronous loading.
+        workers : int, optional
+            Size of the decoding thread pool, by default 0 (synchronous only).
         """
         
-        self.bg_color = bg_color
-        self.cache = {}
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.root        = root
+        self.executor    = ThreadPoolExecutor(max_workers=workers) if root is not None and workers > 0 else None
+        self.pending     = {}              # key -> callbacks waiting for the image
+        self.finished    = queue.Queue()   # (key, PIL image or exception) from workers
+        self.polling     = False
+        self.placeholders = {}
+        self.atlas_sheet = None
+        self.atlas       = {}              # path -> [(size, crop box in atlas_sheet)], smallest first
+        self.pyramids    = {}
+        self.bg_color    = bg_color
+        self.cache       = OrderedDict()
+        self.max_entries = max_entries
+        self.hits        = 0
+        self.misses      = 0
+        self.evictions   = 0
+        self.bytes_held  = 0
 
     def load_card_image(self, path, size):
         """
@@ -84,18 +149,696 @@ class ImageLoader:
         
         size = tuple(size) 
         key = (path, size)
-        if key in self.cache:
-            return self.cache[key]
-    
-        img = Image.open(path).resize(size, Image.LANCZOS)
+        tk_img = self.cache.get(key)
+        if tk_img is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return tk_img
+
+        self.misses += 1
+        tk_img = ImageTk.PhotoImage(self._prepare_image(path, size))
+        self._store(key, tk_img)
+        return tk_img
+
+    def request_card_image(self, path, size, callback=None):
+        """
+        Return an image now, decoding it in the background if it is not cached.
+
+        Without a thread pool this is the same as ``load_card_image``. Otherwise
+        a cache miss returns a placeholder of the right size, and ``callback``
+        is called on the Tk main thread with the real image once it is ready.
+
+        Parameters
+        ----------
+        path : str
+            Path to the image file.
+        size : tuple of int
+            Desired (width, height) of the image.
+        callback : callable, optional
+            Function(tk_img) called when a placeholder was returned.
+
+        Returns
+        -------
+        ImageTk.PhotoImage or tk.PhotoImage
+            The cached image, or a placeholder while it is being decoded.
+        """
+        
+        size = tuple(size)
+        key = (path, size)
+        if self.executor is None or key in self.cache:
+            return self.load_card_image(path, size)
+
+        callbacks = self.pending.get(key)
+        if callbacks is None:
+            self.misses += 1
+            self.pending[key] = callbacks = []
+            self.executor.submit(self._decode_job, key)
+            self._schedule_poll()
+        if callback is not None:
+            callbacks.append(callback)
+        return self.placeholder(size)
+
+    def placeholder(self, size):
+        """
+        Return a plain image in the background color, shown while decoding.
+
+        Parameters
+        ----------
+        size : tuple of int
+            Desired (width, height) of the placeholder.
+        """
+        
+        size = tuple(size)
+        tk_img = self.placeholders.get(size)
+        if tk_img is None:
+            tk_img = tk.PhotoImage(master=self.root, width=size[0], height=size[1])
+            tk_img.put("#%02x%02x%02x" % tuple(self.bg_color), to=(0, 0, size[0], size[1]))
+            self.placeholders[size] = tk_img
+        return tk_img
+
+    def shutdown(self):
+        """Stop the decoding threads; queued decodes are dropped."""
+        
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.pending.clear()
+
+    def load_atlas(self, index_path=os.path.join(VISUALS, "atlas", "card_atlas.json"),
+                   card_folder=os.path.join(VISUALS, "mixed_cards")):
+        """
+        Load the prebuilt card atlas so card faces are cropped from one sheet.
+
+        The atlas is built by ``atlas.py``. Cards or sizes missing from it are
+        still loaded from their own files.
+
+        Parameters
+        ----------
+        index_path : str, optional
+            Path of the atlas JSON index.
+        card_folder : str, optional
+            Folder whose ``<name>.png`` paths the atlas replaces.
+
+        Returns
+        -------
+        bool
+            True if the atlas was loaded, False if it does not exist.
+        """
+        
+        if not os.path.exists(index_path):
+            return False
+        with open(index_path) as f:
+            index = json.load(f)
+        sheet = Image.open(os.path.join(os.path.dirname(index_path), index["image"]))
+        sheet.load()  # decode once here; worker threads only crop
+
+        atlas = {}
+        for size_key, boxes in index["cards"].items():
+            size = tuple(int(v) for v in size_key.split("x"))
+            for card_name, (x, y, w, h) in boxes.items():
+                path = os.path.abspath(os.path.join(card_folder, f"{card_name}.png"))
+                atlas.setdefault(path, []).append((size, (x, y, x + w, y + h)))
+        for levels in atlas.values():
+            levels.sort(key=lambda level: level[0][0] * level[0][1])
+        self.atlas_sheet = sheet
+        self.atlas = atlas
+        return True
+
+    def _prepare_image(self, path, size):
+        """Decode, resize and flatten an image; safe to run off the main thread."""
+        
+        img = self._pyramid_level(path, size)
+        if img is None:
+            img = Image.open(path).resize(size, Image.LANCZOS)
+        elif img.size != size:
+            img = img.resize(size, Image.BILINEAR)
+        return self._flatten(img)
+
+    def _pyramid_level(self, path, size):
+        """
+        Return the smallest prescaled image covering ``size``, or None.
+
+        Atlas levels are cropped from the sheet. Other images get their
+        pyramid built on first use; two workers may both build one, and the
+        later one simply replaces the first.
+        """
+        
+        path = os.path.abspath(path)
+        for level_size, box in self.atlas.get(path, ()):
+            if level_size[0] >= size[0] and level_size[1] >= size[1]:
+                return self.atlas_sheet.crop(box)
+        if max(size) > self.pyramid_max:
+            return None
+        levels = self.pyramids.get(path)
+        if levels is None:
+            levels = self.pyramids[path] = self._build_pyramid(path)
+        for img in levels:
+            if img.width >= size[0] and img.height >= size[1]:
+                return img
+        return None
+
+    def _build_pyramid(self, path):
+        """Halve the source down to ``pyramid_min``, keeping the levels up to ``pyramid_max``."""
+        
+        img = self._flatten(Image.open(path))
+        levels = []
+        while max(img.size) >= self.pyramid_min:
+            if max(img.size) <= self.pyramid_max:
+                levels.append(img)
+            img = img.reduce(2)
+        levels.reverse()
+        return levels
+
+    def _flatten(self, img):
+        """Fill transparent regions with the background color."""
+        
         if img.mode in ("RGBA", "LA"):
+            img = img.convert("RGBA")
             bg = Image.new("RGBA", img.size, self.bg_color)
             img = Image.alpha_composite(bg, img)
-    
-        tk_img = ImageTk.PhotoImage(img.convert("RGB"))
+        return img.convert("RGB")
+
+    def _decode_job(self, key):
+        """Worker thread: prepare the image and hand it to the main thread."""
+        
+        try:
+            result = self._prepare_image(*key)
+        except Exception as exc:
+            result = exc
+        self.finished.put((key, result))
+
+    def _schedule_poll(self):
+        if not self.polling:
+            self.polling = True
+            self.root.after(self.poll_ms, self._collect_finished)
+
+    def _collect_finished(self):
+        """Main thread: build PhotoImages for finished decodes and notify waiters."""
+        
+        self.polling = False
+        while True:
+            try:
+                key, result = self.finished.get_nowait()
+            except queue.Empty:
+                break
+            callbacks = self.pending.pop(key, None)
+            if callbacks is None:
+                continue
+            if isinstance(result, Exception):
+                print(f"Could not load {key[0]}: {result}")
+                continue
+            tk_img = ImageTk.PhotoImage(result)
+            self._store(key, tk_img)
+            for callback in callbacks:
+                callback(tk_img)
+        if self.pending:
+            self._schedule_poll()
+
+    def preload(self, names, size, folder=os.path.join(VISUALS, "mixed_cards")):
+        """
+        Warm the cache with card images so first use does not resize on demand.
+
+        With a thread pool the images are decoded in the background and this
+        returns immediately.
+
+        Parameters
+        ----------
+        names : iterable of str
+            Card names (e.g. the keys of ``CARD_FILE_MAP``).
+        size : tuple of int
+            Desired (width, height) of the images.
+        folder : str, optional
+            Folder holding ``<name>.png`` files, by default visuals/mixed_cards.
+        """
+        
+        for name in names:
+            self.request_card_image(os.path.join(folder, f"{name}.png"), size)
+
+    def stats(self):
+        """
+        Return the cache counters.
+
+        Returns
+        -------
+        dict
+            Entries, capacity, hits, misses, evictions, bytes held and the
+            number of pyramids built from source images.
+        """
+        
+        return {"entries": len(self.cache), "max_entries": self.max_entries,
+                "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "bytes_held": self.bytes_held,
+                "pyramids": len(self.pyramids)}
+
+    def _store(self, key, tk_img):
+        """Insert an image and evict least recently used ones over the limit."""
+        
+        if key in self.cache:
+            # a second decode of the same key replaces the image, not the memory count
+            self.bytes_held -= self._image_bytes(key)
+            self.cache.move_to_end(key)
         self.cache[key] = tk_img
+        self.bytes_held += self._image_bytes(key)
+        while len(self.cache) > self.max_entries:
+            old_key, _ = self.cache.popitem(last=False)
+            self.bytes_held -= self._image_bytes(old_key)
+            self.evictions += 1
+
+    @staticmethod
+    def _image_bytes(key):
+        width, height = key[1]
+        return width * height * 3
+
+
+
+def table_canvas(root):
+    """
+    Return the Table_canvas of a window, creating one that fills it if needed.
+
+    Parameters
+    ----------
+    root : tk.Tk
+        The main window.
+    """
+    
+    canvas = getattr(root, "table_canvas", None)
+    if canvas is None:
+        canvas = Table_canvas(root)
+    return canvas
+
+
+
+class Table_canvas:
+    """
+    One ``tk.Canvas`` that holds every element of the table as canvas items.
+
+    Cards and deck images are sprites: image items tagged with a sprite name,
+    so moving or swapping a card is a ``coords`` or ``itemconfig`` call and no
+    widget is created per card. Clicks are hit-tested on the canvas: a single
+    binding looks up the item under the pointer and calls the handler
+    registered for one of its tags.
+
+    Positions are given in table coordinates, a ``width`` x ``height`` area
+    that is scaled to fit the window and centered in it. When the window is
+    resized every item is moved and scaled at once, and text fonts follow;
+    sprite images are loaded again at the new size once the resizing has
+    settled for ``settle_ms``, so dragging the window edge only moves items.
+
+    Attributes
+    ----------
+    canvas : tk.Canvas
+        The canvas widget, placed over the whole window.
+    width, height : int
+        Size of the table area, used for relative positions.
+    scale : float
+        Canvas pixels per table unit.
+    offset_x, offset_y : float
+        Canvas position of the table origin.
+    images : dict
+        Sprite tag -> image currently shown (Tk does not keep references).
+    sources : dict
+        Sprite tag -> (image_loader, path, size) of images shown with
+        ``sprite_image``, loaded again when the scale changes.
+    handlers : dict
+        Tag -> callable run when an item with that tag is clicked.
+    animator : Animator
+        Moves sprites of this canvas over time.
+    """
+
+    settle_ms = 150  # quiet time after a resize before images are reloaded
+
+    def __init__(self, root, width=1960, height=1260, bg="lightgray"):
+        """
+        Create the canvas and attach it to ``root.table_canvas``.
+
+        Parameters
+        ----------
+        root : tk.Tk
+            The main window.
+        width, height : int, optional
+            Size of the area inside the window border.
+        bg : str, optional
+            Background color around the table.
+        """
+
+        self.root     = root
+        self.width    = width
+        self.height   = height
+        self.scale    = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.images   = {}
+        self.sources  = {}
+        self.fonts    = {}    # text item -> font at scale 1
+        self.handlers = {}
+        self.reload_timer = None
+        self.canvas   = tk.Canvas(root, width=width, height=height, bg=bg, highlightthickness=0)
+        self.canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        self.canvas.bind("<Button-1>", self._clicked)
+        self.canvas.bind("<Configure>", self._resized)
+        self.canvas.tag_bind("clickable", "<Enter>", lambda e: self.canvas.config(cursor="hand2"))
+        self.canvas.tag_bind("clickable", "<Leave>", lambda e: self.canvas.config(cursor="arrow"))
+        self.animator = Animator(self)
+        root.table_canvas = self
+
+    def rel(self, relx, rely):
+        """Canvas coordinates of a position given as fractions of the area."""
+
+        return relx * self.width, rely * self.height
+
+    def to_canvas(self, x, y):
+        """Canvas pixels of a point in table coordinates."""
+
+        return x * self.scale + self.offset_x, y * self.scale + self.offset_y
+
+    def scaled(self, size):
+        """Pixel (width, height) of something ``size`` table units large."""
+
+        return max(1, round(size[0] * self.scale)), max(1, round(size[1] * self.scale))
+
+    def fit(self, width, height):
+        """
+        Scale the table to a canvas of ``width`` x ``height`` pixels.
+
+        Items are moved and fonts resized now; sprite images are reloaded
+        after ``settle_ms`` without another call.
+
+        Parameters
+        ----------
+        width, height : int
+            New size of the canvas.
+        """
+
+        scale = min(width / self.width, height / self.height)
+        offset_x = (width - self.width * scale) / 2
+        offset_y = (height - self.height * scale) / 2
+        if (scale, offset_x, offset_y) == (self.scale, self.offset_x, self.offset_y):
+            return
+        m = metrics.active
+        start = time.perf_counter() if m is not None else 0.0
+        self.canvas.move("all", -self.offset_x, -self.offset_y)
+        self.canvas.scale("all", 0, 0, scale / self.scale, scale / self.scale)
+        self.canvas.move("all", offset_x, offset_y)
+        self.scale, self.offset_x, self.offset_y = scale, offset_x, offset_y
+        for item, font in list(self.fonts.items()):
+            if self.canvas.type(item):
+                self.canvas.itemconfig(item, font=self._scaled_font(font))
+            else:
+                del self.fonts[item]
+        if self.reload_timer is not None:
+            self.root.after_cancel(self.reload_timer)
+        self.reload_timer = self.root.after(self.settle_ms, self._reload_images)
+        if m is not None:
+            m.record("table_canvas.fit", time.perf_counter() - start)
+
+    def _resized(self, event):
+        self.fit(event.width, event.height)
+
+    def _reload_images(self):
+        """Load every sprite image again at the current scale."""
+
+        self.reload_timer = None
+        for tag, (image_loader, path, size) in list(self.sources.items()):
+            self.sprite_image(tag, image_loader, path, size)
+
+    def _scaled_font(self, font):
+        return (font[0], max(1, round(font[1] * self.scale))) + tuple(font[2:])
+
+    def place_item(self, item, font=None):
+        """
+        Bring an item drawn directly on ``canvas`` in table coordinates to the window scale.
+
+        Parameters
+        ----------
+        item : int or str
+            Canvas item or tag.
+        font : tuple, optional
+            Font of a text item at scale 1; its size then follows the window.
+        """
+
+        if (self.scale, self.offset_x, self.offset_y) != (1.0, 0.0, 0.0):
+            self.canvas.scale(item, 0, 0, self.scale, self.scale)
+            self.canvas.move(item, self.offset_x, self.offset_y)
+        if font is not None:
+            self.fonts[item] = font
+            self.canvas.itemconfig(item, font=self._scaled_font(font))
+
+    def sprite(self, tag, x, y, tk_img=None, anchor="center", groups=()):
+        """
+        Place the sprite ``tag`` at (x, y), creating its image item on first use.
+
+        Parameters
+        ----------
+        tag : str
+            Unique sprite name.
+        x, y : float
+            Position of the anchor point.
+        tk_img : PhotoImage, optional
+            Image to show.
+        anchor : str, optional
+            Which point of the image is at (x, y).
+        groups : tuple of str, optional
+            Extra tags, e.g. ``"hand"`` for all hand cards.
+        """
+
+        if tag in self.images:
+            self.canvas.coords(tag, *self.to_canvas(x, y))
+            self.canvas.itemconfig(tag, state="normal")
+        else:
+            self.canvas.create_image(*self.to_canvas(x, y), anchor=anchor, tags=(tag,) + tuple(groups))
+            self.images[tag] = None
+        if tk_img is not None:
+            self.set_image(tag, tk_img)
+
+    def set_image(self, tag, tk_img):
+        """Show another image on a sprite; ignored if the sprite was removed."""
+
+        if tag in self.images:
+            self.canvas.itemconfig(tag, image=tk_img)
+            self.images[tag] = tk_img
+
+    def sprite_image(self, tag, image_loader, path, size):
+        """
+        Show the image at ``path`` on a sprite, ``size`` table units large.
+
+        The image is requested at the current scale and requested again
+        whenever the scale changes. A decode that finishes after the sprite
+        was given another image or scale is not shown.
+
+        Parameters
+        ----------
+        tag : str
+            Sprite name.
+        image_loader : ImageLoader
+            Loader the image is requested from.
+        path : str
+            Path to the image file.
+        size : tuple of int
+            (width, height) in table units.
+
+        Returns
+        -------
+        PhotoImage
+            The image shown now, a placeholder while it is decoded.
+        """
+
+        source = (image_loader, path, tuple(size))
+        pixels = self.scaled(size)
+        self.sources[tag] = source
+
+        def ready(tk_img):
+            if self.sources.get(tag) == source and self.scaled(size) == pixels:
+                self.set_image(tag, tk_img)
+
+        tk_img = image_loader.request_card_image(path, pixels, ready)
+        self.set_image(tag, tk_img)
         return tk_img
 
+    def move(self, tag, x, y):
+        self.canvas.coords(tag, *self.to_canvas(x, y))
+
+    def position(self, tag):
+        """Current (x, y) of a sprite or single item, in table coordinates."""
+
+        coords = self.canvas.coords(tag)
+        return (coords[0] - self.offset_x) / self.scale, (coords[1] - self.offset_y) / self.scale
+
+    def raise_sprite(self, tag):
+        self.canvas.tag_raise(tag)
+
+    def show(self, tag, visible=True):
+        self.canvas.itemconfig(tag, state="normal" if visible else "hidden")
+
+    def set_clickable(self, tag, on_click):
+        """
+        Make the items tagged ``tag`` call ``on_click()`` when clicked.
+
+        Parameters
+        ----------
+        tag : str
+            Sprite or item tag.
+        on_click : callable or None
+            Handler; None makes the items inert again.
+        """
+
+        if on_click is None:
+            self.handlers.pop(tag, None)
+            self.canvas.dtag(tag, "clickable")
+        else:
+            self.handlers[tag] = on_click
+            self.canvas.addtag_withtag("clickable", tag)
+
+    def remove(self, tag):
+        self.animator.cancel(tag)
+        self.canvas.delete(tag)
+        self.images.pop(tag, None)
+        self.sources.pop(tag, None)
+        self.handlers.pop(tag, None)
+
+    def _clicked(self, event):
+        """Hit-test a click and run the handler of the topmost clickable item."""
+
+        for item in reversed(self.canvas.find_overlapping(event.x, event.y, event.x, event.y)):
+            for tag in self.canvas.gettags(item):
+                handler = self.handlers.get(tag)
+                if handler is not None:
+                    handler()
+                    return
+
+
+
+class Animator:
+    """
+    Moves canvas sprites along tweens, all driven by one ``root.after`` timer.
+
+    Every frame updates all active tweens in one callback. Positions follow
+    the clock, not the frame count, so a late or skipped frame makes sprites
+    jump ahead instead of slowing the animation down. When a frame runs over
+    ``budget_ms`` the remaining tweens wait for the next frame; tweens are
+    served round-robin so none of them stalls. The next frame is always at
+    least ``min_gap_ms`` away, which leaves Tk time to handle input. The timer
+    only runs while something is moving.
+
+    Attributes
+    ----------
+    frames : int
+        Frames run since the animator was created.
+    dropped : int
+        Frames that were due but could not run because the loop was busy.
+    partial : int
+        Frames that ran out of budget before updating every tween.
+    """
+
+    def __init__(self, table, frame_ms=16, budget_ms=8, min_gap_ms=2):
+        """
+        Parameters
+        ----------
+        table : Table_canvas
+            Canvas whose sprites are moved.
+        frame_ms : int, optional
+            Target frame interval, by default 16 (about 60 fps).
+        budget_ms : int, optional
+            Time one frame may spend updating tweens.
+        min_gap_ms : int, optional
+            Minimum pause between frames.
+        """
+
+        self.table      = table
+        self.root       = table.root
+        self.frame_ms   = frame_ms
+        self.budget_ms  = budget_ms
+        self.min_gap_ms = min_gap_ms
+        self.tweens     = OrderedDict()  # tag -> [x0, y0, x1, y1, start, duration, on_done]
+        self.timer      = None
+        self.last_frame = None
+        self.frames     = 0
+        self.dropped    = 0
+        self.partial    = 0
+
+    def tween(self, tag, x, y, duration_ms=250, on_done=None, start=None):
+        """
+        Move the sprite ``tag`` to (x, y) over ``duration_ms``.
+
+        A running tween of the same sprite is replaced and the new one starts
+        from where the sprite is now.
+
+        Parameters
+        ----------
+        tag : str
+            Sprite to move.
+        x, y : float
+            Destination.
+        duration_ms : int, optional
+            Length of the movement.
+        on_done : callable, optional
+            Called without arguments when the sprite arrives.
+        start : tuple of float, optional
+            Starting point; the sprite is put there first.
+        """
+
+        if start is None:
+            start = self.table.position(tag)
+        else:
+            self.table.move(tag, *start)
+        self.tweens.pop(tag, None)
+        self.tweens[tag] = [start[0], start[1], x, y, time.perf_counter(),
+                            max(duration_ms, 1) / 1000, on_done]
+        if self.timer is None:
+            self.last_frame = None
+            self.timer = self.root.after(self.min_gap_ms, self._frame)
+
+    def cancel(self, tag, finish=False):
+        """Stop moving ``tag``; with finish, put it at its destination and run on_done."""
+
+        tween = self.tweens.pop(tag, None)
+        if tween is not None and finish:
+            self.table.move(tag, tween[2], tween[3])
+            if tween[6] is not None:
+                tween[6]()
+
+    def busy(self, tag=None):
+        return bool(self.tweens) if tag is None else tag in self.tweens
+
+    def _frame(self):
+        """Advance every tween that fits in the frame budget."""
+
+        self.timer = None
+        now = time.perf_counter()
+        frame = self.frame_ms / 1000
+        if self.last_frame is not None and now - self.last_frame > 1.5 * frame:
+            self.dropped += int((now - self.last_frame) / frame) - 1
+        self.last_frame = now
+        self.frames += 1
+        deadline = now + self.budget_ms / 1000
+
+        arrived = []
+        for tag, (x0, y0, x1, y1, start, duration, on_done) in list(self.tweens.items()):
+            if time.perf_counter() > deadline:
+                self.partial += 1
+                break
+            t = min(1.0, (now - start) / duration)
+            eased = 1 - (1 - t) ** 3  # ease-out cubic
+            self.table.move(tag, x0 + (x1 - x0) * eased, y0 + (y1 - y0) * eased)
+            self.tweens.move_to_end(tag)  # served last next frame if the budget runs out
+            if t >= 1.0:
+                arrived.append(tag)
+
+        for tag in arrived:
+            on_done = self.tweens.pop(tag)[6]
+            if on_done is not None:
+                on_done()
+
+        work_ms = (time.perf_counter() - now) * 1000
+        m = metrics.active
+        if m is not None:
+            m.record("animator.frame", work_ms / 1000)
+        if self.tweens and self.timer is None:
+            self.timer = self.root.after(max(self.min_gap_ms, int(self.frame_ms - work_ms)), self._frame)
+
+    def stats(self):
+        return {"active": len(self.tweens), "frames": self.frames,
+                "dropped": self.dropped, "partial": self.partial}
+
 
 
 class GUI:
@@ -111,16 +854,21 @@ class GUI:
         self.height      = 1300
         self.width       = 2000
         self.root        = None  
+        self.canvas      = None
+        self.border      = 20
         self.table_x     = 100
         self.table_y     = 50
         self.table_width = 1650
         self.table_height= 1170
         self.player_names = []  # store player names
-        self.name_labels = []   # store Label widgets for easy update
+        self.name_labels = []   # canvas text items of the names
 
     def main_window(self):
         """
-        Create and return the main Tkinter window.
+        Create and return the main Tkinter window with its table canvas.
+
+        The window opens at ``width`` x ``height``, shrunk to fit the screen,
+        and can be resized; the table and its cards scale with it.
 
         Returns
         -------
@@ -130,8 +878,14 @@ class GUI:
         
         self.root = tk.Tk()
         self.root.title("Customizable Window")
-        self.root.geometry(f"{self.width}x{self.height}")
-        self.root.configure(bg="lightgray", highlightbackground="black", highlightthickness=20)
+        scale = min(1.0, 0.9 * self.root.winfo_screenwidth() / self.width,
+                    0.9 * self.root.winfo_screenheight() / self.height)
+        width, height = int(self.width * scale), int(self.height * scale)
+        self.root.geometry(f"{width}x{height}")
+        self.root.minsize(self.width // 4, self.height // 4)
+        self.root.configure(bg="lightgray", highlightbackground="black", highlightthickness=self.border)
+        self.canvas = Table_canvas(self.root, self.width - 2 * self.border, self.height - 2 * self.border)
+        self.canvas.fit(width - 2 * self.border, height - 2 * self.border)
         return self.root
 
     def draw_table_square(self):
@@ -140,14 +894,17 @@ class GUI:
 
         Returns
         -------
-        tk.Canvas
-            The canvas representing the table surface.
+        int
+            The canvas item of the table surface.
         """
         
-        canvas = tk.Canvas(self.root, width=self.table_width, height=self.table_height,
-                           bg="green", highlightthickness=0)
-        canvas.place(x=self.table_x, y=self.table_y)
-        return canvas
+        item = self.canvas.canvas.create_rectangle(
+            self.table_x, self.table_y, self.table_x + self.table_width, self.table_y + self.table_height,
+            fill="green", width=0, tags=("table",))
+        self.canvas.place_item(item)
+        self.canvas.canvas.tag_lower(item)
+        self.canvas.canvas.tag_lower("border")
+        return item
 
     def draw_black_square(self):
         """
@@ -155,14 +912,17 @@ class GUI:
 
         Returns
         -------
-        tk.Canvas
-            The canvas representing the black border.
+        int
+            The canvas item of the black border.
         """
         
-        canvas = tk.Canvas(self.root, width=self.table_width + 40, height=self.table_height + 40, 
-                           bg="black", highlightthickness=0)
-        canvas.place(x=self.table_x - 20, y=self.table_y - 20)
-        return canvas
+        item = self.canvas.canvas.create_rectangle(
+            self.table_x - 20, self.table_y - 20,
+            self.table_x + self.table_width + 20, self.table_y + self.table_height + 20,
+            fill="black", width=0, tags=("border",))
+        self.canvas.place_item(item)
+        self.canvas.canvas.tag_lower(item)
+        return item
 
 
     def ask_player_names(self, num_players=3):
@@ -194,22 +954,37 @@ class GUI:
 
     def display_player_names(self):
         """
-        Display the player names around the table using Tkinter labels.
+        Display the player names around the table as canvas text.
         """
         
         positions = [(0.2, 0.05), (0.8, 0.05), (0.9, 0.8)]
 
-        for lbl in self.name_labels:
-            lbl.destroy()
+        for item in self.name_labels:
+            self.canvas.canvas.delete(item)
             
         self.name_labels = []
 
         for i, name in enumerate(self.player_names):
             
-            x_rel, y_rel = positions[i % len(positions)]
-            label = tk.Label(self.root, text=name, font=("Arial", 24), bg="green")
-            label.place(relx=x_rel, rely=y_rel, anchor="n")
-            self.name_labels.append(label)
+            x, y = self.canvas.rel(*positions[i % len(positions)])
+            item = self.canvas.canvas.create_text(x, y, text=name, anchor="n", tags=("name",))
+            self.canvas.place_item(item, font=("Arial", 24))
+            self.name_labels.append(item)
+
+    def set_player_label(self, index, text):
+        """
+        Change the text shown for one player.
+
+        Parameters
+        ----------
+        index : int
+            Position of the player in ``player_names``.
+        text : str
+            New text.
+        """
+
+        if index < len(self.name_labels):
+            self.canvas.canvas.itemconfig(self.name_labels[index], text=text)
 
     def rotate_player_names(self):
         """
@@ -239,6 +1014,7 @@ class Build_buttons:
         """
         
         self.root        = root
+        self.canvas      = table_canvas(root)
         self.color       = "orange"
         self.hover_color = "darkorange"   # color when hovered
         self.contourcolor= "black"
@@ -259,6 +1035,9 @@ class Build_buttons:
         """
         Create a rounded rectangular button with text and hover behavior.
 
+        The button is a polygon and a text item on the table canvas, both
+        tagged ``button_<x>_<y>``.
+
         Parameters
         ----------
         x, y : int
@@ -273,11 +1052,17 @@ class Build_buttons:
             Button background color.
         hover_color : str, optional
             Button color when hovered.
+
+        Returns
+        -------
+        str
+            The tag of the button's items.
         """
         
         radius = 15
-        canvas = tk.Canvas(self.root, width=w, height=h, highlightthickness=0, bg=self.root["bg"])
-        canvas.place(x=x, y=y)
+        canvas = self.canvas.canvas
+        tag = f"button_{x}_{y}"
+        canvas.delete(tag)
         fill_color = bg_color if bg_color else self.color
         hover_fill = hover_color if hover_color else self.hover_color
 
@@ -292,23 +1077,17 @@ class Build_buttons:
             
             return canvas.create_polygon(points, smooth=True, **kwargs)
         
-        rect = round_rect(0, 0, w, h, radius, fill=fill_color, outline=self.contourcolor, width=3)
-        label = canvas.create_text(w/2, h/2, text=text, font=("Arial", 14), fill="black")
+        rect = round_rect(x, y, x + w, y + h, radius, fill=fill_color, outline=self.contourcolor,
+                          width=3, tags=(tag,))
+        label = canvas.create_text(x + w/2, y + h/2, text=text, fill="black", tags=(tag,))
+        self.canvas.place_item(rect)
+        self.canvas.place_item(label, font=("Arial", 14))
     
         if command is not None:
-            
-            def on_enter(e):
-                canvas.itemconfig(rect, fill=hover_fill)
-                
-            def on_leave(e):
-                canvas.itemconfig(rect, fill=fill_color)
-            
-            canvas.tag_bind(rect , "<Enter>"   , on_enter)
-            canvas.tag_bind(label, "<Enter>"   , on_enter)
-            canvas.tag_bind(rect , "<Leave>"   , on_leave)
-            canvas.tag_bind(label, "<Leave>"   , on_leave)
-            canvas.tag_bind(rect , "<Button-1>", lambda e: command())
-            canvas.tag_bind(label, "<Button-1>", lambda e: command())
+            canvas.tag_bind(tag, "<Enter>", lambda e: canvas.itemconfig(rect, fill=hover_fill))
+            canvas.tag_bind(tag, "<Leave>", lambda e: canvas.itemconfig(rect, fill=fill_color))
+            self.canvas.set_clickable(tag, command)
+        return tag
         
         
     def button_I(self, x=1800, y=100, w=130, h=60):
@@ -329,7 +1108,7 @@ class Display_full_deck:
     Displays the full deck image in the game window and handles click events.
     """
     
-    def __init__(self, root, image_loader, width=200, height=200):
+    def __init__(self, root, image_loader, width=200, height=200, on_click=None):
         """
         Initialize the full deck display.
 
@@ -341,14 +1120,18 @@ class Display_full_deck:
             Instance used to load and cache images.
         width, height : int
             Dimensions of the deck image.
+        on_click : callable, optional
+            Called without arguments when the deck is clicked.
         """
         
         self.root         = root
+        self.canvas       = table_canvas(root)
         self.image_loader = image_loader
-        self.image_path   = os.path.join("visuals", "deck_images", "full_deck.png")
+        self.on_click     = on_click
+        self.image_path   = os.path.join(VISUALS, "deck_images", "full_deck.png")
         self.width        = width
         self.height       = height
-        self.image_label  = None
+        self.tag          = "full_deck"
         self.root.after(100, self.display_image)
 
     def display_image(self):
@@ -356,26 +1139,30 @@ class Display_full_deck:
         Display the deck image centered on the table.
         """
         
-        tk_img = self.image_loader.load_card_image(self.image_path, 
-                                                   (self.width, self.height))
-        self.image_label = tk.Label(self.root, image=tk_img, bg="green", 
-                                    borderwidth=0, highlightthickness=0)
-        self.image_label.image = tk_img
-        self.image_label.place(relx=0.5, rely=0.5, anchor="center")
-        self.image_label.bind("<Button-1>", lambda e: self.deck_clicked())
-        self.image_label.bind("<Enter>", lambda e: self.image_label.config(cursor="hand2"))
+        m = metrics.active
+        start = time.perf_counter() if m is not None else 0.0
+        self.canvas.sprite(self.tag, *self.canvas.rel(0.5, 0.5))
+        self.canvas.sprite_image(self.tag, self.image_loader, self.image_path, (self.width, self.height))
+        self.canvas.set_clickable(self.tag, self.deck_clicked)
+        if m is not None:
+            m.record("display_full_deck.display_image", time.perf_counter() - start)
 
     def deck_clicked(self):
-        print("Deck clicked!")                       
+        if callable(self.on_click):
+            self.on_click()
 
 
 
 class Display_first_card:
     """
     Displays the first drawn card from the deck at a fixed position on the table.
+
+    Every instance draws on the same ``table_card`` sprite, so showing a new
+    table card only swaps the sprite's image. Given ``from_xy`` the card first
+    flies there from that point, e.g. the hand slot it was played from.
     """
     
-    def __init__(self, root, image_loader, card_name):
+    def __init__(self, root, image_loader, card_name, from_xy=None, flight_ms=300):
         """
         Initialize the card display.
 
@@ -387,19 +1174,27 @@ class Display_first_card:
             Image loading utility.
         card_name : str
             Name of the card image file (without extension).
+        from_xy : tuple of float, optional
+            Canvas point the card flies from; shown in place if None.
+        flight_ms : int, optional
+            Duration of the flight.
         """
         
         self.root          = root
+        self.canvas        = table_canvas(root)
         self.card_name     = card_name
         self.image_loader  = image_loader
-        self.image_label   = None
         self.tk_img        = None
+        self.tag           = "table_card"
+        self.flying_tag    = f"flying_{id(self)}"
+        self.from_xy       = from_xy
+        self.flight_ms     = flight_ms
         self.deck_x        = 0.5
         self.deck_y        = 0.5
         self.offset_x      = -0.1
         self.custom_width  = 150
         self.custom_height = 200
-        self.root.after(200, self.display_a_card)
+        self.root.after(200 if from_xy is None else 0, self.display_a_card)
 
 
     def display_a_card(self):
@@ -407,16 +1202,34 @@ class Display_first_card:
         Display the selected card image on the table.
         """
         
-        if self.image_label is not None:
-            self.image_label.destroy()        
-
-
+        m = metrics.active
+        start = time.perf_counter() if m is not None else 0.0
+        image_path = os.path.join(VISUALS, "mixed_cards", f"{self.card_name}.png")
+        self.canvas.table_card_name = self.card_name
+        x, y = self.canvas.rel(self.deck_x + self.offset_x, self.deck_y)
+        if self.from_xy is None:
+            self.canvas.sprite(self.tag, x, y)
+            self.tk_img = self.canvas.sprite_image(self.tag, self.image_loader, image_path,
+                                                   (self.custom_width, self.custom_height))
         else:
-            image_path = os.path.join("visuals", "mixed_cards", f"{self.card_name}.png")
+            self.canvas.sprite(self.flying_tag, *self.from_xy)
+            self.tk_img = self.canvas.sprite_image(self.flying_tag, self.image_loader, image_path,
+                                                   (self.custom_width, self.custom_height))
+            self.canvas.raise_sprite(self.flying_tag)
+            self.canvas.animator.tween(self.flying_tag, x, y, self.flight_ms, on_done=self._landed)
+        if m is not None:
+            m.record("display_first_card.display_a_card", time.perf_counter() - start)
+            m.table_updated()
 
-        self.tk_img = self.image_loader.load_card_image(image_path, (self.custom_width, self.custom_height))
-        self.image_label = tk.Label(self.root, image=self.tk_img, bg="green", borderwidth=0, highlightthickness=0)
-        self.image_label.place(relx=self.deck_x + self.offset_x, rely=self.deck_y, anchor="center")
+    def _landed(self):
+        """Put the card on the table sprite unless a later card was played, and drop the flying copy."""
+
+        if getattr(self.canvas, "table_card_name", None) == self.card_name:
+            self.canvas.sprite(self.tag, *self.canvas.rel(self.deck_x + self.offset_x, self.deck_y))
+            self.tk_img = self.canvas.sprite_image(
+                self.tag, self.image_loader, os.path.join(VISUALS, "mixed_cards", f"{self.card_name}.png"),
+                (self.custom_width, self.custom_height))
+        self.canvas.remove(self.flying_tag)
 
 
 
@@ -446,6 +1259,7 @@ class Display_player_decks:
         """
         
         self.root           = root
+        self.canvas         = table_canvas(root)
         self.image_loader   = image_loader
         self.width          = width
         self.height         = height
@@ -454,13 +1268,16 @@ class Display_player_decks:
         self.offset_x       = offset_x
         self.positions      = {"P1": (0.3, 0.2), "P2": (0.7, 0.2)}
         self.images         = {}
-        self.labels         = {}
         self.root.after(200, self.display_both_players)
 
     def display_both_players(self):
         
+        m = metrics.active
+        start = time.perf_counter() if m is not None else 0.0
         self.display_deck("P1", self.P1)
         self.display_deck("P2", self.P2)
+        if m is not None:
+            m.record("display_player_decks.display_both_players", time.perf_counter() - start)
 
     def display_deck(self, player, deck_number):
         """
@@ -474,15 +1291,11 @@ class Display_player_decks:
             Deck image number.
         """
         
-        image_path = os.path.join("visuals", "deck_images", f"deck_0{deck_number}.png")
-        tk_img      = self.image_loader.load_card_image(image_path, (self.width, self.height))
-        relx, rely  = self.positions[player]
-        label       = tk.Label(self.root, image=tk_img, bg="green", borderwidth=0, highlightthickness=0)
-        label.image = tk_img
-        label.place(relx=relx, rely=rely, anchor="center")
-
-        self.images[player] = tk_img
-        self.labels[player] = label
+        image_path = os.path.join(VISUALS, "deck_images", f"deck_0{deck_number}.png")
+        tag         = f"deck_{player}"
+        self.canvas.sprite(tag, *self.canvas.rel(*self.positions[player]))
+        self.images[player] = self.canvas.sprite_image(tag, self.image_loader, image_path,
+                                                       (self.width, self.height))
 
 
 
@@ -490,6 +1303,10 @@ class Display_player_decks:
 class Display_player_cards:
     """
     Displays a player's hand of cards and allows click interactions.
+
+    The view is persistent: one sprite is kept per slot in ``card_loc`` and
+    ``update`` only reconfigures the slots whose card or clickable state
+    changed, so redrawing a hand is a few ``itemconfig`` calls.
     """
 
     def __init__(self, root, image_loader, card_array, card_index, width=150, height=200, on_card_click=None):
@@ -513,44 +1330,118 @@ class Display_player_cards:
         """
         
         self.root = root
+        self.canvas = table_canvas(root)
         self.image_loader = image_loader
-        self.card_array = card_array
-        self.card_index = card_index
+        self.card_array = []
+        self.card_index = []
         self.width = width
         self.height = height
         self.card_loc = [(950,1100),(800,1100),(1100,1100),(950,880),(650,1100),
                          (800,880),(1250,1100),(1100,880),(500,1100),(650,880),
                          (1400,1100),(1250,880),(350,1100),(500,880),(1550,1100),
                          (1400,880),(350,880),(1550,880)]
-        self.images = []
-        self.labels = []
+        self.images = {}      # slot -> PhotoImage currently shown
+        self.slot_state = {}  # slot -> (card_name, clickable) currently shown
         self.on_card_click = on_card_click  # callback: function(card_name) -> bool/None
-        self.display_cards()
+        self.update(card_array, card_index)
+
+    def update(self, card_array, card_index, animate_from=None):
+        """
+        Show a new hand, touching only the slots that changed.
+
+        Parameters
+        ----------
+        card_array : list of str
+            List of card names to display.
+        card_index : list of int
+            Indicators for clickable cards (1 for active, 0 for inactive).
+        animate_from : tuple of float, optional
+            Canvas point, e.g. the deck, that slots which were empty slide in
+            from.
+        """
+        
+        m = metrics.active
+        start = time.perf_counter() if m is not None else 0.0
+        self.card_array = list(card_array)
+        self.card_index = list(card_index)
+        shown = min(len(self.card_array), len(self.card_loc))
+
+        for slot in range(shown):
+            clickable = slot < len(self.card_index) and self.card_index[slot] == 1
+            state = (self.card_array[slot], clickable)
+            previous = self.slot_state.get(slot)
+            if previous != state:
+                self._draw_slot(slot, *state)
+                if previous is None and animate_from is not None:
+                    self.canvas.raise_sprite(self.slot_tag(slot))
+                    self.canvas.animator.tween(self.slot_tag(slot), *self.card_loc[slot], start=animate_from)
+
+        # hide the slots the hand no longer reaches, keeping their sprites
+        for slot in [s for s in self.slot_state if s >= shown]:
+            self.canvas.animator.cancel(self.slot_tag(slot))
+            self.canvas.show(self.slot_tag(slot), False)
+            self.canvas.set_clickable(self.slot_tag(slot), None)
+            del self.slot_state[slot]
+        if m is not None:
+            m.record("display_player_cards.update", time.perf_counter() - start)
 
     def display_cards(self):
         """
-        Display all cards in the player's hand and bind click events if enabled.
+        Redraw every card in the player's hand.
         """
         
-        for idx, card_name in enumerate(self.card_array):
-            image_path = os.path.join("visuals", "mixed_cards", f"{card_name}.png")
-            x, y = self.card_loc[idx]
-            tk_img = self.image_loader.load_card_image(image_path, (self.width, self.height))
-            label = tk.Label(self.root, image=tk_img, bg="green", borderwidth=0, highlightthickness=0)
-            label.image = tk_img
-            label.place(x=x, y=y, anchor="center")
-            self.images.append(tk_img)
-            self.labels.append(label)
+        self.slot_state.clear()
+        self.update(self.card_array, self.card_index)
 
-            if idx < len(self.card_index) and self.card_index[idx] == 1:
-                # Use a bound method to avoid late-binding issues
-                label.bind("<Button-1>", lambda e, name=card_name: self._handle_click(name))
-                label.bind("<Enter>", lambda e, lbl=label: lbl.config(cursor="hand2"))
-                label.bind("<Leave>", lambda e, lbl=label: lbl.config(cursor=""))
-            else:
-                label.config(cursor="arrow")
+    @staticmethod
+    def slot_tag(slot):
+        return f"hand_{slot}"
+
+    def _draw_slot(self, slot, card_name, clickable):
+        """
+        Configure the sprite of one slot for a card and its clickable state.
 
-    def _handle_click(self, card_name):
+        Parameters
+        ----------
+        slot : int
+            Index into ``card_loc``.
+        card_name : str
+            The card to show in the slot.
+        clickable : bool
+            Whether clicking the card plays it.
+        """
+        
+        tag = self.slot_tag(slot)
+        previous = self.slot_state.get(slot)
+        if previous is None:
+            self.canvas.sprite(tag, *self.card_loc[slot], groups=("hand",))
+        if previous is None or previous[0] != card_name:
+            image_path = os.path.join(VISUALS, "mixed_cards", f"{card_name}.png")
+            self.images[slot] = self.canvas.sprite_image(tag, self.image_loader, image_path,
+                                                         (self.width, self.height))
+        if previous is None or previous[1] != clickable:
+            # the slot is looked up at click time, so handlers never go stale
+            self.canvas.set_clickable(tag, (lambda s=slot: self._handle_slot_click(s)) if clickable else None)
+
+        self.slot_state[slot] = (card_name, clickable)
+
+    def _handle_slot_click(self, slot):
+        """
+        Forward a click on a slot to ``_handle_click`` if its card is playable.
+
+        Parameters
+        ----------
+        slot : int
+            Index into ``card_loc`` of the clicked sprite.
+        """
+        
+        state = self.slot_state.get(slot)
+        if state is not None and state[1]:
+            if metrics.active is not None:
+                metrics.active.click_started()
+            self._handle_click(state[0], slot)
+
+    def _handle_click(self, card_name, slot=None):
         """
         Handle click events on a player's card.
 
@@ -558,22 +1449,18 @@ class Display_player_cards:
         ----------
         card_name : str
             The name of the clicked card.
+        slot : int, optional
+            Slot the card was clicked in; the card flies from there to the table.
         """
         
+        from_xy = self.card_loc[slot] if slot is not None else None
         if callable(self.on_card_click):
             result = self.on_card_click(card_name)
         
             if result is True:
-                Display_first_card(self.root, self.image_loader, card_name=card_name)
+                Display_first_card(self.root, self.image_loader, card_name=card_name, from_xy=from_xy)
             elif result is None:
     
-                Display_first_card(self.root, self.image_loader, card_name=card_name)
+                Display_first_card(self.root, self.image_loader, card_name=card_name, from_xy=from_xy)
         else:
-            Display_first_card(self.root, self.image_loader, card_name=card_name)
-
-
-
-
-
-
-
+            Display_first_card(self.root, self.image_loader, card_name=card_name, from_xy=from_xy)
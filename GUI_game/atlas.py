@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Builds the texture atlas of card faces.
+
+Every card in ``CARD_LIST`` is resized once per render size in ``ATLAS_SIZES``
+and packed into a single sheet, together with a JSON index of the box each
+card occupies. ``ImageLoader.load_atlas`` reads the sheet once and crops cards
+from memory instead of opening and resizing one PNG per card.
+
+The sizes form a pyramid around the size cards have in a full-size window:
+when the window is resized the loader takes the smallest level that is at
+least as large as the card and only does a cheap final resize from it.
+
+Run from the GUI_game folder after changing card art or render sizes::
+
+    python atlas.py
+"""
+
+
+import json
+import math
+import os
+
+from PIL import Image
+
+
+# (width, height) of the card faces: half, full and double the size in a
+# full-size window
+ATLAS_SIZES = [(75, 100), (150, 200), (300, 400)]
+
+CARD_FOLDER = os.path.join("visuals", "mixed_cards")
+ATLAS_IMAGE = os.path.join("visuals", "atlas", "card_atlas.png")
+ATLAS_INDEX = os.path.join("visuals", "atlas", "card_atlas.json")
+
+
+def size_key(size):
+    """Return the index key of a render size, e.g. '150x200'."""
+    return f"{size[0]}x{size[1]}"
+
+
+def build_atlas(card_list, sizes=ATLAS_SIZES, card_folder=CARD_FOLDER,
+                image_path=ATLAS_IMAGE, index_path=ATLAS_INDEX):
+    """
+    Pack every card at every size into one sheet and write its index.
+
+    Each size gets its own band of rows so cells in a band share a height.
+    Cards are stored with their alpha channel; the loader flattens them onto
+    its own background color.
+
+    Parameters
+    ----------
+    card_list : list of tuple
+        (card_name, filename) pairs, normally ``CARD_LIST``.
+    sizes : list of tuple of int
+        Render sizes to pack.
+    card_folder : str
+        Folder holding the source card images.
+    image_path, index_path : str
+        Output paths of the sheet and its JSON index.
+
+    Returns
+    -------
+    dict
+        The index that was written.
+    """
+
+    columns = math.ceil(math.sqrt(len(card_list)))
+    rows = math.ceil(len(card_list) / columns)
+    sheet_width = max(w for w, _ in sizes) * columns
+    sheet_height = sum(h * rows for _, h in sizes)
+    sheet = Image.new("RGBA", (sheet_width, sheet_height), (0, 0, 0, 0))
+
+    index = {"image": os.path.basename(image_path), "cards": {}}
+    band_y = 0
+    for size in sizes:
+        width, height = size
+        boxes = {}
+        for i, (card_name, filename) in enumerate(card_list):
+            source = os.path.join(card_folder, filename)
+            img = Image.open(source).convert("RGBA").resize(size, Image.LANCZOS)
+            x = (i % columns) * width
+            y = band_y + (i // columns) * height
+            sheet.paste(img, (x, y))
+            boxes[card_name] = [x, y, width, height]
+        index["cards"][size_key(size)] = boxes
+        band_y += rows * height
+
+    os.makedirs(os.path.dirname(image_path), exist_ok=True)
+    sheet.save(image_path, optimize=True)
+    with open(index_path, "w") as f:
+        json.dump(index, f, indent=1)
+    return index
+
+
+if __name__ == "__main__":
+    from Classes.Card import CARD_LIST
+
+    index = build_atlas(CARD_LIST)
+    print(f"Packed {len(CARD_LIST)} cards at {len(ATLAS_SIZES)} size(s) into {ATLAS_IMAGE}")
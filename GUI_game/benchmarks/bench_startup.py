@@ -0,0 +1,78 @@
+"""
+Startup benchmark: import time of the core game logic and of the full GUI.
+
+Every measurement runs in a fresh interpreter so nothing is already cached in
+sys.modules. Run from the repository root:
+
+    python GUI_game/benchmarks/bench_startup.py [--repeat 7] [--json out.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.dirname(GAME_DIR)
+
+# name -> module imported in the fresh interpreter
+TARGETS = {
+    "core": "GUI_game.Classes.Engine",
+    "gui": "GUI",
+}
+
+_SNIPPET = ("import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import {module}\n"
+            "elapsed = time.perf_counter() - start\n"
+            "heavy = sorted(m for m in ('tkinter', 'PIL', 'numpy') if m in sys.modules)\n"
+            "print(elapsed, ','.join(heavy))\n")
+
+
+def time_import(module):
+    """Import module in a new interpreter; return (seconds, heavy modules loaded)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_DIR, GAME_DIR, env.get("PYTHONPATH")]))
+    out = subprocess.run([sys.executable, "-c", _SNIPPET.format(module=module)],
+                         capture_output=True, text=True, cwd=GAME_DIR, env=env, check=True)
+    elapsed, _, heavy = out.stdout.strip().partition(" ")
+    return float(elapsed), [m for m in heavy.split(",") if m]
+
+
+def run(repeat=7):
+    """Return {target: {"median_s", "min_s", "loads"}} over repeat fresh imports."""
+    results = {}
+    for name, module in TARGETS.items():
+        samples = []
+        heavy = []
+        for _ in range(repeat):
+            try:
+                elapsed, heavy = time_import(module)
+            except subprocess.CalledProcessError as exc:
+                results[name] = {"error": exc.stderr.strip().splitlines()[-1]}
+                break
+            samples.append(elapsed)
+        else:
+            results[name] = {"module": module, "median_s": statistics.median(samples),
+                             "min_s": min(samples), "loads": heavy}
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:5s} {result['error']}")
+        else:
+            loads = ", ".join(result["loads"]) or "no GUI/NumPy modules"
+            print(f"{name:5s} {result['median_s'] * 1000:8.2f} ms  (min {result['min_s'] * 1000:.2f} ms; loads {loads})")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1)
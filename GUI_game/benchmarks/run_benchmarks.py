@@ -0,0 +1,307 @@
+"""
+Benchmark suite for the rule, engine and rendering hot paths.
+
+Every benchmark is timed over several samples after a warm-up; per-call
+median and minimum times are reported and can be written as JSON and compared
+against a stored baseline. Run from the repository root:
+
+    python GUI_game/benchmarks/run_benchmarks.py --json results.json
+    python GUI_game/benchmarks/run_benchmarks.py --save-baseline GUI_game/benchmarks/baseline.json
+    python GUI_game/benchmarks/run_benchmarks.py --baseline GUI_game/benchmarks/baseline.json
+
+A comparison exits with status 1 when any benchmark's median is slower than
+the baseline by more than --threshold (default 1.25x). Baselines depend on
+the machine, so store one per machine that runs the comparison.
+
+The ImageLoader and Display_player_cards benchmarks need Tk and a display.
+Without $DISPLAY they are skipped, unless --xvfb is given and Xvfb is
+installed, in which case a virtual display is started for the run.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+GAME_DIR = os.path.dirname(BENCH_DIR)
+REPO_DIR = os.path.dirname(GAME_DIR)
+for path in (REPO_DIR, GAME_DIR, BENCH_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from GUI_game.Classes.Card import CARD_NAMES, Create_binary_code
+from GUI_game.Classes.Engine import play_game, random_policy
+from GUI_game.Classes.Game import Game
+
+
+class Skip(Exception):
+    """Raised by a benchmark that cannot run here."""
+
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark. The function returns (setup, run): setup() builds
+    the input of one call outside the timing, run(state) is the timed call."""
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def measure(setup, run, samples, min_time):
+    """Return per-call times (seconds) of run over samples, each lasting about min_time."""
+    number = 1
+    while True:  # calibrate calls per sample
+        states = [setup() for _ in range(number)]
+        start = time.perf_counter()
+        for state in states:
+            run(state)
+        if time.perf_counter() - start >= min_time or number >= 1 << 20:
+            break
+        number *= 4
+    timings = []
+    for _ in range(samples):
+        states = [setup() for _ in range(number)]
+        start = time.perf_counter()
+        for state in states:
+            run(state)
+        timings.append((time.perf_counter() - start) / number)
+    return timings
+
+
+# -- rules -----------------------------------------------------------------
+
+def _hand_bench(size):
+    rng = random.Random(size)
+    hands = [[rng.choice(CARD_NAMES) for _ in range(size)] for _ in range(64)]
+    tables = [rng.choice(CARD_NAMES[:20]) for _ in range(64)]
+    cases = iter(range(1 << 62))
+
+    def setup():
+        i = next(cases) % 64
+        return tables[i], hands[i]
+
+    return setup, lambda state: Create_binary_code(*state)
+
+
+for _size in (1, 7, 18, 40):
+    benchmark(f"rules.create_binary_code[hand={_size}]")(lambda size=_size: _hand_bench(size))
+
+
+# -- game and engine -------------------------------------------------------
+
+@benchmark("game.init_and_shuffle_deck")
+def _bench_shuffle():
+    rng = random.Random(1)
+    return (lambda: Game(rng=rng, verbose=False)), (lambda game: game.init_and_shuffle_deck())
+
+
+@benchmark("game.deal_cards")
+def _bench_deal():
+    rng = random.Random(2)
+
+    def setup():
+        game = Game(rng=rng, verbose=False)
+        game.init_and_shuffle_deck()
+        return game
+
+    return setup, lambda game: game.deal_cards(3, 7, start_table_card=False)
+
+
+@benchmark("game.ensure_numeric_table_start")
+def _bench_numeric_start():
+    rng = random.Random(3)
+
+    def setup():
+        game = Game(rng=rng, verbose=False)
+        game.init_and_shuffle_deck()
+        return game
+
+    return setup, lambda game: game.ensure_numeric_table_start()
+
+
+@benchmark("engine.play_game[3 random]")
+def _bench_play_game():
+    seeds = iter(range(1 << 62))
+    policies = [random_policy] * 3
+    return (lambda: next(seeds)), (lambda seed: play_game(policies, seed=seed))
+
+
+# -- rendering -------------------------------------------------------------
+
+_tk_root = None
+
+
+def _root():
+    """One hidden Tk root for all rendering benchmarks."""
+    global _tk_root
+    if _tk_root is None:
+        try:
+            import tkinter as tk
+            _tk_root = tk.Tk()
+        except Exception as exc:
+            raise Skip(f"no Tk display ({exc.__class__.__name__})")
+        _tk_root.withdraw()
+    return _tk_root
+
+
+def _card_path(name):
+    return os.path.join("visuals", "mixed_cards", f"{name}.png")
+
+
+@benchmark("image_loader.load_card_image[cold]")
+def _bench_load_cold():
+    _root()
+    from GUI import ImageLoader
+    names = iter(range(1 << 62))
+
+    def setup():
+        return ImageLoader(), _card_path(CARD_NAMES[next(names) % len(CARD_NAMES)])
+
+    return setup, lambda state: state[0].load_card_image(state[1], (150, 200))
+
+
+@benchmark("image_loader.load_card_image[warm]")
+def _bench_load_warm():
+    _root()
+    from GUI import ImageLoader
+    loader = ImageLoader()
+    loader.preload(CARD_NAMES, (150, 200))
+    names = iter(range(1 << 62))
+    return ((lambda: _card_path(CARD_NAMES[next(names) % len(CARD_NAMES)])),
+            (lambda path: loader.load_card_image(path, (150, 200))))
+
+
+@benchmark("display_player_cards.redraw[7 cards]")
+def _bench_redraw():
+    root = _root()
+    from GUI import ImageLoader, Display_player_cards
+    loader = ImageLoader()
+    loader.preload(CARD_NAMES, (150, 200))
+    rng = random.Random(4)
+    view = Display_player_cards(root, loader, [], [])
+    hands = [(rng.sample(CARD_NAMES, 7), [rng.randint(0, 1) for _ in range(7)]) for _ in range(32)]
+    cases = iter(range(1 << 62))
+
+    def run(hand):
+        view.update(*hand)
+        root.update_idletasks()
+
+    return (lambda: hands[next(cases) % len(hands)]), run
+
+
+# -- runner ----------------------------------------------------------------
+
+def start_xvfb():
+    """Start Xvfb on a free display number and point $DISPLAY at it."""
+    if shutil.which("Xvfb") is None:
+        return None
+    for number in range(99, 120):
+        if os.path.exists(f"/tmp/.X{number}-lock"):
+            continue
+        proc = subprocess.Popen(["Xvfb", f":{number}", "-screen", "0", "2000x1300x24"],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        time.sleep(0.5)
+        if proc.poll() is None:
+            os.environ["DISPLAY"] = f":{number}"
+            return proc
+    return None
+
+
+def run_all(selected=None, samples=7, min_time=0.05, startup=True):
+    results = {}
+    for name, factory in BENCHMARKS.items():
+        if selected and not any(part in name for part in selected):
+            continue
+        try:
+            setup, run = factory()
+            timings = measure(setup, run, samples, min_time)
+        except Skip as reason:
+            results[name] = {"skipped": str(reason)}
+            continue
+        results[name] = {"median_s": statistics.median(timings), "min_s": min(timings),
+                         "samples": samples}
+    if startup and (not selected or any("startup" in part for part in selected)):
+        import bench_startup
+        for target, result in bench_startup.run(repeat=samples).items():
+            if "error" in result:
+                results[f"startup.import[{target}]"] = {"skipped": result["error"]}
+            else:
+                results[f"startup.import[{target}]"] = {"median_s": result["median_s"],
+                                                        "min_s": result["min_s"], "samples": samples}
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return the names of benchmarks whose median regressed beyond threshold."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base or "median_s" not in base or "median_s" not in result:
+            continue
+        ratio = result["median_s"] / base["median_s"]
+        result["baseline_median_s"] = base["median_s"]
+        result["ratio"] = ratio
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def _format(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument("filter", nargs="*", help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--samples", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per sample")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against this baseline file")
+    parser.add_argument("--save-baseline", metavar="PATH", help="store these results as a baseline")
+    parser.add_argument("--threshold", type=float, default=1.25, help="allowed slowdown ratio")
+    parser.add_argument("--xvfb", action="store_true", help="start Xvfb if there is no display")
+    args = parser.parse_args()
+
+    os.chdir(GAME_DIR)  # image paths are relative to GUI_game
+    xvfb = start_xvfb() if args.xvfb and not os.environ.get("DISPLAY") else None
+    try:
+        results = run_all(args.filter, args.samples, args.min_time)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    regressions = []
+    if args.baseline:
+        with open(os.path.join(REPO_DIR, args.baseline) if not os.path.isabs(args.baseline) else args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:45s}  skipped: {result['skipped']}")
+            continue
+        line = f"{name:45s} {_format(result['median_s'])}  (min {_format(result['min_s']).strip()})"
+        if "ratio" in result:
+            line += f"  x{result['ratio']:.2f} vs baseline" + ("  REGRESSION" if name in regressions else "")
+        print(line)
+
+    report = {"meta": {"python": platform.python_version(), "platform": platform.platform(),
+                       "machine": platform.machine(), "time": time.strftime("%Y-%m-%dT%H:%M:%S")},
+              "results": results}
+    for path in filter(None, (args.json, args.save_baseline)):
+        path = path if os.path.isabs(path) else os.path.join(REPO_DIR, path)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=1)
+    sys.exit(1 if regressions else 0)
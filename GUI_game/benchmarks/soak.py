@@ -0,0 +1,300 @@
+"""
+Load generator and soak test for the table server (Classes/Server.py).
+
+Starts many scripted clients that join tables and play random legal moves,
+chosen with Create_binary_code like the GUI does, for a given duration. Every
+--interval seconds it prints and records:
+
+    moves/s        moves the server finished in the interval
+    p50 / p99      client-side move latency: move sent -> the turn delta back
+    rss, per table server memory and (rss - idle rss) / open tables
+
+At the end the RSS trend over the second half of the run is reported in kB
+per hour and per 1000 games; a server that does not leak stays flat once the
+table count is steady. Run from the repository root:
+
+    python GUI_game/benchmarks/soak.py --clients 3000 --duration 7200 --json soak.json
+    python GUI_game/benchmarks/soak.py --port 8765 ...     use a server that is already running
+
+With --tk-clients N, N Tk windows (client.py --auto) sit at tables with the
+bots, with instrumentation on; their widget count is sampled every 500 ms and
+the growth per game is reported, which shows widgets that are created per move
+and never destroyed. They need a display, or --xvfb with Xvfb installed.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import deque
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+GAME_DIR = os.path.dirname(BENCH_DIR)
+REPO_DIR = os.path.dirname(GAME_DIR)
+for path in (REPO_DIR, GAME_DIR, BENCH_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from GUI_game.Classes.Card import Create_binary_code
+from GUI_game.Classes.Server import Client
+from metrics import Metrics
+
+
+def raise_fd_limit():
+    """Lift the soft open-files limit to the hard limit; every client is a socket."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn_server(port, seats):
+    """Start the server in its own process, so its memory is measured alone."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_DIR, os.environ.get("PYTHONPATH")])))
+    proc = subprocess.Popen([sys.executable, "-m", "GUI_game.Classes.Server", "--port", str(port),
+                             "--seats", str(seats)], env=env)
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("the server did not start")
+
+
+def spawn_tk_clients(count, port, games, workdir):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_DIR, os.environ.get("PYTHONPATH")])))
+    clients = []
+    for number in range(count):
+        path = os.path.join(workdir, f"tk_{number}.json")
+        proc = subprocess.Popen([sys.executable, "-m", "GUI_game.client", "--port", str(port),
+                                 "--name", f"tk{number}", "--auto", "--games", str(games),
+                                 "--think-ms", "20", "--metrics", path],
+                                cwd=GAME_DIR, env=env, stdout=subprocess.DEVNULL)
+        clients.append((proc, path))
+    return clients
+
+
+class Load:
+    """Counters shared by all scripted clients."""
+
+    def __init__(self):
+        self.moves = 0
+        self.games = 0
+        self.errors = 0
+        self.window = []                          # latencies since the last report
+        self.latencies = deque(maxlen=1000000)    # for the overall percentiles
+
+
+async def scripted_client(host, port, number, load, stop_at, think_s, rng, delay=0.0):
+    """Join tables and play random legal moves until stop_at."""
+    await asyncio.sleep(delay)
+    client = await Client(f"bot{number}").connect(host, port)
+    await client.join()
+    sent_at = None
+    try:
+        while True:
+            message = await client.receive()
+            if message is None:
+                return
+            ev = message["ev"]
+            if sent_at is not None and ev in ("turn", "end", "error"):
+                latency = time.perf_counter() - sent_at
+                load.window.append(latency)
+                load.latencies.append(latency)
+                load.moves += 1
+                sent_at = None
+            if ev == "error":
+                load.errors += 1
+            elif ev == "end":
+                load.games += 1
+                if time.monotonic() >= stop_at:
+                    return
+                await client.join()
+            elif ev == "turn" and client.my_turn():
+                if think_s:
+                    await asyncio.sleep(rng.random() * think_s)
+                clickables = Create_binary_code(client.top, client.hand).binarycode
+                playable = [card for card, ok in zip(client.hand, clickables) if ok]
+                sent_at = time.perf_counter()
+                if playable:
+                    await client.play(rng.choice(playable))
+                else:
+                    await client.draw()
+    finally:
+        await client.close()
+
+
+async def server_stats(host, port):
+    client = await Client().connect(host, port)
+    client.send({"op": "stats"})
+    await client.writer.drain()
+    message = await client.receive()
+    await client.close()
+    return message
+
+
+def trend(points):
+    """Least-squares slope of y over x."""
+    if len(points) < 2:
+        return 0.0
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var if var else 0.0
+
+
+async def soak(host, port, clients, duration, interval, think_s, ramp_s, seed):
+    load = Load()
+    rng = random.Random(seed)
+    idle = await server_stats(host, port)
+    start = time.monotonic()
+    stop_at = start + duration
+    tasks = [asyncio.ensure_future(scripted_client(host, port, number, load, stop_at, think_s,
+                                                   random.Random(rng.getrandbits(64)),
+                                                   delay=ramp_s * number / clients))
+             for number in range(clients)]
+
+    samples = []
+    last = await server_stats(host, port)
+    last_time = time.monotonic()
+    while time.monotonic() < stop_at and not all(task.done() for task in tasks):
+        await asyncio.sleep(min(interval, max(0.0, stop_at - time.monotonic())))
+        stats = await server_stats(host, port)
+        now = time.monotonic()
+        window, load.window = load.window, []
+        latency = Metrics.describe(window)
+        per_table = ((stats["rss_kb"] - idle["rss_kb"]) / stats["tables"]
+                     if stats["tables"] and stats["rss_kb"] is not None else None)
+        sample = {"t": now - start, "moves_per_s": (stats["moves"] - last["moves"]) / (now - last_time),
+                  "p50_ms": latency.get("p50", 0) * 1000, "p99_ms": latency.get("p99", 0) * 1000,
+                  "tables": stats["tables"], "clients": stats["clients"],
+                  "games": stats["games_finished"], "rss_kb": stats["rss_kb"], "kb_per_table": per_table}
+        samples.append(sample)
+        print(f"{sample['t']:8.0f}s {sample['moves_per_s']:9.0f} moves/s  p50 {sample['p50_ms']:7.2f} ms"
+              f"  p99 {sample['p99_ms']:7.2f} ms  tables {sample['tables']:5d}  rss {sample['rss_kb']} kB"
+              + (f"  {per_table:.1f} kB/table" if per_table is not None else ""), flush=True)
+        last, last_time = stats, now
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    steady = samples[len(samples) // 2:]
+    overall = Metrics.describe(load.latencies)
+    elapsed = time.monotonic() - start
+    return {"clients": clients, "duration_s": elapsed, "moves": load.moves, "games": load.games,
+            "errors": load.errors, "moves_per_s": load.moves / elapsed if elapsed else 0.0,
+            "latency_ms": {key: value * 1000 if key != "count" else value for key, value in overall.items()},
+            "idle_rss_kb": idle["rss_kb"],
+            "rss_growth_kb_per_hour": trend([(s["t"], s["rss_kb"]) for s in steady
+                                             if s["rss_kb"] is not None]) * 3600,
+            "rss_growth_kb_per_1k_games": trend([(s["games"], s["rss_kb"]) for s in steady
+                                                 if s["rss_kb"] is not None]) * 1000,
+            "samples": samples}
+
+
+def tk_report(clients):
+    """Widget growth and move latency of the Tk clients from their metrics files."""
+    report = []
+    for proc, path in clients:
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.terminate()
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            report.append({"error": f"no metrics (exit code {proc.returncode})"})
+            continue
+        widgets = data["samples"]["widgets"]
+        moves = data["summary"]["timings"].get("client.move", {"count": 0})
+        growth = trend([(t, count) for t, count in widgets]) * 60
+        report.append({"widgets_first": widgets[0][1] if widgets else None,
+                       "widgets_last": widgets[-1][1] if widgets else None,
+                       "widgets_per_minute": growth, "moves": moves["count"],
+                       "widgets_per_move": ((widgets[-1][1] - widgets[0][1]) / moves["count"]
+                                            if widgets and moves["count"] else None),
+                       "move_p50_ms": moves.get("p50", 0) * 1000, "move_p99_ms": moves.get("p99", 0) * 1000})
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soak-test the game server with scripted clients.")
+    parser.add_argument("--clients", type=int, default=300)
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument("--interval", type=float, default=10, help="seconds between reports")
+    parser.add_argument("--think-ms", type=float, default=0, help="max random delay before a move")
+    parser.add_argument("--ramp", type=float, default=5, help="seconds over which clients connect")
+    parser.add_argument("--seats", type=int, default=3, help="seats per table of a spawned server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="use the server already listening here")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tk-clients", type=int, default=0, help="also run this many Tk clients")
+    parser.add_argument("--tk-games", type=int, default=20, help="games each Tk client plays")
+    parser.add_argument("--xvfb", action="store_true", help="start Xvfb if there is no display")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    raise_fd_limit()
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        server = spawn_server(port, args.seats)
+    xvfb = None
+    tk_clients = []
+    workdir = tempfile.mkdtemp(prefix="soak_")
+    try:
+        if args.tk_clients:
+            if args.xvfb and not os.environ.get("DISPLAY"):
+                from run_benchmarks import start_xvfb
+                xvfb = start_xvfb()
+            tk_clients = spawn_tk_clients(args.tk_clients, port, args.tk_games, workdir)
+        report = asyncio.run(soak(args.host, port, args.clients, args.duration, args.interval,
+                                  args.think_ms / 1000, args.ramp, args.seed))
+        if tk_clients:
+            report["tk_clients"] = tk_report(tk_clients)
+    finally:
+        for proc, _ in tk_clients:
+            if proc.poll() is None:
+                proc.terminate()
+        if server is not None:
+            server.terminate()
+        if xvfb is not None:
+            xvfb.terminate()
+
+    latency = report["latency_ms"]
+    print(f"{report['moves']} moves, {report['games']} games in {report['duration_s']:.0f}s:"
+          f" {report['moves_per_s']:.0f} moves/s, p50 {latency.get('p50', 0):.2f} ms,"
+          f" p99 {latency.get('p99', 0):.2f} ms, {report['errors']} errors")
+    print(f"server rss trend: {report['rss_growth_kb_per_hour']:+.0f} kB/hour,"
+          f" {report['rss_growth_kb_per_1k_games']:+.1f} kB per 1000 games")
+    for number, tk in enumerate(report.get("tk_clients", [])):
+        if "error" in tk:
+            print(f"tk client {number}: {tk['error']}")
+        else:
+            print(f"tk client {number}: widgets {tk['widgets_first']} -> {tk['widgets_last']}"
+                  f" ({tk['widgets_per_move'] or 0:+.2f} per move), move p50 {tk['move_p50_ms']:.1f} ms")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=1)
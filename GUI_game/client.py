@@ -0,0 +1,263 @@
+"""
+Tk client for a game hosted by Classes/Server.py.
+
+    python -m GUI_game.client --host 127.0.0.1 --port 8765 --name ann
+
+Run it from the directory that holds GUI_game. The server decides every
+move: the window only shows the deltas it receives and sends the clicks.
+"""
+import json
+import os
+import queue
+import random
+import socket
+import sys
+import threading
+import time
+
+from GUI_game.Classes.Card import CARD_FILE_MAP
+
+# GUI.py sits next to this file
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import metrics
+
+
+class Remote_table:
+    """
+    Thin Tk client of a Classes/Server.py game server.
+
+    The window holds no Game: it only shows what the server's deltas say. A
+    reader thread puts every received message on a queue that the Tk thread
+    drains from a ``root.after`` poll, so Tk is never touched off its thread.
+    Clicking a playable card sends a play, clicking the deck sends a draw.
+
+    With ``auto`` the client plays random legal moves by itself, ``think_ms``
+    after its turn starts, and joins a new table after each game until it has
+    played ``games`` games; this is what benchmarks/soak.py runs to watch the
+    widget count of a long-lived window.
+    """
+
+    poll_ms = 15
+
+    def __init__(self, host="127.0.0.1", port=8765, name="", auto=False, games=1, think_ms=200):
+        self.name               = name
+        self.auto               = auto
+        self.games_left         = games
+        self.think_ms           = think_ms
+        self.rng                = random.Random()
+        self.sent_at            = None
+        self.sock               = socket.create_connection((host, port))
+        self.inbox              = queue.Queue()
+        self.seat               = None
+        self.hand               = []
+        self.top                = None
+        self.hands              = []
+        self.names              = []
+        self.turn               = None
+        self.playable           = []    # what the server allows this seat to play now
+        self.pending            = None  # move sent, not yet answered by the server
+        self.winner             = None
+        self.app                = None
+        self.root               = None
+        self.image_loader       = None
+        self.hand_view          = None
+        self.drew               = False  # slide the next new hand slot in from the deck
+        threading.Thread(target=self._read, daemon=True).start()
+        self.send({"op": "join", "name": name})
+
+    def send(self, message):
+        self.sock.sendall(json.dumps(message).encode() + b"\n")
+
+    def _read(self):
+        """Reader thread: queue every message, then None when the server closes."""
+        for line in self.sock.makefile("rb"):
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(message, dict) and "ev" in message:
+                self.inbox.put(message)
+        self.inbox.put(None)
+
+    def open_window(self):
+        from GUI import GUI, ImageLoader, Display_full_deck, Build_buttons
+
+        self.app = GUI()
+        self.root = self.app.main_window()
+        self.app.draw_black_square()
+        self.app.draw_table_square()
+        self.image_loader = ImageLoader(bg_color=(0, 128, 0), root=self.root, workers=4)
+        self.image_loader.load_atlas()
+        self.image_loader.preload(CARD_FILE_MAP, self.app.canvas.scaled((150, 200)))
+        Display_full_deck(self.root, self.image_loader, on_click=self.draw_clicked)
+        Build_buttons(self.root).manage_buttons()
+        self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        while True:
+            try:
+                message = self.inbox.get_nowait()
+            except queue.Empty:
+                break
+            if message is None:
+                print("Connection closed by the server.")
+                self.root.destroy()
+                return
+            self.apply(message)
+        self.root.after(self.poll_ms, self._poll)
+
+    def apply(self, message):
+        """Update the view for one server message."""
+        from GUI import Display_first_card
+
+        ev = message["ev"]
+        if ev == "played":
+            self.top = message["card"]
+            Display_first_card(self.root, self.image_loader, card_name=self.top,
+                               from_xy=self.played_from(message["seat"], self.top))
+            if message["seat"] == self.seat:
+                self.hand.remove(message["card"])
+        elif ev == "drew" and "card" in message:
+            self.hand.append(message["card"])
+            self.drew = True
+        elif ev == "hand":
+            self.hands[message["seat"]] = message["count"]
+            self.show_hand_counts()
+        elif ev == "cards":
+            self.hand = message["hand"]
+        elif ev == "turn":
+            self._move_answered()
+            self.turn     = message["seat"]
+            self.playable = message.get("playable", [])
+            self.show_hand()
+            if self.auto and self.turn == self.seat:
+                self.root.after(self.think_ms, self._auto_move)
+        elif ev == "start":
+            self.seat  = message["seat"]
+            self.hand  = message["hand"]
+            self.top   = message["top"]
+            self.hands = message["hands"]
+            self.names = [name or f"Player {seat + 1}" for seat, name in enumerate(message["names"])]
+            self.turn  = message["turn"]
+            self.app.player_names = self.names
+            self.app.display_player_names()
+            self.show_hand_counts()
+            Display_first_card(self.root, self.image_loader, card_name=self.top)
+            self.show_hand()
+        elif ev == "joined":
+            self.seat   = message["seat"]
+            self.winner = None
+            print(f"Seat {self.seat + 1} at table {message['table']}, waiting for players...")
+        elif ev == "end":
+            self._move_answered()
+            self.winner = message["winner"]
+            self.games_left -= 1
+            print("Game over. " + ("A player left." if self.winner < 0 else
+                                   f"Winner: {self.names[self.winner]}"))
+            if self.games_left > 0:
+                self.root.after(self.think_ms, self.send, {"op": "join", "name": self.name})
+            else:
+                self.root.after(1500, self.root.destroy)
+        elif ev == "error":
+            print(f"Server: {message['msg']}")
+            if self.pending is not None:
+                # the move was rejected: it is still this seat's turn
+                self.pending = None
+                self.sent_at = None
+                self.turn    = self.seat
+                self.show_hand()
+                if self.auto:
+                    self.root.after(self.think_ms, self._auto_move)
+
+    def show_hand(self):
+        """Show this seat's hand; only clickable while it is this seat's turn."""
+        from GUI import Display_player_cards
+
+        if self.turn == self.seat and self.winner is None:
+            playable = set(self.playable)
+            clickables = [1 if card in playable else 0 for card in self.hand]
+        else:
+            clickables = [0] * len(self.hand)
+        if self.hand_view is None:
+            self.hand_view = Display_player_cards(self.root, self.image_loader, self.hand,
+                                                  clickables, on_card_click=self.card_clicked)
+        else:
+            deck = self.app.canvas.rel(0.5, 0.5) if self.drew else None
+            self.hand_view.update(self.hand, clickables, animate_from=deck)
+        self.drew = False
+
+    def played_from(self, seat, card_name):
+        """Where a played card starts its flight: its hand slot, or the player's name."""
+        if seat == self.seat and self.hand_view is not None and card_name in self.hand_view.card_array:
+            return self.hand_view.card_loc[self.hand_view.card_array.index(card_name)]
+        if seat < len(self.app.name_labels):
+            return self.app.canvas.position(self.app.name_labels[seat])
+        return None
+
+    def show_hand_counts(self):
+        for seat, name in enumerate(self.names):
+            marker = " *" if seat == self.seat else ""
+            self.app.set_player_label(seat, f"{name}{marker} ({self.hands[seat]})")
+
+    def card_clicked(self, card_name):
+        """Send the play; the table card is drawn when the server confirms it."""
+        if self.turn != self.seat:
+            return False
+        self._send_move({"op": "play", "card": card_name})
+        return False
+
+    def draw_clicked(self):
+        if self.turn != self.seat or self.winner is not None:
+            return
+        self._send_move({"op": "draw"})
+
+    def _send_move(self, message):
+        self.turn    = None  # no second move until the server answers
+        self.pending = message
+        self.sent_at = time.perf_counter()
+        self.send(message)
+
+    def _move_answered(self):
+        if self.sent_at is not None and metrics.active is not None:
+            metrics.active.record("client.move", time.perf_counter() - self.sent_at)
+        self.sent_at = None
+        self.pending = None
+
+    def _auto_move(self):
+        """Play a random card the server listed as playable, or draw."""
+        if self.turn != self.seat or self.winner is not None:
+            return
+        playable = [card for card in self.hand if card in self.playable]
+        if playable:
+            self.hand_view._handle_click(self.rng.choice(playable))
+        else:
+            self.draw_clicked()
+
+    def run(self, metrics_path=None):
+        self.open_window()
+        if metrics_path:
+            metrics.enable().watch(self.root, self.image_loader)
+        try:
+            self.root.mainloop()
+        finally:
+            self.image_loader.shutdown()
+            self.sock.close()
+            if metrics_path:
+                metrics.disable().dump(metrics_path)
+        return self.winner
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Join a game on a card game server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--name", default="")
+    parser.add_argument("--auto", action="store_true", help="play random legal moves")
+    parser.add_argument("--games", type=int, default=1, help="games to play before closing")
+    parser.add_argument("--think-ms", type=int, default=200, help="delay before an automatic move")
+    parser.add_argument("--metrics", metavar="PATH", help="record UI timings and write them here as JSON")
+    args = parser.parse_args()
+    Remote_table(args.host, args.port, args.name, auto=args.auto, games=args.games,
+                 think_ms=args.think_ms).run(args.metrics)
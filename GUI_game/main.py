@@ -1,22 +1,30 @@
+import os
+import sys
 import time
 
-from GUI_game.Classes import Player
 from GUI_game.Classes.Game import Game
-from GUI_game.Classes.Card import Create_binary_code, Card_compatibility
-from GUI_game.Classes.Player import get_player_hand
-from GUI import (GUI, ImageLoader, Display_full_deck, Display_first_card,
-                      Build_buttons, Display_player_decks, Display_player_cards)
+from GUI_game.Classes.Card import CARD_FILE_MAP
+from GUI_game.Classes.AI import Mcts_player, DRAW
+from GUI_game.Classes.Replay import Game_log
+
+# GUI.py sits next to this file; it is imported only when a window is opened
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import metrics
 
 players = 1  # connect with names later
 # python
-def Initialize_start_game():
+def Initialize_start_game(log=None):
+    from GUI import (GUI, ImageLoader, Display_full_deck, Display_first_card,
+                     Build_buttons)
+
     # Initialize Game
     game = Game()
+    game.log = log  # record the deal and every move, see Classes/Replay.py
 
     # Initialize deck and deal cards
     game.init_and_shuffle_deck()
     game.deal_cards(3, 7)
-    face_up_card = game.table()
+    face_up_card = game.top_card()
 
     # Initialize GUI
     app = GUI()
@@ -25,80 +33,216 @@ def Initialize_start_game():
     app.draw_black_square()
     app.draw_table_square()
     app.display_player_names()
-    image_loader = ImageLoader(bg_color=(0, 128, 0))
-    Display_full_deck(root, image_loader)
+    image_loader = ImageLoader(bg_color=(0, 128, 0), root=root, workers=4)
+    image_loader.load_atlas()
+    image_loader.preload(CARD_FILE_MAP, app.canvas.scaled((150, 200)))
+    app.deck_view = Display_full_deck(root, image_loader)  # on_click is set by the scheduler
     Display_first_card(root, image_loader, face_up_card)
     buttons = Build_buttons(root)
     buttons.manage_buttons()
 
-    # add a flag the GUI can toggle to advance the turn (start held)
-    root.advance_turn = False
-
-    # test print
-    print(face_up_card)
     # Return the game instance so callers can access game.players
     return game, app, root, image_loader
 
 
-def update_game():
-    game, app, root, image_loader = Initialize_start_game()
-
-    # use an index to rotate through the players list
-    current_player_idx = 0
-    game_over = False
-    tick_delay = 0.1  # seconds between UI updates
+class Turn_scheduler:
+    """
+    Drives the turns from Tk events instead of a polling loop.
+
+    The hand of the current player is only redrawn when the turn changes. A
+    played card generates a ``<<TurnAdvanced>>`` virtual event, so Tk stays
+    idle between clicks and the next player is shown as soon as the event is
+    processed.
+
+    Seats listed in ``bots`` (seat index -> Mcts_player) are played by the
+    bot: their hand is shown without clickables and the bot's move is made
+    from a ``root.after`` callback once the hand is on screen.
+
+    The scheduler subscribes to every player's hand, so a hand on screen is
+    redrawn when it changes, e.g. after a draw, instead of being polled. The
+    clickables come from the player's cached playable mask. A card drawn into
+    the hand on screen slides in from the deck.
+
+    Clicking the deck (``draw_clicked``) draws a card for a human player and
+    passes the turn, e.g. when no card in hand can be played.
+    """
+
+    TURN_EVENT = "<<TurnAdvanced>>"
+    draw_pause_ms = 300  # a drawn card lands before the next hand is shown
+
+    def __init__(self, game, root, image_loader, bots=None):
+        self.game               = game
+        self.root               = root
+        self.image_loader       = image_loader
+        self.bots               = bots or {}
+        self.table_card         = game.top_card()
+        self.winner_id          = None
+        self.hand_view          = None
+        self.redraw_pending     = False
+        self.drawing            = False  # a card was drawn, the turn passes after draw_pause_ms
+        self.root.bind(self.TURN_EVENT, self._on_turn_advanced)
+        for player in game.players:
+            player.subscribe(self._hand_changed)
+
+    def start(self):
+        """Show the first player's hand once the main loop is running."""
+        self.root.after_idle(self.show_turn)
+
+    def current_player(self):
+        return self.game.current_player()
+
+    def show_turn(self):
+        """Display the current player's cards with their clickables."""
+        m = metrics.active
+        start = time.perf_counter() if m is not None else 0.0
+        bot = self.bots.get(self.game.current_idx)
+        if bot is not None:
+            self.root.after(50, self._bot_move, bot)
+        self.show_hand()
+        if m is not None:
+            m.record("turn.show_turn", time.perf_counter() - start)
+
+    def show_hand(self, animate_from=None):
+        """Show the current player's hand, clickable unless a bot plays the seat.
+        New cards slide in from animate_from, a table point such as the deck."""
+        from GUI import Display_player_cards
+
+        player = self.current_player()
+        if self.game.current_idx in self.bots or self.drawing:
+            clickables = [0] * len(player.hand)
+        else:
+            clickables = self.game.playable_mask(player)  # list of 0/1 indicating playable cards
+        if self.hand_view is None:
+            self.hand_view = Display_player_cards(self.root, self.image_loader, player.get_hand(),
+                                                  clickables, on_card_click=self.card_clicked)
+        else:
+            self.hand_view.update(player.get_hand(), clickables, animate_from=animate_from)
+
+    def deck_position(self):
+        from GUI import table_canvas
+
+        return table_canvas(self.root).rel(0.5, 0.5)
+
+    def _hand_changed(self, player):
+        """Subscriber of every hand: redraw once when the hand on screen changed."""
+        if player is self.current_player() and self.hand_view is not None and not self.redraw_pending:
+            self.redraw_pending = True
+            self.root.after_idle(self._redraw_hand)
+
+    def _redraw_hand(self):
+        self.redraw_pending = False
+        drew = len(self.current_player().hand) > len(self.hand_view.card_array)
+        self.show_hand(animate_from=self.deck_position() if drew else None)
+
+    def card_clicked(self, card_name):
+        """Play the clicked card and hand the turn to the next player."""
+        if not self.game.play_card(card_name, self.current_player()):
+            return False
+        self.table_card = self.game.top_card()
+        self.advance_turn()
+        return True
+
+    def draw_clicked(self):
+        """Deck click: the human player to move draws a card and the turn passes."""
+        if self.game.current_idx in self.bots or self.drawing or self.winner_id is not None:
+            return
+        self._draw_and_pass()
+
+    def _draw_and_pass(self):
+        """Draw for the seat to move, show the card sliding in, then pass the turn."""
+        self.drawing = True
+        self.game.draw_card(self.current_player())
+        self.show_hand(animate_from=self.deck_position())
+        self.root.after(self.draw_pause_ms, self.advance_turn)
+
+    def _bot_move(self, bot):
+        """Let a bot play or draw for the current seat."""
+        from GUI import Display_first_card
+
+        card_name = bot.choose(self.game)
+        if card_name == DRAW:
+            self._draw_and_pass()
+            return
+        shown = self.hand_view.card_array
+        from_xy = self.hand_view.card_loc[shown.index(card_name)] if card_name in shown else None
+        self.game.play_card(card_name, self.current_player())
+        self.table_card = self.game.top_card()
+        Display_first_card(self.root, self.image_loader, card_name=card_name, from_xy=from_xy)
+        self.advance_turn()
+
+    def advance_turn(self):
+        """Queue the turn-advanced event; it runs after the click is handled."""
+        self.root.event_generate(self.TURN_EVENT, when="tail")
+
+    def _on_turn_advanced(self, event=None):
+        self.drawing = False
+        # correct win condition check (length of hand)
+        if len(self.current_player().hand) == 0:
+            self.winner_id = self.game.current_idx
+            print(f"Game over. Winner: player {self.winner_id}")
+            self.root.destroy()
+            return
+        self.game.advance_turn()
+        self.show_turn()
+
+
+def update_game(bot_seats=(), bot_time_budget=0.3, log_path=None, metrics_path=None):
+    """
+    Run one game in a Tk window.
+
+    bot_seats lists the players (1-based, as in Player.id) that are played by
+    an Mcts_player answering within bot_time_budget seconds. With log_path
+    the game is appended to that binary game log for later replay. With
+    metrics_path, frame times, click-to-table latency, image cache stats and
+    widget counts are recorded and written there as JSON when the game ends.
+    """
+    from GUI import Display_player_decks
+
+    log_file = open(log_path, "ab") if log_path else None
+    log = Game_log(log_file) if log_file else None
+    game, app, root, image_loader = Initialize_start_game(log)
+
+    if metrics_path:
+        metrics.enable().watch(root, image_loader)
 
     # Display player decks and cards (example values kept)
     Display_player_decks(root, image_loader, P1=8, P2=6)
 
-    table_card = game.table()
+    bots = {seat - 1: Mcts_player(time_budget=bot_time_budget) for seat in bot_seats}
+    scheduler = Turn_scheduler(game, root, image_loader, bots=bots)
+    app.deck_view.on_click = scheduler.draw_clicked
+    scheduler.start()
 
-    # simple turn loop: do NOT auto-advance; wait for root.advance_turn to become True
-    while not game_over and getattr(root, "winfo_exists", lambda: True)():
+    # Tk sleeps until the next click or scheduled callback
+    try:
+        root.mainloop()
+    except KeyboardInterrupt:
         try:
-            root.update_idletasks()
-            root.update()
+            root.destroy()
         except Exception:
-            # window closed or Tk error -> exit loop
-            break
-
-        # current player by index
-        current_player = game.players[current_player_idx]
-        current_player_hand = getattr(current_player, "hand", [])
-
-        # build the binary code
-        checker = Create_binary_code(table_card, current_player_hand)
-        clickables = checker.binarycode  # list of 0/1 indicating playable cards
-        # Display current player's cards with clickables
-        Display_player_cards(root, image_loader, current_player_hand, clickables)
-        # test print
-        # print("Table:", table_card, "Current Hand:", current_player_hand, "Clickables:", clickables)
-
-        #game.play_card(current_player_hand, current_player)
-
-        # correct win condition check (length of hand)
-        if len(current_player_hand) == 0:
-            game_over = True
-            winner_id = current_player_idx
-            break
-
-        # only advance to next player when GUI sets root.advance_turn = True
-        if getattr(root, "advance_turn", False):
-            root.advance_turn = False
-            current_player_idx = (current_player_idx + 1) % len(game.players)
-
-        time.sleep(tick_delay)
-
-    if game_over:
-        print(f"Game over. Winner: player {winner_id}")
-
-    try:
-        root.destroy()
-    except Exception:
-        pass
+            pass
+    image_loader.shutdown()
+    if metrics_path:
+        metrics.disable().dump(metrics_path)
+    if log is not None:
+        log.end(-1 if scheduler.winner_id is None else scheduler.winner_id)
+        log.close()
+        log_file.close()
+    return scheduler.winner_id
 
 
 
 
 if __name__ == "__main__":
-    update_game()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play the card game.")
+    parser.add_argument("--bot", type=int, action="append", default=[], metavar="PLAYER",
+                        help="let the AI play this player (1-3); may be repeated")
+    parser.add_argument("--bot-time", type=float, default=0.3,
+                        help="seconds the AI may think per move")
+    parser.add_argument("--log", metavar="PATH", help="append the game to this game log")
+    parser.add_argument("--metrics", metavar="PATH", help="record UI timings and write them here as JSON")
+    args = parser.parse_args()
+    update_game(bot_seats=args.bot, bot_time_budget=args.bot_time, log_path=args.log,
+                metrics_path=args.metrics)
\ No newline at end of file
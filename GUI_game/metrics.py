@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Optional in-process instrumentation for a live game.
+
+Instrumentation is off unless ``enable()`` is called. The GUI and turn
+scheduler read ``metrics.active`` once per event and only time anything when
+it is not None, so a disabled build costs one attribute lookup per event.
+``disable()`` also stops the periodic sampling started by ``Metrics.watch``.
+
+What is recorded
+----------------
+timings
+    Duration of each UI callback (hand redraw, table card, deck displays),
+    keyed by name.
+click_to_table
+    Time from a card click to the played card being drawn on the table.
+loop_lag
+    How late a periodic ``root.after`` tick fires; long lags are stalls of
+    the Tk event loop.
+widgets
+    Live widget count under the root, sampled with the loop lag.
+image_cache
+    ``ImageLoader.stats()`` sampled with the loop lag.
+
+Use ``Metrics.summary()`` for percentiles in process or ``Metrics.dump(path)``
+to write everything as JSON.
+"""
+
+
+import json
+import time
+from collections import deque
+
+
+active = None  # the enabled Metrics instance, or None
+
+
+def enable(max_samples=10000):
+    """Turn instrumentation on and return the Metrics instance."""
+    global active
+    active = Metrics(max_samples)
+    return active
+
+
+def disable():
+    """Turn instrumentation off; the last Metrics instance is returned."""
+    global active
+    metrics, active = active, None
+    if metrics is not None:
+        metrics.stop()
+    return metrics
+
+
+def count_widgets(widget):
+    """Return the number of widgets below (and including) widget."""
+    total = 1
+    stack = list(widget.winfo_children())
+    while stack:
+        child = stack.pop()
+        total += 1
+        stack.extend(child.winfo_children())
+    return total
+
+
+class Metrics:
+    """
+    Bounded sample store for timings, latencies and periodic UI samples.
+
+    Parameters
+    ----------
+    max_samples : int
+        Samples kept per series; older samples are dropped.
+    """
+
+    def __init__(self, max_samples=10000):
+        self.max_samples    = max_samples
+        self.started        = time.perf_counter()
+        self.timings        = {}
+        self.click_to_table = deque(maxlen=max_samples)
+        self.loop_lag       = deque(maxlen=max_samples)
+        self.widgets        = deque(maxlen=max_samples)  # (seconds since start, count)
+        self.image_cache    = deque(maxlen=max_samples)  # (seconds since start, stats)
+        self.pending_click  = None
+        self.root           = None
+        self.image_loader   = None
+        self.interval_ms    = 0
+        self.next_tick      = None
+        self.after_id       = None  # the pending _tick, see watch()
+
+    def record(self, name, seconds):
+        """Add one duration to the series name."""
+        series = self.timings.get(name)
+        if series is None:
+            series = self.timings[name] = deque(maxlen=self.max_samples)
+        series.append(seconds)
+
+    def click_started(self):
+        """Mark the moment a card was clicked."""
+        self.pending_click = time.perf_counter()
+
+    def table_updated(self):
+        """Close the latency of the last click, if any, when the table card is drawn."""
+        if self.pending_click is not None:
+            self.click_to_table.append(time.perf_counter() - self.pending_click)
+            self.pending_click = None
+
+    def watch(self, root, image_loader=None, interval_ms=500):
+        """Sample loop lag, widget count and image cache stats every interval_ms."""
+        self.root = root
+        self.image_loader = image_loader
+        self.interval_ms = interval_ms
+        self.next_tick = time.perf_counter() + interval_ms / 1000
+        self.after_id = root.after(interval_ms, self._tick)
+
+    def stop(self):
+        """Cancel the periodic sampling started by watch()."""
+        if self.after_id is not None:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass  # window already destroyed
+            self.after_id = None
+
+    def _tick(self):
+        self.after_id = None
+        if active is not self:
+            return  # disabled, or replaced by a newer enable()
+        now = time.perf_counter()
+        self.loop_lag.append(max(0.0, now - self.next_tick))
+        elapsed = now - self.started
+        try:
+            self.widgets.append((elapsed, count_widgets(self.root)))
+        except Exception:
+            return  # window closed
+        if self.image_loader is not None:
+            self.image_cache.append((elapsed, self.image_loader.stats()))
+        self.next_tick = time.perf_counter() + self.interval_ms / 1000
+        self.after_id = self.root.after(self.interval_ms, self._tick)
+
+    @staticmethod
+    def describe(samples):
+        """Count, mean, p50, p99 and max of a series of seconds."""
+        if not samples:
+            return {"count": 0}
+        ordered = sorted(samples)
+        pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+        return {"count": len(ordered), "mean": sum(ordered) / len(ordered),
+                "p50": pick(0.5), "p99": pick(0.99), "max": ordered[-1]}
+
+    def summary(self):
+        """Aggregated view of everything recorded so far."""
+        return {"uptime_s": time.perf_counter() - self.started,
+                "timings": {name: self.describe(series) for name, series in self.timings.items()},
+                "click_to_table": self.describe(self.click_to_table),
+                "loop_lag": self.describe(self.loop_lag),
+                "widgets": self.widgets[-1][1] if self.widgets else None,
+                "image_cache": self.image_cache[-1][1] if self.image_cache else None}
+
+    def dump(self, path):
+        """Write the summary and the raw samples to path as JSON."""
+        data = {"summary": self.summary(),
+                "samples": {"timings": {name: list(series) for name, series in self.timings.items()},
+                            "click_to_table": list(self.click_to_table),
+                            "loop_lag": list(self.loop_lag),
+                            "widgets": list(self.widgets),
+                            "image_cache": list(self.image_cache)}}
+        with open(path, "w") as f:
+            json.dump(data, f, indent=1)
@@ -0,0 +1,25 @@
+"""Game set-up and random moves shared by the tests."""
+import random
+
+from GUI_game.Classes.Game import Game
+
+
+def new_game(seed, players=3):
+    game = Game(rng=random.Random(seed), verbose=False)
+    game.init_and_shuffle_deck()
+    game.deal_cards(players, 7)
+    return game
+
+
+def random_move(game, rng):
+    """Play a random playable card or draw for the seat to move; True if that won."""
+    player = game.current_player()
+    playable = game.playable_cards(player)
+    if playable:
+        game.play_card(rng.choice(playable), player)
+        if not player.hand:
+            return True
+    else:
+        game.draw_card(player)
+    game.advance_turn()
+    return False
@@ -0,0 +1,78 @@
+"""Undo of Game moves and the Mcts_player built on it."""
+import random
+
+import pytest
+
+from GUI_game.Classes.AI import DRAW, Mcts_player
+from GUI_game.Classes.Card import CARD_NAMES
+from GUI_game.Classes.Engine import play_game, random_policy
+from GUI_game.Classes.Game import Game
+from GUI_game.Classes.Zobrist import Transposition_table
+
+from helpers import new_game, random_move
+
+
+def state(game):
+    return ([list(player.hand) for player in game.players], list(game.shuffled_deck),
+            list(game.table_cards), game.current_idx, game.direction, game.skip_next,
+            game.extra_turn)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_rollback_restores_state_and_hash(seed):
+    rng = random.Random(seed)
+    game = new_game(seed)
+    game.enable_hashing()
+    for _ in range(rng.randrange(10)):
+        if random_move(game, rng):
+            return
+    before, value = state(game), game.hasher.value
+    mark = game.checkpoint()
+    for _ in range(60):
+        if random_move(game, rng):
+            break
+    game.rollback(mark)
+    assert state(game) == before
+    assert game.hasher.value == value
+
+
+def legal_moves(game):
+    return game.playable_cards(game.current_player()) or [DRAW]
+
+
+@pytest.mark.parametrize("budget", [{"time_budget": 0.0}, {"iterations": 0}, {"iterations": 1},
+                                    {"time_budget": 0.001}, {"iterations": 20}])
+def test_choose_returns_a_legal_move_for_any_budget(budget):
+    for seed in range(10):
+        game = new_game(seed)
+        bot = Mcts_player(rng=random.Random(seed), **budget)
+        assert bot.choose(game) in legal_moves(game)
+
+
+def test_choose_leaves_the_game_untouched():
+    game = new_game(4)
+    before = state(game)
+    Mcts_player(iterations=50, rng=random.Random(0)).choose(game)
+    assert state(game) == before
+
+
+def test_bot_keeps_working_after_the_game_grows():
+    bot = Mcts_player(iterations=30, rng=random.Random(2), transpositions=Transposition_table(1 << 10))
+    small = next(game for game in map(new_game, range(100)) if len(set(legal_moves(game))) > 1)
+    assert bot.choose(small) in legal_moves(small)
+    assert bot.keys is not None
+
+    for seed in range(100):
+        big = Game(rng=random.Random(seed), verbose=False)
+        big.init_and_shuffle_deck(list(CARD_NAMES) * 2)
+        big.deal_cards(6, 7)
+        if len(set(legal_moves(big))) > 1:
+            break
+    assert bot.choose(big) in legal_moves(big)
+
+
+def test_bot_finishes_engine_games():
+    bot = Mcts_player(iterations=20, rng=random.Random(3))
+    for seed in range(3):
+        result = play_game([bot, random_policy, random_policy], seed=seed)
+        assert result.winner in range(3)
@@ -0,0 +1,28 @@
+"""Batch simulator: the process pool must play the same games as one process."""
+from GUI_game.Classes.Batch import Batch_stats, run_batch, run_chunk, summarize
+from GUI_game.Classes.Engine import first_playable_policy, random_policy, run_games
+
+
+POLICIES = [random_policy, first_playable_policy, random_policy]
+
+
+def test_workers_give_the_same_stats_as_one_process():
+    chunks = []
+    single = run_batch(POLICIES, 900, seed=11, workers=1, chunk_size=100)
+    multi = run_batch(POLICIES, 900, seed=11, workers=3, chunk_size=100, on_rows=chunks.append)
+    assert multi.as_dict() == single.as_dict()
+    assert single.games == 900
+    # rows arrive in seed order whatever worker played them
+    rows = [value for chunk in chunks for value in chunk]
+    expected = [value for result in run_games(POLICIES, 900, seed=11) for value in summarize(result)]
+    assert rows == expected
+
+
+def test_merged_chunks_equal_one_batch():
+    merged = Batch_stats(3)
+    for start in range(0, 300, 70):
+        part = Batch_stats(3)
+        part.add_rows(run_chunk(POLICIES, start, min(70, 300 - start), {}))
+        merged.merge(part)
+    assert merged.as_dict() == run_batch(POLICIES, 300, workers=1).as_dict()
+    assert sum(merged.wins) + merged.unfinished == 300
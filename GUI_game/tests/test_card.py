@@ -0,0 +1,48 @@
+"""Card ids and the precomputed PLAYABLE table."""
+import pytest
+
+from GUI_game.Classes.Card import (CARD_ID, CARD_NAMES, NUM_CARDS, NUMERIC_CARDS, PLAYABLE,
+                                   SUPERCONDUCTION, Card, Card_compatibility, Create_binary_code,
+                                   card_id, card_name)
+from GUI_game.Classes.Effects import EFFECTS
+
+
+def fits_by_name(card, table):
+    """The rule written out on card names: same suit, same rank or special, or the wild card."""
+    if SUPERCONDUCTION in (card, table):
+        return True
+    card_suit, card_face = card.split("_")
+    table_suit, table_face = table.split("_")
+    return card_suit == table_suit or card_face == table_face
+
+
+def test_card_ids_round_trip():
+    assert len(CARD_NAMES) == len(set(CARD_NAMES)) == NUM_CARDS == len(CARD_ID)
+    for index, name in enumerate(CARD_NAMES):
+        assert card_id(name) == index
+        assert card_name(index) == name
+        assert Card.from_name(name).name == name
+        assert Card.from_id(index).id == index
+        assert Card.from_id(index) == Card.from_name(name)
+
+
+@pytest.mark.parametrize("table", CARD_NAMES)
+def test_playable_table_follows_the_rule(table):
+    row = PLAYABLE[CARD_ID[table]]
+    assert len(row) == NUM_CARDS
+    for card in CARD_NAMES:
+        assert row[CARD_ID[card]] == fits_by_name(card, table)
+        assert Card.from_name(card).fits_on(Card.from_name(table)) == fits_by_name(card, table)
+    hand = list(CARD_NAMES) + ["Z_1"]
+    assert Create_binary_code(table, hand).binarycode == list(row) + [0]
+
+
+def test_card_compatibility_agrees_with_the_card_ids():
+    for name in CARD_NAMES:
+        shown = []
+        sorted_card = Card_compatibility(name, on_common=shown.append)
+        if name in NUMERIC_CARDS:
+            assert shown == [name] and sorted_card.effect is None
+        else:
+            assert shown == [] and sorted_card.effect is EFFECTS[CARD_ID[name]]
+    assert Create_binary_code(None, ["T_1"]).binarycode == [0]
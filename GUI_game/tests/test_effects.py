@@ -0,0 +1,75 @@
+"""Special-card effects: every EFFECTS entry applied through Game.play_card."""
+import pytest
+
+from GUI_game.Classes.Card import (CARD_NAMES, CARD_PARTS, CRYOSTAT, ENTANGLEMENT, SPIN, SUPERFLUID,
+                                   TELEPORTATION)
+from GUI_game.Classes.Effects import EFFECT_BY_KIND, EFFECTS, ENTANGLEMENT_DRAWS
+
+from helpers import new_game
+
+
+SPECIAL_CARDS = [name for name, effect in zip(CARD_NAMES, EFFECTS) if effect is not None]
+
+
+def play_special(card_name, keep="T_1"):
+    """Seat 0 of a 4-seat game plays card_name, keeping one card; return the game,
+    the hands and draw pile size before the play, and the seat that moves next."""
+    game = new_game(1, players=4)
+    game.players[0].set_hand([card_name, keep])
+    hands = [list(player.hand) for player in game.players]
+    pile = len(game.shuffled_deck)
+    assert game.play_card(card_name, game.players[0])
+    return game, hands, pile, game.players.index(game.advance_turn())
+
+
+def test_only_specials_have_handlers():
+    for (_, face), effect in zip(CARD_PARTS, EFFECTS):
+        assert effect is EFFECT_BY_KIND.get(face)
+    assert len(SPECIAL_CARDS) == len(EFFECT_BY_KIND) * 4
+
+
+@pytest.mark.parametrize("card_name", [name for name in SPECIAL_CARDS if name.endswith(CRYOSTAT)])
+def test_cryostat_skips_the_next_seat(card_name):
+    game, _, _, seat = play_special(card_name)
+    assert seat == 2 and not game.skip_next
+
+
+@pytest.mark.parametrize("card_name", [name for name in SPECIAL_CARDS if name.endswith(SUPERFLUID)])
+def test_superfluid_gives_another_turn(card_name):
+    game, _, _, seat = play_special(card_name)
+    assert seat == 0 and not game.extra_turn
+    assert game.players.index(game.advance_turn()) == 1
+
+
+@pytest.mark.parametrize("card_name", [name for name in SPECIAL_CARDS if name.endswith(SPIN)])
+def test_spin_reverses_the_direction(card_name):
+    game, _, _, seat = play_special(card_name)
+    assert seat == 3 and game.direction == -1
+    assert game.players.index(game.advance_turn()) == 2
+
+
+@pytest.mark.parametrize("card_name", [name for name in SPECIAL_CARDS if name.endswith(ENTANGLEMENT)])
+def test_entanglement_makes_the_next_seat_draw(card_name):
+    game, hands, pile, seat = play_special(card_name)
+    assert seat == 1
+    assert len(game.players[1].hand) == len(hands[1]) + ENTANGLEMENT_DRAWS
+    assert len(game.shuffled_deck) == pile - ENTANGLEMENT_DRAWS
+
+
+@pytest.mark.parametrize("card_name", [name for name in SPECIAL_CARDS if name.endswith(TELEPORTATION)])
+def test_teleportation_swaps_hands_with_the_next_seat(card_name):
+    game, hands, _, seat = play_special(card_name)
+    assert seat == 1
+    assert game.players[0].hand == hands[1]
+    assert game.players[1].hand == ["T_1"]
+    assert game.players[2].hand == hands[2]
+
+
+@pytest.mark.parametrize("card_name", SPECIAL_CARDS)
+def test_winning_play_has_no_effect(card_name):
+    game = new_game(1, players=4)
+    game.players[0].set_hand([card_name])
+    hands = [list(player.hand) for player in game.players[1:]]
+    assert game.play_card(card_name, game.players[0])
+    assert (game.direction, game.skip_next, game.extra_turn) == (1, False, False)
+    assert [player.hand for player in game.players[1:]] == hands
@@ -0,0 +1,35 @@
+"""Headless engine: the card-id loop must play exactly the games of the Game loop."""
+import pytest
+
+from GUI_game.Classes.Card import CARD_NAMES
+from GUI_game.Classes.Engine import ID_POLICIES, first_playable_policy, play_game, random_policy
+
+
+def through_game(policy):
+    """The same policy, but not one _play_ids knows, so play_game uses Game."""
+    return lambda game, player, playable, rng: policy(game, player, playable, rng)
+
+
+SETUPS = [
+    ([random_policy] * 3, {}),
+    ([first_playable_policy] * 3, {}),
+    ([random_policy, first_playable_policy], {"cards_per_player": 3}),
+    ([random_policy] * 4, {"max_turns": 25}),
+    ([random_policy] * 4, {"deck": list(CARD_NAMES) * 2}),
+]
+
+
+@pytest.mark.parametrize("policies, kwargs", SETUPS)
+def test_card_id_loop_matches_game_loop(policies, kwargs):
+    assert all(policy in ID_POLICIES for policy in policies)
+    slow = [through_game(policy) for policy in policies]
+    for seed in range(150):
+        assert play_game(policies, seed=seed, **kwargs) == play_game(slow, seed=seed, **kwargs)
+
+
+def test_results_add_up():
+    for seed in range(50):
+        result = play_game([random_policy] * 3, seed=seed)
+        assert result.winner in range(3)
+        assert result.hand_sizes[result.winner] == 0
+        assert sum(result.suit_plays) + result.special_plays[-1] >= 1
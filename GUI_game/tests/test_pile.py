@@ -0,0 +1,60 @@
+"""Discard_pile, the fixed-capacity face-up pile of Game."""
+import random
+
+import pytest
+
+from GUI_game.Classes.Card import CARD_ID
+from GUI_game.Classes.Game import Game
+from GUI_game.Classes.Pile import Discard_pile
+
+from helpers import new_game, random_move
+
+
+def test_discard_pile_take_and_put_below_top():
+    pile = Discard_pile(5, ["C_1", "R_2", "T_3"])
+    assert (len(pile), pile.top(), pile[0], pile[-1]) == (3, "T_3", "C_1", "T_3")
+    assert pile.top_id() == Discard_pile(1, ["T_3"]).top_id()
+
+    below = pile.take_below_top()
+    assert below == ["C_1", "R_2"]
+    assert list(pile) == ["T_3"]
+    assert pile.take_below_top() == []
+
+    pile.put_below_top(below)
+    assert list(pile) == ["C_1", "R_2", "T_3"]
+    assert pile.pop() == "T_3"
+    assert pile.top() == "R_2"
+
+    copy = pile.copy()
+    pile.push("X_4")
+    assert list(copy) == ["C_1", "R_2"]
+    with pytest.raises(IndexError):
+        Discard_pile(1, ["C_1"]).push("C_2")
+    with pytest.raises(IndexError):
+        Discard_pile(2).pop()
+    with pytest.raises(IndexError):
+        pile[3]
+
+
+def test_table_card_can_be_turned_up_before_dealing():
+    game = Game(rng=random.Random(1), verbose=False)
+    game.init_and_shuffle_deck()
+    game.ensure_numeric_table_start()
+    assert game.top_card() is not None
+    assert game.table_cards.capacity == len(game.deck)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_pile_follows_plays_reshuffles_and_rollback(seed):
+    rng = random.Random(seed)
+    game = new_game(seed)
+    start = list(game.table_cards)
+    mark = game.checkpoint()
+    for _ in range(200):
+        top = game.table_cards.top()
+        assert game.top_id() == (None if top is None else CARD_ID[top])
+        assert len(game.table_cards) <= game.table_cards.capacity
+        if random_move(game, rng):
+            break
+    game.rollback(mark)
+    assert list(game.table_cards) == start
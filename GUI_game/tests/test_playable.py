@@ -0,0 +1,48 @@
+"""Batched playable masks against the one-hand Create_binary_code."""
+import random
+
+import numpy as np
+import pytest
+
+from GUI_game.Classes.Card import CARD_NAMES, Create_binary_code
+from GUI_game.Classes.Playable import (PAD, encode_cards, encode_hands, playable_counts,
+                                       playable_masks)
+
+
+def test_masks_match_create_binary_code():
+    rng = random.Random(4)
+    hands = [[rng.choice(CARD_NAMES) for _ in range(rng.randrange(0, 12))] for _ in range(300)]
+    tables = [rng.choice(CARD_NAMES) for _ in hands]
+    masks = playable_masks(encode_hands(hands), encode_cards(tables))
+    assert masks.shape == (300, max(len(hand) for hand in hands))
+    for hand, table, mask in zip(hands, tables, masks):
+        expected = Create_binary_code(table, hand).binarycode
+        assert mask[:len(hand)].tolist() == [bool(ok) for ok in expected]
+        assert not mask[len(hand):].any()  # padding never fits
+    counts = playable_counts(encode_hands(hands), encode_cards(tables))
+    assert counts.tolist() == [sum(Create_binary_code(t, h).binarycode) for h, t in zip(hands, tables)]
+
+
+def test_one_table_card_for_every_hand_and_extra_axes():
+    hands = encode_hands([["T_2", "C_3", "super"], ["X_4"]])
+    assert playable_masks(hands, encode_cards(["T_4"])[0]).tolist() == [[True, False, True],
+                                                                        [True, False, False]]
+    stacked = np.stack([hands, hands])
+    tables = encode_cards(["T_4", "R_1", "R_1", "T_4"]).reshape(2, 2)
+    assert playable_masks(stacked, tables).shape == (2, 2, 3)
+
+
+def test_empty_batches():
+    assert playable_masks(encode_hands([]), encode_cards([])).shape == (0, 0)
+    assert encode_hands([[], []]).shape == (2, 0)
+    assert playable_masks(encode_hands([[], []]), encode_cards(["T_1", "C_2"])).shape == (2, 0)
+    assert playable_counts(encode_hands([]), encode_cards([])).tolist() == []
+
+
+def test_bad_input():
+    with pytest.raises(ValueError):
+        encode_hands([["T_1", "T_2"]], width=1)
+    with pytest.raises(ValueError):
+        playable_masks(np.array([[PAD + 1]]), encode_cards(["T_1"]))
+    with pytest.raises(ValueError):
+        playable_masks(np.array([[-1]]), encode_cards(["T_1"]))
@@ -0,0 +1,74 @@
+"""Incremental hand state of Player: counts, the hand view and the playable caches."""
+import random
+from collections import Counter
+
+import pytest
+
+from GUI_game.Classes.Card import CARD_ID, CARD_NAMES, CARD_PARTS, Create_binary_code
+from GUI_game.Classes.Player import Player
+
+from helpers import new_game, random_move
+
+
+def assert_consistent(player, top_id):
+    suits = Counter(CARD_PARTS[CARD_ID[card]][0] for card in player.hand)
+    faces = Counter(CARD_PARTS[CARD_ID[card]][1] for card in player.hand)
+    assert {suit: n for suit, n in player.suit_counts.items() if n} == dict(suits)
+    assert {face: n for face, n in player.rank_counts.items() if n} == dict(faces)
+    assert player.get_hand() == tuple(player.hand)
+    top = None if top_id is None else CARD_NAMES[top_id]
+    mask = Create_binary_code(top, player.hand).binarycode
+    assert player.playable_mask(top_id) == mask
+    assert player.playable(top_id) == [card for card, ok in zip(player.hand, mask) if ok]
+    assert player.can_play(top_id) == any(mask)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_counts_and_caches_follow_every_move(seed):
+    rng = random.Random(seed)
+    game = new_game(seed)
+    for _ in range(150):
+        won = random_move(game, rng)
+        for player in game.players:
+            assert_consistent(player, game.top_id())
+        if won:
+            break
+
+
+def test_copy_starts_with_a_fresh_view():
+    player = Player(1)
+    player.add("C_1")
+    player.add("T_2")
+    assert player.get_hand() == ("C_1", "T_2")
+    other = player.copy()
+    assert other.get_hand() == ("C_1", "T_2")
+    other.remove_at(0)
+    assert other.get_hand() == ("T_2",)
+    assert player.get_hand() == ("C_1", "T_2")
+    assert_consistent(other, CARD_ID["T_3"])
+    assert_consistent(player, CARD_ID["T_3"])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_cloned_game_shows_every_hand(seed):
+    rng = random.Random(seed)
+    game = new_game(seed)
+    for _ in range(rng.randrange(1, 30)):
+        for player in game.players:
+            player.get_hand()  # fill the views of the original
+        if random_move(game, rng):
+            break
+    clone = game.clone()
+    for player in clone.players:
+        assert player.get_hand() == tuple(player.hand)
+        assert_consistent(player, clone.top_id())
+
+
+def test_subscribers_are_called_once_per_change():
+    player = Player(1)
+    seen = []
+    player.subscribe(lambda changed: seen.append(tuple(changed.hand)))
+    player.add("C_1")
+    player.set_hand(["R_2", "X_3"])
+    player.pop()
+    assert seen == [("C_1",), ("R_2", "X_3"), ("R_2",)]
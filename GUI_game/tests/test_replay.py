@@ -0,0 +1,74 @@
+"""Binary game log: replaying logged games and reading damaged logs."""
+import io
+
+import pytest
+
+from GUI_game.Classes.Engine import first_playable_policy, play_game, random_policy
+from GUI_game.Classes.Replay import END, MAGIC, Game_log, Replay_error, iter_events, read_games, replay_game
+
+
+POLICIES = [random_policy, first_playable_policy, random_policy]
+
+
+def test_replay_reproduces_logged_games():
+    stream = io.BytesIO()
+    log = Game_log(stream)
+    results = [play_game(POLICIES, seed=seed, log=log) for seed in range(60)]
+    log.close()
+
+    games = []
+    events = []
+    for event in iter_events(stream.getvalue()):
+        events.append(event)
+        if event[0] == END:
+            games.append(events)
+            events = []
+    assert len(games) == len(results)
+    for result, events in zip(results, games):
+        game = replay_game(events)
+        assert game.replay_seed == result.seed
+        assert game.replay_winner == result.winner
+        assert tuple(len(player.hand) for player in game.players) == result.hand_sizes
+        # games without a log take the card-id loop; it must play the same game
+        assert play_game(POLICIES, seed=result.seed) == result
+
+
+def test_log_used_as_context_manager_is_written_out(tmp_path):
+    path = tmp_path / "games.qlog"
+    with open(path, "ab") as f, Game_log(f) as log:
+        result = play_game(POLICIES, seed=7, log=log)
+    games = list(read_games(path))
+    assert len(games) == 1
+    assert replay_game(games[0]).replay_winner == result.winner
+
+
+def test_truncated_log_raises_replay_error():
+    stream = io.BytesIO()
+    with Game_log(stream) as log:
+        for seed in range(3):
+            play_game(POLICIES, seed=seed, log=log)
+    data = stream.getvalue()
+    complete = len(list(iter_events(data)))
+    cut_inside = 0
+    for cut in range(len(MAGIC), len(data)):
+        try:
+            events = list(iter_events(data[:cut]))
+        except Replay_error:
+            cut_inside += 1
+        else:
+            assert len(events) < complete  # the cut fell between two events
+    assert cut_inside > len(data) // 2
+
+
+def test_every_cut_inside_an_event_is_reported():
+    stream = io.BytesIO()
+    with Game_log(stream) as log:
+        play_game(POLICIES, seed=1, log=log)
+    data = stream.getvalue()
+    # the deal event holds the whole draw pile, so cuts just after it fall inside it
+    with pytest.raises(Replay_error, match="deal"):
+        list(iter_events(data[:len(MAGIC) + 12]))
+    with pytest.raises(Replay_error, match="end"):
+        list(iter_events(data[:-1]))
+    with pytest.raises(Replay_error, match="unknown event"):
+        list(iter_events(data + b"\xff"))
@@ -0,0 +1,67 @@
+"""Results_writer and Results_reader: round trip, resuming and damaged files."""
+import numpy as np
+import pytest
+
+from GUI_game.Classes.Batch import SUMMARY_FIELDS, run_batch, summarize
+from GUI_game.Classes.Engine import random_policy, run_games
+from GUI_game.Classes.Results import RECORD_DTYPE, Results_reader, Results_writer
+
+
+POLICIES = [random_policy] * 3
+
+
+def rows_of(reader):
+    return [[int(record[name]) for name in SUMMARY_FIELDS] for record in reader.records]
+
+
+def test_round_trip_through_add_and_add_rows(tmp_path):
+    path = str(tmp_path / "run.bin")
+    results = list(run_games(POLICIES, n=50, seed=1))
+    with Results_writer(path, chunk_rows=16) as out:
+        for result in results:
+            out.add(result)
+        stats = run_batch(POLICIES, 70, seed=51, workers=1, chunk_size=30, on_rows=out.add_rows)
+    reader = Results_reader(path)
+    assert len(reader) == 120
+    expected = [summarize(result) for result in results]
+    expected += [summarize(result) for result in run_games(POLICIES, n=70, seed=51)]
+    assert rows_of(reader) == expected
+    winners = [row[1] for row in expected]
+    assert reader.win_counts(3) == [winners.count(seat) for seat in (0, 1, 2, -1)]
+    assert stats.games == 70
+    assert reader.column_sum("turns") == sum(row[2] for row in expected)
+
+
+def test_resume_appends_after_the_sidecar_rows(tmp_path):
+    path = str(tmp_path / "run.bin")
+    with Results_writer(path) as out:
+        for result in run_games(POLICIES, n=10):
+            out.add(result)
+    with open(path, "ab") as f:
+        f.write(b"\0" * (3 * RECORD_DTYPE.itemsize + 5))  # rows the sidecar never counted
+    with Results_writer(path) as out:
+        for result in run_games(POLICIES, n=5, seed=10):
+            out.add(result)
+    reader = Results_reader(path)
+    assert rows_of(reader) == [summarize(result) for result in run_games(POLICIES, n=15)]
+    assert len(reader.records.tobytes()) == 15 * RECORD_DTYPE.itemsize
+
+
+def test_resume_refuses_a_short_or_missing_data_file(tmp_path):
+    path = str(tmp_path / "run.bin")
+    with Results_writer(path) as out:
+        for result in run_games(POLICIES, n=10):
+            out.add(result)
+    with open(path, "r+b") as f:
+        f.truncate(4 * RECORD_DTYPE.itemsize)
+    with pytest.raises(ValueError, match="shorter"):
+        Results_writer(path)
+    assert np.fromfile(path, dtype=RECORD_DTYPE).size == 4  # left as it was
+    (tmp_path / "run.bin").unlink()
+    with pytest.raises(ValueError, match="missing"):
+        Results_writer(path)
+    with open(path, "wb") as f:
+        f.write(b"\1" * RECORD_DTYPE.itemsize)
+    (tmp_path / "run.bin.json").unlink()
+    with pytest.raises(ValueError, match="no"):
+        Results_writer(path)
@@ -0,0 +1,83 @@
+"""Game server: a game over TCP, malformed messages and slow clients."""
+import asyncio
+
+from GUI_game.Classes.Server import Client, Connection, Game_server, encode
+
+
+async def _play_server_game():
+    server = await Game_server(seed=3).start()
+    clients = [await Client(f"p{seat}").connect(port=server.port) for seat in range(3)]
+    for client in clients:
+        await client.join()
+    bad = clients[0]
+    bad.writer.write(b"[1]\n" + b"{not json\n" + b'{"op": "fly"}\n' + b"x" * 100000 + b"\n")
+    await bad.writer.drain()
+
+    async def play(client):
+        while client.winner is None:
+            message = await client.receive()
+            if message is None:
+                return
+            if message["ev"] == "turn" and client.my_turn():
+                if client.playable:
+                    await client.play(client.playable[0])
+                else:
+                    await client.draw()
+
+    await asyncio.wait_for(asyncio.gather(*(play(client) for client in clients)), 30)
+    stats = server.stats()
+    for client in clients:
+        await client.close()
+    await server.close()
+    return clients, stats
+
+
+def test_server_plays_a_game_through_malformed_messages():
+    clients, stats = asyncio.run(_play_server_game())
+    winners = {client.winner for client in clients}
+    assert len(winners) == 1 and winners.pop() in range(3)
+    assert stats["games_finished"] == 1
+    errors = clients[0].errors
+    assert "a message must be a JSON object" in errors
+    assert "bad json" in errors
+    assert "unknown op 'fly'" in errors
+    assert "line too long" in errors
+    assert not clients[1].errors and not clients[2].errors
+
+
+class _Transport:
+    def __init__(self):
+        self.buffered = 0
+        self.aborted = False
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+    def abort(self):
+        self.aborted = True
+
+
+class _Stalled_writer:
+    """A writer whose peer never reads: everything written stays buffered."""
+
+    def __init__(self):
+        self.transport = _Transport()
+
+    def is_closing(self):
+        return self.transport.aborted
+
+    def write(self, data):
+        self.transport.buffered += len(data)
+
+
+def test_client_that_stops_reading_is_disconnected():
+    writer = _Stalled_writer()
+    client = Connection(writer, max_buffer=1000)
+    message = {"ev": "turn", "seat": 1}
+    sent = 0
+    while not writer.transport.aborted:
+        client.send_many([message] * 5)
+        sent += 1
+    assert sent == 1000 // (5 * len(encode(message))) + 1
+    client.send(message)  # nothing more is written to an aborted connection
+    assert writer.transport.buffered == sent * 5 * len(encode(message))
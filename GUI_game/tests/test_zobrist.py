@@ -0,0 +1,64 @@
+"""Zobrist hashing of games and the transposition table."""
+import random
+
+import pytest
+
+from GUI_game.Classes.Zobrist import Transposition_table
+
+from helpers import new_game, random_move
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_hash_matches_fresh_hash(seed):
+    rng = random.Random(seed)
+    game = new_game(seed)
+    game.enable_hashing()
+    for _ in range(150):
+        won = random_move(game, rng)
+        assert game.clone().hasher.value == game.hasher.value
+        if won:
+            break
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_rollback_restores_the_hash(seed):
+    rng = random.Random(seed)
+    game = new_game(seed)
+    game.enable_hashing()
+    before = game.hasher.value
+    mark = game.checkpoint()
+    for _ in range(40):
+        if random_move(game, rng):
+            break
+    game.rollback(mark)
+    assert game.hasher.value == before == game.clone().hasher.value
+
+
+def test_depth_policy_keeps_the_deeper_entry():
+    table = Transposition_table(4, policy="depth")
+    assert table.put(1, 5, "deep")
+    assert not table.put(5, 2, "shallow")  # same slot, less work
+    assert table.get(1) == (5, "deep")
+    assert table.get(5) is None
+    assert table.put(5, 5, "newer")  # ties go to the newer entry
+    assert table.get(1) is None
+    always = Transposition_table(4, policy="always")
+    always.put(1, 5, "deep")
+    always.put(5, 2, "shallow")
+    assert always.get(5) == (2, "shallow")
+    stats = table.stats()
+    assert (stats["used"], stats["rejections"], stats["replacements"]) == (1, 1, 1)
+
+
+def test_add_sums_into_the_entry():
+    table = Transposition_table(8)
+    table.add(3, 1, (1.0, 0.0))
+    table.add(3, 2, (0.5, 1.0))
+    assert table.get(3) == (3, (1.5, 1.0))
+    assert not table.add(11, 1, (0.0, 0.0))  # another position, less work: kept out
+    assert table.add(11, 4, (2.0, 2.0))
+    assert table.get(11) == (4, (2.0, 2.0))
+    with pytest.raises(ValueError):
+        Transposition_table(0)
+    with pytest.raises(ValueError):
+        Transposition_table(8, policy="lru")